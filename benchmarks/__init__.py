@@ -0,0 +1 @@
+"""Offline benchmarks for iris-mcp, driven against a local stub Iris server."""
@@ -0,0 +1,72 @@
+"""Micro-benchmark: reflective `_lookup_field` vs compiled per-shape row readers.
+
+Usage::
+
+    uv run python -m benchmarks.bench_field_access --rows 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any
+
+import iris_mcp
+
+EVENT_FIELDS: list[tuple[str, ...]] = [
+    ("event_id", "id"),
+    ("event_title", "event_name", "name", "title"),
+    ("event_content", "event_description", "description", "content"),
+    ("category_name", "event_category", "category", "event_category_name", "event_category_id"),
+    ("tlp", "tlp_name", "color", "event_color"),
+    ("event_date", "event_date_wtz", "date_time", "datetime", "event_datetime", "time", "timestamp"),
+    ("event_tz", "timezone", "timezone_string"),
+]
+
+
+def synthetic_events(rows: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "event_id": i,
+            "event_title": f"Event {i}",
+            "event_content": "Beaconing observed",
+            "event_date": "2025-12-02T08:20:00.000000",
+            "event_tz": "+00:00",
+            "category_name": "Command and Control",
+            "event_color": "#ff0000",
+            "event_in_summary": False,
+        }
+        for i in range(rows)
+    ]
+
+
+def _reflective(items: list[dict[str, Any]]) -> list[list[Any]]:
+    return [[iris_mcp._lookup_field(row, *names) for names in EVENT_FIELDS] for row in items]
+
+
+def _compiled(items: list[dict[str, Any]]) -> list[list[Any]]:
+    out = []
+    for row in items:
+        get = iris_mcp._row_reader("events", row)
+        out.append([get(*names) for names in EVENT_FIELDS])
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    items = synthetic_events(args.rows)
+    results = {}
+    for label, fn in (("reflective", _reflective), ("compiled", _compiled)):
+        start = time.perf_counter()
+        results[label] = fn(items)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<10} {elapsed:7.3f}s  {args.rows / elapsed:>12,.0f} rows/s")
+    if results["reflective"] != results["compiled"]:
+        raise SystemExit("compiled readers disagree with the reflective lookup")
+
+
+if __name__ == "__main__":
+    main()
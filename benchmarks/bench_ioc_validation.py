@@ -0,0 +1,80 @@
+"""Micro-benchmark: per-value ``re.fullmatch`` vs the compiled IOC validation engine,
+plus IOC type detection throughput over the same values.
+
+Usage::
+
+    uv run python -m benchmarks.bench_ioc_validation --values 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+
+import iris_mcp
+from types_catalog import IOC_VALIDATIONS
+
+TYPES = ["md5", "sha1", "sha256", "filename|sha256", "tlsh", "domain"]
+
+
+def synthetic_rows(count: int, invalid_ratio: float, seed: int = 7) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    lengths = {"md5": 32, "sha1": 40, "sha256": 64, "filename|sha256": 64, "tlsh": 70}
+    rows = []
+    for i in range(count):
+        ioc_type = TYPES[i % len(TYPES)]
+        digest = f"{rng.getrandbits(512):0128x}"[: lengths.get(ioc_type, 32)]
+        value = {"filename|sha256": f"sample{i}.exe|{digest}", "tlsh": f"t1{digest}", "domain": f"host{i}.example.com"}.get(ioc_type, digest)
+        if rng.random() < invalid_ratio:
+            value = value[:-1] + "z"
+        rows.append((ioc_type, value))
+    return rows
+
+
+def _naive(rows: list[tuple[str, str]]) -> list[str | None]:
+    out: list[str | None] = []
+    for ioc_type, value in rows:
+        spec = IOC_VALIDATIONS.get(ioc_type, {})
+        regex = spec.get("validation_regex")
+        ok = regex is None or re.fullmatch(regex, value, re.IGNORECASE) is not None
+        out.append(None if ok else f"invalid {ioc_type} value (expected {spec.get('validation_expectation') or regex})")
+    return out
+
+
+def _single(rows: list[tuple[str, str]]) -> list[str | None]:
+    check = iris_mcp._IOC_VALIDATOR.check
+    return [check(ioc_type, value) for ioc_type, value in rows]
+
+
+def _batch(rows: list[tuple[str, str]]) -> list[str | None]:
+    return iris_mcp._IOC_VALIDATOR.check_batch(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--values", type=int, default=100_000)
+    parser.add_argument("--invalid-ratio", type=float, default=0.05)
+    args = parser.parse_args()
+
+    rows = synthetic_rows(args.values, args.invalid_ratio)
+    results = {}
+    for label, fn in (("naive", _naive), ("single", _single), ("batch", _batch)):
+        start = time.perf_counter()
+        results[label] = fn(rows)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<7} {elapsed:7.3f}s  {args.values / elapsed:>12,.0f} values/s")
+    if not results["naive"] == results["single"] == results["batch"]:
+        raise SystemExit("validation engine disagrees with the catalog regexes")
+    print(f"{sum(p is not None for p in results['batch'])} invalid values")
+
+    values = [value for _, value in rows]
+    start = time.perf_counter()
+    detected = iris_mcp._IOC_CLASSIFIER.classify_many(values)
+    elapsed = time.perf_counter() - start
+    print(f"{'detect':<7} {elapsed:7.3f}s  {args.values / elapsed:>12,.0f} values/s  ({detected.count(None)} unrecognized)")
+
+
+if __name__ == "__main__":
+    main()
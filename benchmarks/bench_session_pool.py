@@ -0,0 +1,59 @@
+"""Compare per-call latency with and without the session pool.
+
+Usage::
+
+    uv run python -m benchmarks.bench_session_pool --calls 200 --connect-latency 0.02
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+
+import iris_mcp
+from benchmarks.stub_iris import StubIris
+
+
+def _measure(fn: Callable[[], str | dict[str, Any]], calls: int) -> list[float]:
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - start)
+        if isinstance(result, str) and result.startswith("Error"):
+            raise RuntimeError(result)
+    return samples
+
+
+def _report(label: str, samples: list[float], stub: StubIris) -> None:
+    ordered = sorted(samples)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"{label:<10} mean={statistics.mean(samples) * 1000:7.2f}ms p50={statistics.median(samples) * 1000:7.2f}ms "
+        f"p95={p95 * 1000:7.2f}ms connections={stub.connections} requests={stub.requests}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.0, help="per-request server latency (s)")
+    parser.add_argument("--connect-latency", type=float, default=0.02, help="per-connection setup latency (s)")
+    args = parser.parse_args()
+
+    pool = iris_mcp._SESSION_POOL
+    for label, pool_size in (("per-call", 0), ("pooled", 10)):
+        with StubIris(latency=args.latency, connect_latency=args.connect_latency) as stub:
+            os.environ.update({"IRIS_API_KEY": "bench", "IRIS_HOST": stub.url, "IRIS_VERIFY_SSL": "false"})
+            pool.close()
+            pool.pool_size = pool_size
+            _report(label, _measure(lambda: iris_mcp._get_case(1), args.calls), stub)
+    pool.close()
+
+
+if __name__ == "__main__":
+    main()
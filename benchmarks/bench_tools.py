@@ -0,0 +1,183 @@
+"""End-to-end tool benchmark against a stub Iris server.
+
+Calls go through the real FastMCP tool layer (in-memory client), the worker pool,
+``dfir_iris_client`` and HTTP, so the numbers include everything but the MCP transport.
+The stub runs in a child process so its memory does not count towards peak RSS.
+
+Usage::
+
+    uv run python -m benchmarks.bench_tools --scenario all --iterations 20 --concurrency 8
+    uv run python -m benchmarks.bench_tools --scenario read --latency 0.02 --json results.json
+    uv run python -m benchmarks.bench_tools --scenario read --baseline results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+from fastmcp import Client
+
+import iris_mcp
+from benchmarks.scenarios import SCENARIOS, UNSCRIPTED, Call
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples`` (which must be non-empty)."""
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def peak_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def start_stub(args: argparse.Namespace) -> tuple[subprocess.Popen[str], str]:
+    cmd = [
+        sys.executable,
+        "-m",
+        "benchmarks.stub_iris",
+        f"--rows={args.rows}",
+        f"--payload-bytes={args.payload_bytes}",
+        f"--latency={args.latency}",
+        f"--jitter={args.jitter}",
+        f"--connect-latency={args.connect_latency}",
+        f"--error-rate={args.error_rate}",
+    ]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    assert proc.stdout is not None
+    return proc, proc.stdout.readline().strip()
+
+
+async def run(calls: list[Call], concurrency: int) -> tuple[dict[str, list[float]], dict[str, list[str]], float]:
+    samples: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, list[str]] = defaultdict(list)
+    gate = asyncio.Semaphore(concurrency)
+
+    async with Client(iris_mcp.mcp) as client:
+
+        async def one(name: str, arguments: dict[str, Any]) -> None:
+            async with gate:
+                start = time.perf_counter()
+                try:
+                    result = await client.call_tool(name, arguments, raise_on_error=False)
+                    text = "".join(getattr(block, "text", "") for block in result.content)
+                    failed = result.is_error or text.startswith("Error")
+                except Exception as e:
+                    text, failed = str(e), True
+                samples[name].append(time.perf_counter() - start)
+                if failed:
+                    errors[name].append(text[:200])
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(name, arguments) for name, arguments in calls))
+        elapsed = time.perf_counter() - started
+    return samples, errors, elapsed
+
+
+def summarize(samples: dict[str, list[float]], errors: dict[str, list[str]], elapsed: float) -> dict[str, Any]:
+    everything = [s for values in samples.values() for s in values]
+    tools = {
+        name: {
+            "calls": len(values),
+            "errors": len(errors.get(name, [])),
+            "p50_ms": percentile(values, 50) * 1000,
+            "p95_ms": percentile(values, 95) * 1000,
+            "p99_ms": percentile(values, 99) * 1000,
+        }
+        for name, values in sorted(samples.items())
+    }
+    return {
+        "calls": len(everything),
+        "errors": sum(len(v) for v in errors.values()),
+        "elapsed_s": elapsed,
+        "rps": len(everything) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(everything, 50) * 1000,
+        "p95_ms": percentile(everything, 95) * 1000,
+        "p99_ms": percentile(everything, 99) * 1000,
+        "peak_rss_mb": peak_rss_mb(),
+        "tools": tools,
+    }
+
+
+def _delta(current: float, baseline: float | None) -> str:
+    if not baseline:
+        return ""
+    return f" ({(current - baseline) / baseline * 100:+.0f}%)"
+
+
+def report(summary: dict[str, Any], baseline: dict[str, Any] | None = None) -> None:
+    base_tools = (baseline or {}).get("tools", {})
+    print(f"{'tool':<32}{'calls':>6}{'err':>5}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, row in summary["tools"].items():
+        print(
+            f"{name:<32}{row['calls']:>6}{row['errors']:>5}{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}{row['p99_ms']:>10.2f}"
+            f"{_delta(row['p95_ms'], base_tools.get(name, {}).get('p95_ms'))}"
+        )
+    base = baseline or {}
+    print(
+        f"\n{summary['calls']} calls, {summary['errors']} errors in {summary['elapsed_s']:.2f}s: "
+        f"{summary['rps']:.1f} req/s{_delta(summary['rps'], base.get('rps'))}, "
+        f"p50={summary['p50_ms']:.2f}ms p95={summary['p95_ms']:.2f}ms{_delta(summary['p95_ms'], base.get('p95_ms'))} "
+        f"p99={summary['p99_ms']:.2f}ms, peak RSS {summary['peak_rss_mb']:.1f} MiB{_delta(summary['peak_rss_mb'], base.get('peak_rss_mb'))}"
+    )
+
+
+async def uncovered_tools(calls: list[Call]) -> list[str]:
+    return sorted(set(await iris_mcp.mcp.get_tools()) - {name for name, _ in calls} - UNSCRIPTED)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="all")
+    parser.add_argument("--iterations", type=int, default=10, help="times the scenario script is replayed")
+    parser.add_argument("--concurrency", type=int, default=1, help="tool calls in flight at once")
+    parser.add_argument("--rows", type=int, default=50, help="rows per collection served by the stub")
+    parser.add_argument("--payload-bytes", type=int, default=0, help="padding per row served by the stub")
+    parser.add_argument("--latency", type=float, default=0.0, help="stub per-request latency (s)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="stub extra random latency (s)")
+    parser.add_argument("--connect-latency", type=float, default=0.0, help="stub per-connection latency (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of stub requests answered with HTTP 503")
+    parser.add_argument("--stub-url", help="use an already running stub instead of starting one")
+    parser.add_argument("--json", type=Path, help="write the summary to this file")
+    parser.add_argument("--baseline", type=Path, help="compare against a summary written by --json")
+    args = parser.parse_args()
+
+    proc = None
+    url = args.stub_url
+    if not url:
+        proc, url = start_stub(args)
+    os.environ.update({"IRIS_API_KEY": "bench", "IRIS_HOST": url, "IRIS_VERIFY_SSL": "false"})
+    try:
+        calls = SCENARIOS[args.scenario] * args.iterations
+        samples, errors, elapsed = asyncio.run(run(calls, args.concurrency))
+        summary = summarize(samples, errors, elapsed)
+        summary["config"] = {k: v for k, v in vars(args).items() if k not in ("json", "baseline")}
+        baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+        report(summary, baseline)
+        for name, messages in sorted(errors.items()):
+            print(f"! {name}: {messages[0]}")
+        if args.scenario == "all" and (missing := asyncio.run(uncovered_tools(calls))):
+            print(f"! tools not covered by the scenario: {', '.join(missing)}")
+        if args.json:
+            args.json.write_text(json.dumps(summary, indent=2))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Tool-call scripts replayed by ``benchmarks.bench_tools``.
+
+Each scenario is a list of ``(tool_name, arguments)`` pairs executed in order (and
+concurrently, when the runner is given ``--concurrency``). IDs refer to objects the
+stub server synthesizes, so every call is expected to succeed.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+Call = tuple[str, dict[str, Any]]
+
+CASE = {"case_id": 1}
+
+CATALOG: list[Call] = [
+    ("list_types", {"kind": "iocs"}),
+    ("list_ioc_types", {}),
+    ("list_asset_types", {}),
+    ("list_analysis_statuses", {}),
+    ("list_alert_resolution_statuses", {}),
+    ("list_alert_statuses", {}),
+    ("list_task_statuses", {}),
+    ("list_severities", {}),
+    ("list_evidence_types", {}),
+    ("list_event_categories", {}),
+    ("list_os_types", {}),
+    ("list_tlp_levels", {}),
+    ("cache_stats", {}),
+    ("server_stats", {}),
+    ("server_status", {}),
+]
+
+READ: list[Call] = [
+    ("list_cases", {}),
+    ("list_cases", {"limit": 10}),
+    ("get_case", CASE),
+    ("get_case", {**CASE, "output": "json"}),
+    ("get_case_overview", CASE),
+    ("list_customers", {}),
+    ("get_customer_by_id", {"customer_id": 1}),
+    ("lookup_customer", {"customer_name": "ACME"}),
+    ("list_iocs", CASE),
+    ("list_iocs", {**CASE, "output": "json"}),
+    ("list_iocs", {**CASE, "filter_text": "host1"}),
+    ("list_assets", CASE),
+    ("list_events", CASE),
+    ("list_evidence", CASE),
+    ("list_tasks", CASE),
+    ("list_notes", CASE),
+    ("list_note_directories", CASE),
+    ("get_note", {**CASE, "note_id": 1}),
+    ("search_notes", {**CASE, "search_term": "Findings"}),
+    ("search_notes_fulltext", {**CASE, "query": "findings note 7"}),
+    ("list_note_comments", {**CASE, "note_id": 1}),
+    ("list_task_comments", {**CASE, "task_id": 1}),
+    ("search_ioc_global", {"values": "host1.example.com\nhost2.example.com\nnever.seen"}),
+    ("detect_ioc_types", {"values": "198.51.100.7\nevil.example\nd41d8cd98f00b204e9800998ecf8427e"}),
+    ("list_events", {**CASE, "max_bytes": 2048}),
+    ("changes_since", {**CASE, "since": "2025-01-01T00:00:00"}),
+]
+
+WRITE: list[Call] = [
+    ("add_ioc", {**CASE, "value": "198.51.100.7", "ioc_type": "ip-dst", "ioc_tlp": "amber"}),
+    ("add_iocs_bulk", {**CASE, "indicators": "203.0.113.5,ip-dst\nevil.example,domain\nd41d8cd98f00b204e9800998ecf8427e,md5"}),
+    ("add_asset", {**CASE, "name": "WKS-BENCH", "asset_type": "Account", "analysis_status": "Started"}),
+    ("add_event", {**CASE, "name": "Beacon", "date_time": "2025-12-02T08:20:00", "category": "Execution"}),
+    ("update_event", {"event_id": 1, **CASE, "fields": {"title": "Beacon (confirmed)"}}),
+    ("delete_event", {"event_id": 1, **CASE}),
+    ("import_timeline", {**CASE, "content": "date_time,title\n2025-12-02T08:00:00,Logon\n2025-12-02T08:05:00,Download\n"}),
+    ("add_evidence", {**CASE, "filename": "memory.raw", "file_size": 4096}),
+    ("update_evidence", {"evidence_id": 1, **CASE, "fields": {"description": "triaged"}}),
+    ("delete_evidence", {"evidence_id": 1, **CASE}),
+    ("add_task", {**CASE, "title": "Image host", "status": "To do", "assignees": ["analyst"]}),
+    ("update_task", {**CASE, "task_id": 1, "fields": {"title": "Image host (done)"}}),
+    ("delete_task", {**CASE, "task_id": 1}),
+    ("add_task_comment", {**CASE, "task_id": 1, "comment": "started"}),
+    ("update_task_comment", {**CASE, "task_id": 1, "comment_id": 1, "comment": "edited"}),
+    ("delete_task_comment", {**CASE, "task_id": 1, "comment_id": 1}),
+    ("add_note", {**CASE, "content": "Findings", "title": "Bench note"}),
+    ("update_note", {**CASE, "note_id": 1, "fields": {"note_content": "Updated"}}),
+    ("delete_note", {**CASE, "note_id": 1}),
+    ("add_note_comment", {**CASE, "note_id": 1, "comment": "LGTM"}),
+    ("create_note_directory", {**CASE, "name": "Bench"}),
+    ("add_iocs_bulk", {**CASE, "indicators": "203.0.113.6\nstage2.evil.example\nhttps://stage2.evil.example/p.bin"}),
+    ("add_ioc", {**CASE, "value": "host1.example.com", "ioc_type": "domain"}),
+]
+
+ADMIN: list[Call] = [
+    ("create_case", {"name": "Bench case", "customer_id": 1, "soc_id": "BENCH-1"}),
+    ("create_customer", {"name": "Bench customer"}),
+    ("create_alert", {"title": "Bench alert", "description": "synthetic", "source": "bench", "source_ref": "1"}),
+    ("debug_case_methods", {**CASE, "filter_text": "ioc"}),
+]
+
+# Tools whose arguments come from an earlier response (e.g. a read_more handle).
+UNSCRIPTED = frozenset({"read_more"})
+
+SCENARIOS: dict[str, list[Call]] = {
+    "catalog": CATALOG,
+    "read": READ,
+    "write": WRITE,
+    # Roughly the read/write mix of an analyst-driven session.
+    "mixed": READ + WRITE[:4] + READ[8:15] + WRITE[16:17],
+    "all": CATALOG + READ + WRITE + ADMIN,
+}
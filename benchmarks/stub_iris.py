@@ -0,0 +1,362 @@
+"""Minimal local stand-in for the DFIR Iris REST API.
+
+Every endpoint used by the MCP tools is answered with synthetic data in the standard
+Iris envelope (``{"status": "success", "message": "", "data": ...}``) so the real
+``dfir_iris_client`` can talk to it unchanged. Writes are acknowledged and echoed back
+with a fresh ID but not stored, so list sizes stay constant during a run.
+
+``rows`` sets the size of every listed collection and ``payload_bytes`` pads each
+row's description. ``connect_latency`` is slept once per new TCP connection to
+approximate the cost of a TLS handshake; ``latency`` (plus up to ``jitter``) is slept
+on every request, or ``route_latency[prefix]`` for paths starting with ``prefix``.
+
+Run standalone with ``python -m benchmarks.stub_iris --port 8000``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import urlsplit
+
+from types_catalog import (
+    ALERT_STATUSES,
+    ANALYSIS_STATUSES,
+    ASSET_TYPES,
+    EVENT_CATEGORIES,
+    IOC_TYPES,
+    SEVERITIES,
+    TASK_STATUSES,
+    TLP_LEVELS,
+)
+
+_STATE = {"object_state": 1, "object_last_update": "2025-12-03T16:45:15.348093"}
+
+
+def _numbered(items: list[dict[str, str]], id_key: str, name_key: str, source_key: str = "name") -> list[dict[str, Any]]:
+    return [{id_key: i, name_key: item[source_key]} for i, item in enumerate(items, start=1)]
+
+
+REFERENCE_LISTS: dict[str, list[dict[str, Any]]] = {
+    "/manage/ioc-types/list": _numbered(IOC_TYPES, "type_id", "type_name", "type"),
+    "/manage/tlp/list": _numbered(TLP_LEVELS, "tlp_id", "tlp_name"),
+    "/manage/asset-type/list": _numbered(ASSET_TYPES, "asset_id", "asset_name", "asset_name"),
+    "/manage/analysis-status/list": _numbered(ANALYSIS_STATUSES, "id", "name"),
+    "/manage/event-categories/list": _numbered(EVENT_CATEGORIES, "id", "name"),
+    "/manage/task-status/list": _numbered(TASK_STATUSES, "id", "status_name"),
+    "/manage/alert-status/list": _numbered(ALERT_STATUSES, "status_id", "status_name"),
+    "/manage/severities/list": _numbered(SEVERITIES, "severity_id", "severity_name"),
+    "/manage/compromise-status/list": [{"value": 0, "name": "To be determined"}, {"value": 1, "name": "Compromised"}],
+    "/manage/case-classifications/list": [{"id": 1, "name": "other:other"}],
+    "/manage/case-states/list": [{"state_id": 1, "state_name": "Open"}, {"state_id": 2, "state_name": "Closed"}],
+    "/manage/customers/list": [{"customer_id": 1, "customer_name": "ACME"}, {"customer_id": 2, "customer_name": "Globex"}],
+    "/manage/users/restricted/list": [{"user_id": 1, "user_login": "analyst", "user_name": "Analyst"}],
+}
+
+
+class StubIris:
+    """Threaded HTTP server answering the Iris API endpoints used by the tools."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        latency: float = 0.0,
+        connect_latency: float = 0.0,
+        rows: int = 50,
+        payload_bytes: int = 0,
+        jitter: float = 0.0,
+        route_latency: dict[str, float] | None = None,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+    ) -> None:
+        self.latency = latency
+        self.connect_latency = connect_latency
+        self.rows = rows
+        self.payload_bytes = payload_bytes
+        self.jitter = jitter
+        self.route_latency = route_latency or {}
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.connections = 0
+        self.requests = 0
+        self.errors = 0
+        self._ids = itertools.count(10_000)
+        self._lock = threading.Lock()
+        self._routes: list[tuple[str, re.Pattern[str], Callable[..., Any]]] = self._build_routes()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    # -- synthetic data -------------------------------------------------
+
+    def _pad(self, text: str) -> str:
+        return text + " " + "x" * self.payload_bytes if self.payload_bytes else text
+
+    def _case(self, i: int) -> dict[str, Any]:
+        return {
+            "case_id": i,
+            "case_name": f"#{i} - Case {i}",
+            "case_description": self._pad(f"Case {i}"),
+            "case_customer": 1 + i % 2,
+            "case_status_id": 0,
+            "case_open_date": "2025-12-01",
+        }
+
+    def _ioc(self, i: int) -> dict[str, Any]:
+        return {
+            "ioc_id": i,
+            "ioc_value": f"host{i}.example.com",
+            "ioc_type": "domain",
+            "ioc_type_id": 20,
+            "ioc_description": self._pad(""),
+            "tlp_name": "amber",
+            "ioc_tlp_id": 2,
+            "ioc_tags": "bench",
+        }
+
+    def _asset(self, i: int) -> dict[str, Any]:
+        return {
+            "asset_id": i,
+            "asset_name": f"WKS-{i:04d}",
+            "asset_type_id": 1,
+            "asset_description": self._pad(""),
+            "analysis_status_id": 1,
+            "asset_ip": f"10.0.{i // 256 % 256}.{i % 256}",
+        }
+
+    def _event(self, i: int) -> dict[str, Any]:
+        return {
+            "event_id": i,
+            "event_title": f"Event {i}",
+            "event_content": self._pad(f"Event {i} content"),
+            "event_date": f"2025-12-02T08:{i // 60 % 60:02d}:{i % 60:02d}.000000",
+            "event_tz": "+00:00",
+            "category_name": "Execution",
+            "event_color": "#1572E899",
+        }
+
+    def _evidence(self, i: int) -> dict[str, Any]:
+        return {
+            "id": i,
+            "filename": f"evidence-{i}.bin",
+            "file_size": 1024 * i,
+            "file_hash": f"{i:064x}",
+            "file_description": self._pad(""),
+            "date_added": "2025-12-02T09:00:00",
+        }
+
+    def _task(self, i: int) -> dict[str, Any]:
+        return {
+            "task_id": i,
+            "task_title": f"Task {i}",
+            "task_description": self._pad(""),
+            "task_status_id": 1,
+            "task_assignees": [{"id": 1, "user": "analyst"}],
+        }
+
+    def _note(self, i: int) -> dict[str, Any]:
+        return {"note_id": i, "note_title": f"Note {i}", "note_content": self._pad(f"Findings for note {i}"), "directory_id": 1}
+
+    def _comment(self, i: int) -> dict[str, Any]:
+        return {"comment_id": i, "comment_text": self._pad(f"Comment {i}"), "comment_date": "2025-12-02T09:00:00", "user": {"user_name": "analyst"}}
+
+    def _many(self, make: Callable[[int], dict[str, Any]]) -> list[dict[str, Any]]:
+        return [make(i) for i in range(1, self.rows + 1)]
+
+    def _echo(self, body: dict[str, Any], **ids: Any) -> dict[str, Any]:
+        new_id = next(self._ids)
+        return {**body, **{k: (new_id if v is None else v) for k, v in ids.items()}}
+
+    def _search(self, body: dict[str, Any]) -> list[dict[str, Any]]:
+        """IOC rows whose value matches ``search_value`` (SQL LIKE, ``%`` wildcard), one per case."""
+        pattern = re.compile(".*".join(map(re.escape, str(body.get("search_value", "%")).split("%"))), re.IGNORECASE)
+        iocs = (self._ioc(i) for i in range(1, self.rows + 1))
+        return [{**ioc, "case_name": f"#{ioc['ioc_id']} - Case {ioc['ioc_id']}"} for ioc in iocs if pattern.fullmatch(ioc["ioc_value"])]
+
+    def _build_routes(self) -> list[tuple[str, re.Pattern[str], Callable[..., Any]]]:
+        num = r"(\d+)"
+        table: list[tuple[str, str, Callable[..., Any]]] = [
+            ("GET", r"/api/ping|/user/is-admin", lambda b: {}),
+            ("GET", r"/api/versions", lambda b: {"api_min": "2.0.0", "api_current": "2.0.4"}),
+            ("GET", r"/manage/cases/list", lambda b: self._many(self._case)),
+            ("GET", rf"/manage/cases/{num}", lambda b, i: self._case(int(i))),
+            ("POST", r"/manage/cases/add", lambda b: self._echo(b, case_id=None)),
+            ("GET", rf"/manage/customers/{num}", lambda b, i: {"customer_id": int(i), "customer_name": f"Customer {i}"}),
+            ("POST", r"/manage/customers/add", lambda b: self._echo(b, customer_id=None)),
+            ("POST", r"/alerts/add", lambda b: self._echo(b, alert_id=None)),
+            ("GET", r"/case/summary/fetch", lambda b: {"case_description": self._pad("Summary")}),
+            ("GET", r"/case/(?:ioc|assets|timeline|evidences|tasks)/state", lambda b: _STATE),
+            ("GET", r"/case/ioc/list", lambda b: {"ioc": self._many(self._ioc), "state": _STATE}),
+            ("GET", rf"/case/ioc/{num}", lambda b, i: self._ioc(int(i))),
+            ("POST", r"/case/ioc/add", lambda b: self._echo(b, ioc_id=None)),
+            ("GET", r"/case/assets/list", lambda b: {"assets": self._many(self._asset), "state": _STATE}),
+            ("GET", rf"/case/assets/{num}", lambda b, i: self._asset(int(i))),
+            ("POST", r"/case/assets/add", lambda b: self._echo(b, asset_id=None)),
+            ("GET", r"/case/timeline/advanced-filter|/case/timeline/events/list/filter/\d+", lambda b: {"timeline": self._many(self._event), "state": _STATE}),
+            ("GET", rf"/case/timeline/events/{num}", lambda b, i: self._event(int(i))),
+            ("POST", r"/case/timeline/events/add", lambda b: self._echo(b, event_id=None)),
+            ("GET", r"/case/evidences/list", lambda b: {"evidences": self._many(self._evidence), "state": _STATE}),
+            ("GET", rf"/case/evidences/{num}", lambda b, i: self._evidence(int(i))),
+            ("POST", r"/case/evidences/add", lambda b: self._echo(b, id=None)),
+            ("GET", r"/case/tasks/list", lambda b: {"tasks": self._many(self._task), "state": _STATE}),
+            ("GET", rf"/case/tasks/{num}", lambda b, i: self._task(int(i))),
+            ("POST", r"/case/tasks/add", lambda b: self._echo(b, task_id=None)),
+            ("GET", r"/case/notes/directories/filter", lambda b: [{"id": 1, "name": "Root Notes", "notes": self._many(self._note)}]),
+            ("POST", r"/case/notes/directories/add", lambda b: self._echo(b, id=None)),
+            ("GET", rf"/case/notes/{num}", lambda b, i: self._note(int(i))),
+            ("POST", r"/case/notes/add", lambda b: self._echo(b, note_id=None)),
+            ("POST", r"/case/notes/search", lambda b: [{"note_id": n["note_id"], "note_title": n["note_title"]} for n in self._many(self._note)]),
+            ("POST", r"/case/\w+/\d+/comments/list", lambda b: self._many(self._comment)),
+            ("POST", r"/case/\w+/\d+/comments/add", lambda b: self._echo(b, comment_id=None)),
+            ("GET", r"/manage/users/lookup/login/(\w+)", lambda b, login: {"user_id": 1, "user_login": login}),
+            ("POST", r"/search", self._search),
+            # Generic acknowledgements for updates, deletes and comment edits.
+            ("POST", r"/.+/(?:update|delete|edit)(?:/\d+)?", lambda b: b),
+        ]
+        table += [("GET", re.escape(path), lambda b, data=data: data) for path, data in REFERENCE_LISTS.items()]
+        return [(method, re.compile(pattern), handler) for method, pattern, handler in table]
+
+    def route(self, method: str, path: str, body: dict[str, Any] | None = None) -> Any:
+        """Return the ``data`` payload for a request, or raise KeyError for unknown routes."""
+        path = "/" + path.lstrip("/")
+        for route_method, pattern, handler in self._routes:
+            match = pattern.fullmatch(path)
+            if route_method == method and match:
+                return handler(body or {}, *match.groups())
+        raise KeyError(path)
+
+    def _delay(self, path: str) -> float:
+        delay = next((v for prefix, v in self.route_latency.items() if path.startswith(prefix)), self.latency)
+        return delay + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    # -- HTTP plumbing --------------------------------------------------
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self) -> None:
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+                if stub.connect_latency:
+                    time.sleep(stub.connect_latency)
+
+            def _reply(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw_body = self.rfile.read(length) if length else b""
+                with stub._lock:
+                    stub.requests += 1
+                path = urlsplit(self.path).path
+                delay = stub._delay(path)
+                if delay:
+                    time.sleep(delay)
+                try:
+                    body = json.loads(raw_body) if raw_body else {}
+                except ValueError:
+                    body = {}
+                try:
+                    if stub.error_rate and random.random() < stub.error_rate:
+                        with stub._lock:
+                            stub.errors += 1
+                        payload, code = {"status": "error", "message": "Injected failure", "data": None}, stub.error_status
+                    else:
+                        payload = {"status": "success", "message": "", "data": stub.route(self.command, path, body if isinstance(body, dict) else {})}
+                        code = 200
+                except KeyError:
+                    payload = {"status": "error", "message": f"Unknown endpoint {self.path}", "data": None}
+                    code = 404
+                raw = json.dumps(payload, default=str).encode()
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            do_GET = _reply
+            do_POST = _reply
+
+            def log_message(self, *_args: Any) -> None:
+                return None
+
+        return Handler
+
+    def start(self) -> StubIris:
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> StubIris:
+        return self.start()
+
+    def __exit__(self, *_exc: object) -> None:
+        self.stop()
+
+
+def _route_latency(specs: list[str]) -> dict[str, float]:
+    out = {}
+    for spec in specs:
+        prefix, _, seconds = spec.partition("=")
+        out[prefix] = float(seconds)
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a stub DFIR Iris API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--rows", type=int, default=50, help="rows per listed collection")
+    parser.add_argument("--payload-bytes", type=int, default=0, help="padding added to each row's description")
+    parser.add_argument("--latency", type=float, default=0.0, help="per-request latency (s)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency up to this many seconds")
+    parser.add_argument("--connect-latency", type=float, default=0.0, help="per-connection setup latency (s)")
+    parser.add_argument("--route-latency", action="append", default=[], metavar="PREFIX=SECONDS", help="latency override for a path prefix")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with --error-status")
+    parser.add_argument("--error-status", type=int, default=503, help="HTTP status of injected failures")
+    args = parser.parse_args()
+
+    stub = StubIris(
+        args.host,
+        args.port,
+        latency=args.latency,
+        connect_latency=args.connect_latency,
+        rows=args.rows,
+        payload_bytes=args.payload_bytes,
+        jitter=args.jitter,
+        route_latency=_route_latency(args.route_latency),
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+    )
+    print(stub.url, flush=True)
+    try:
+        stub._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ sys.modules["dfir_iris_client.case"] = MagicMock()
 sys.modules["dfir_iris_client.alert"] = MagicMock()
 sys.modules["dfir_iris_client.customer"] = MagicMock()
 sys.modules["dfir_iris_client.admin"] = MagicMock()
+sys.modules["dfir_iris_client.global_search"] = MagicMock()
 
 
 # Mock fastmcp
@@ -27,6 +28,12 @@ class DummyFastMCP:
 
         return decorator
 
+    def custom_route(self, *_args, **_kwargs):
+        def decorator(fn):
+            return fn
+
+        return decorator
+
     def run(self, **_kwargs):
         return None
 
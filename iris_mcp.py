@@ -2,52 +2,130 @@
 # /// script
 # dependencies = [
 #   "dfir-iris-client>=2.0.0",
-#   "fastmcp>=2.13.2"
+#   "fastmcp>=2.13.2",
+#   "starlette>=0.27"
 # ]
 # ///
 
+from __future__ import annotations
+
+import asyncio
+import base64
+import bisect
+import contextlib
+import contextvars
+import csv
+import functools
+import hashlib
+import importlib
+import importlib.util
 import inspect
+import ipaddress
+import itertools
+import json
+import logging
+import operator
 import os
+import random
+import re
+import secrets
+import sqlite3
+import subprocess
 import sys
+import threading
+import time
+import weakref
 
 # Add vendor directory to path to ensure we use the local client version
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "vendor/iris-client"))
 
-from datetime import datetime
-from typing import Any
+from collections import OrderedDict, deque
+from collections.abc import Callable, Coroutine, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Literal
+from urllib.parse import urlsplit
 
-from dfir_iris_client.admin import AdminHelper
-from dfir_iris_client.alert import Alert
-from dfir_iris_client.case import Case
-from dfir_iris_client.customer import Customer
-from dfir_iris_client.session import ClientSession
 from fastmcp import FastMCP
-
-# Static catalog data loaded from a dedicated module
-from types_catalog import (
-    ALERT_RESOLUTION_STATUSES,
-    ALERT_STATUSES,
-    ANALYSIS_STATUSES,
-    ASSET_TYPES,
-    CATALOG,
-    EVENT_CATEGORIES,
-    EVIDENCE_TYPES,
-    IOC_TYPES,
-    OS_TYPES,
-    SEVERITIES,
-    TASK_STATUSES,
-    TLP_LEVELS,
-)
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+
+if TYPE_CHECKING:
+    import requests
+    from dfir_iris_client.admin import AdminHelper
+    from dfir_iris_client.alert import Alert
+    from dfir_iris_client.case import Case
+    from dfir_iris_client.customer import Customer
+    from dfir_iris_client.global_search import global_search_ioc
+    from dfir_iris_client.session import ClientSession
+
+    # Static catalog data loaded from a dedicated module
+    import types_catalog
+
+
+class _Deferred:
+    """Placeholder for a class or function that is imported on first call or attribute access."""
+
+    __slots__ = ("_module", "_name", "_target")
+
+    def __init__(self, module: str, name: str) -> None:
+        self._module = module
+        self._name = name
+        self._target: Any = None
+
+    def resolve(self) -> Any:
+        if self._target is None:
+            self._target = getattr(importlib.import_module(self._module), self._name)
+        return self._target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        return f"<deferred {self._module}.{self._name}>"
+
+
+def _lazy_module(name: str) -> Any:
+    """Return ``name`` as a module that is executed on first attribute access."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# MCP clients start a fresh process per session and list tools first, so the Iris client
+# (with the requests stack behind it) and the static catalogs are loaded on first use.
+_DEFERRED_MODULES = ("dfir_iris_client", "requests", "types_catalog")
+if not TYPE_CHECKING:
+    AdminHelper = _Deferred("dfir_iris_client.admin", "AdminHelper")
+    Alert = _Deferred("dfir_iris_client.alert", "Alert")
+    Case = _Deferred("dfir_iris_client.case", "Case")
+    Customer = _Deferred("dfir_iris_client.customer", "Customer")
+    global_search_ioc = _Deferred("dfir_iris_client.global_search", "global_search_ioc")
+    ClientSession = _Deferred("dfir_iris_client.session", "ClientSession")
+    types_catalog = _lazy_module("types_catalog")
 
 # Initialize FastMCP server
 mcp = FastMCP("dfir-iris")
+log = logging.getLogger("iris_mcp")
 
 
 def _normalize_key(name: str) -> str:
     return name.replace("_", "").replace("-", "").lower()
 
 
-def _get_field(item: Any, *names: str) -> Any:
+def _lookup_field(item: Any, *names: str) -> Any:
     """Return the first matching attribute/key from an API payload object or dict.
 
     Tries direct matches first, then falls back to case/underscore-insensitive matches
@@ -82,6 +160,81 @@ def _get_field(item: Any, *names: str) -> Any:
     return None
 
 
+def _missing(_item: Any) -> None:
+    return None
+
+
+def _compile_getter(item: dict[Any, Any], names: tuple[str, ...]) -> Callable[[Any], Any]:
+    """Work out once which key/attribute `_lookup_field` would pick for this dict shape."""
+    for name in names:
+        if name in item:
+            return operator.itemgetter(name)
+        if hasattr(item, name):
+            return operator.attrgetter(name)
+    targets = {_normalize_key(n) for n in names}
+    for key in item:
+        if _normalize_key(key) in targets:
+            return operator.itemgetter(key)
+    for attr in dir(item):
+        if not attr.startswith("__") and _normalize_key(attr) in targets:
+            return operator.attrgetter(attr)
+    return _missing
+
+
+class _FieldPlans:
+    """Compiled field getters keyed by payload shape.
+
+    Rows of one Iris collection share the same keys, so the winning key for a set of
+    candidate names is resolved once per (endpoint, type, keys) signature and the
+    resulting getter is reused for every following row.
+    """
+
+    def __init__(self, limit: int = 4096) -> None:
+        self.limit = limit
+        self._plans: dict[tuple[Any, ...], dict[tuple[str, ...], Callable[[Any], Any]]] = {}
+
+    def plan(self, endpoint: str, item: dict[Any, Any]) -> dict[tuple[str, ...], Callable[[Any], Any]]:
+        shape = (endpoint, type(item), tuple(item))
+        plan = self._plans.get(shape)
+        if plan is None:
+            if len(self._plans) >= self.limit:
+                self._plans.clear()
+            plan = self._plans[shape] = {}
+        return plan
+
+    def read(self, plan: dict[tuple[str, ...], Callable[[Any], Any]], item: dict[Any, Any], names: tuple[str, ...]) -> Any:
+        getter = plan.get(names)
+        if getter is None:
+            getter = plan[names] = _compile_getter(item, names)
+        return getter(item)
+
+
+_FIELD_PLANS = _FieldPlans()
+
+
+def _get_field(item: Any, *names: str) -> Any:
+    """Return the first matching attribute/key from an API payload object or dict.
+
+    Dict payloads go through the shape-keyed plan cache; other objects use the
+    reflective `_lookup_field` scan.
+    """
+    if isinstance(item, dict):
+        return _FIELD_PLANS.read(_FIELD_PLANS.plan("", item), item, names)
+    return _lookup_field(item, *names)
+
+
+def _row_reader(endpoint: str, item: Any) -> Callable[..., Any]:
+    """Return ``get(*names)`` for one row of a collection, reusing the plan for its shape."""
+    if not isinstance(item, dict):
+        return functools.partial(_lookup_field, item)
+    plan = _FIELD_PLANS.plan(endpoint, item)
+
+    def get(*names: str) -> Any:
+        return _FIELD_PLANS.read(plan, item, names)
+
+    return get
+
+
 def _extract_data(resp: Any, action: str) -> Any:
     """Unwrap ApiResponse data or raise a helpful error."""
     if hasattr(resp, "is_error") and resp.is_error():
@@ -99,43 +252,132 @@ def _extract_data(resp: Any, action: str) -> Any:
     return getattr(resp, "data", None)
 
 
+@dataclass(frozen=True)
+class _MethodPlan:
+    method: str
+    shape: tuple[str, ...]
+    positional: bool
+
+
+class _MethodPlans:
+    """Process-wide memo of which client method and payload shape worked for an action.
+
+    ``dfir_iris_client`` versions differ in method names and signatures, so some calls
+    probe candidates by trial and error. Once a combination succeeds it is tried first
+    on every later call; if it starts raising ``TypeError``/``AttributeError`` (e.g. the
+    client was upgraded) the plan is dropped, the event is logged and the probe reruns.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._plans: dict[str, _MethodPlan] = {}
+        self._broken: deque[dict[str, Any]] = deque(maxlen=20)
+
+    def get(self, key: str) -> _MethodPlan | None:
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return plan
+
+    def remember(self, key: str, plan: _MethodPlan) -> None:
+        with self._lock:
+            self._plans[key] = plan
+
+    def forget(self, key: str, plan: _MethodPlan, error: Exception) -> None:
+        with self._lock:
+            if self._plans.get(key) == plan:
+                del self._plans[key]
+            self._broken.append({"action": key, "method": plan.method, "shape": list(plan.shape), "error": str(error)})
+        log.warning("Cached client call plan %s(%s) for %s stopped working: %s", plan.method, ", ".join(plan.shape), key, error)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+            self._broken.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "plans": {k: f"{p.method}({', '.join(p.shape)}){' positional' if p.positional else ''}" for k, p in self._plans.items()},
+                "hits": self.hits,
+                "misses": self.misses,
+                "broken": list(self._broken),
+            }
+
+
+_METHOD_PLANS = _MethodPlans()
+
+
+def _call_case_method(func: Callable[..., Any], payload: dict[str, Any], positional: bool) -> Any:
+    if not positional:
+        return func(**payload)
+    args = []
+    for key in ("cid", "case_id"):
+        if key in payload:
+            args.append(payload[key])
+            break
+    remaining = [v for k, v in payload.items() if k not in ("cid", "case_id")]
+    return func(*args, *remaining)
+
+
 def _try_case_methods(
     case_obj: Any,
     method_candidates: list[str],
     action: str,
     payload_options: list[dict[str, Any]],
     allow_positional: bool = True,
+    plan_key: str | None = None,
 ) -> tuple[Any, str]:
-    """Attempt multiple method names/payload shapes; return (data, method_used) or raise last error."""
+    """Attempt multiple method names/payload shapes; return (data, method_used) or raise last error.
+
+    Only for reads: an API error moves on to the next candidate, which would repeat a write.
+    The combination that works is memoized under ``plan_key`` (default: the candidate
+    names) and tried first next time.
+    """
+    key = plan_key or "|".join(method_candidates)
+    plan = _METHOD_PLANS.get(key)
+    if plan is not None:
+        func = getattr(case_obj, plan.method, None)
+        payload = next((p for p in payload_options if tuple(p) == plan.shape), None)
+        if func is not None and payload is not None:
+            try:
+                resp = _call_case_method(func, payload, plan.positional)
+            except (TypeError, AttributeError) as e:
+                _METHOD_PLANS.forget(key, plan, e)
+            else:
+                return _extract_data(resp, action), plan.method
+
     last_error: Exception | None = None
     for meth in method_candidates:
         if not hasattr(case_obj, meth):
             continue
         func = getattr(case_obj, meth)
         for payload in payload_options:
+            positional = False
             try:
                 resp = func(**payload)
             except TypeError:
                 if not allow_positional:
                     last_error = None
                     continue
+                positional = True
                 try:
-                    args = []
-                    for key in ("cid", "case_id"):
-                        if key in payload:
-                            args.append(payload[key])
-                            break
-                    remaining = [v for k, v in payload.items() if k not in ("cid", "case_id")]
-                    resp = func(*args, *remaining)
+                    resp = _call_case_method(func, payload, positional)
                 except Exception as e:
                     last_error = e
                     continue
             try:
                 data = _extract_data(resp, action)
-                return data, meth
             except Exception as e:
                 last_error = e
                 continue
+            _METHOD_PLANS.remember(key, _MethodPlan(meth, tuple(payload), positional))
+            return data, meth
     if last_error:
         raise last_error
     raise AttributeError(f"No method found for {action}. Tried: {method_candidates}")
@@ -206,31 +448,920 @@ def _introspect_case_methods(case_id: int, filter_text: str = "") -> str:
         return f"Error introspecting case methods: {e!s}"
 
 
-def _format_customer(customer: Any, customer_map: dict[int, str] | None = None) -> str:
-    """Render customer info from id/dict/str with optional lookup map."""
-    if customer is None:
+# -------------------------------
+# Typed records and renderers
+# -------------------------------
+
+OutputFormat = Literal["text", "json"]
+
+
+class _Record:
+    """Normalized view of one API object; ``raw`` keeps the payload it was read from."""
+
+    __slots__: tuple[str, ...] = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__ if name != "raw"}
+
+    def is_empty(self) -> bool:
+        """True when none of the known fields were found (unrecognized payload shape)."""
+        return all(getattr(self, name) is None for name in self.__slots__ if name != "raw")
+
+
+@dataclass(frozen=True, slots=True)
+class CaseRecord(_Record):
+    id: Any
+    name: Any
+    customer_id: Any
+    customer_name: Any
+    status: Any
+    description: Any = None
+    open_date: Any = None
+    raw: Any = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_payload(cls, item: Any, customer_names: dict[int, str] | None = None) -> CaseRecord:
+        get = _row_reader("cases", item)
+        customer_id, customer_name = _split_customer(get("case_customer", "customer", "customer_id", "case_customer_id"), customer_names)
+        return cls(
+            id=get("case_id", "id", "cid"),
+            name=get("case_name", "name"),
+            customer_id=customer_id,
+            customer_name=customer_name,
+            status=get("case_status_id", "status_id", "status"),
+            description=get("case_description", "description"),
+            open_date=get("case_open_date", "open_date"),
+            raw=item,
+        )
+
+    @property
+    def customer_label(self) -> str:
+        if self.customer_name and self.customer_id is not None:
+            return f"{self.customer_name} (ID {self.customer_id})"
+        if self.customer_name:
+            return str(self.customer_name)
+        if self.customer_id is not None:
+            return f"ID {self.customer_id}"
         return "Unassigned"
-    if isinstance(customer, str | bytes):
-        return str(customer)
+
+
+@dataclass(frozen=True, slots=True)
+class IocRecord(_Record):
+    id: Any
+    value: Any
+    type: Any
+    tlp: Any
+    tags: Any
+    description: Any
+    raw: Any = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_payload(cls, item: Any) -> IocRecord:
+        get = _row_reader("iocs", item)
+        return cls(
+            id=get("ioc_id", "id"),
+            value=get("ioc_value", "value", "ioc", "indicator"),
+            type=get("ioc_type", "ioc_type_id", "ioc_type_name", "type"),
+            tlp=get("tlp_name", "ioc_tlp", "ioc_tlp_id", "tlp"),
+            tags=get("ioc_tags", "tags"),
+            description=get("ioc_description", "description", "ioc_desc"),
+            raw=item,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class AssetRecord(_Record):
+    id: Any
+    name: Any
+    type: Any
+    status: Any
+    raw: Any = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_payload(cls, item: Any) -> AssetRecord:
+        get = _row_reader("assets", item)
+        return cls(
+            id=get("asset_id", "id"),
+            name=get("asset_name", "name"),
+            type=get("asset_type_id", "asset_type", "asset_type_name"),
+            status=get("analysis_status_id", "analysis_status", "analysis_status_name"),
+            raw=item,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class EventRecord(_Record):
+    id: Any
+    title: Any
+    description: Any
+    category: Any
+    tlp: Any
+    date: Any
+    timezone: Any
+    raw: Any = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_payload(cls, item: Any) -> EventRecord:
+        get = _row_reader("events", item)
+        return cls(
+            id=get("event_id", "id"),
+            title=get("event_title", "event_name", "name", "title"),
+            description=get("event_content", "event_description", "description", "content"),
+            category=get("category_name", "event_category", "category", "event_category_name", "event_category_id"),
+            tlp=get("tlp", "tlp_name", "color", "event_color"),
+            date=get("event_date", "event_date_wtz", "date_time", "datetime", "event_datetime", "time", "timestamp"),
+            timezone=get("event_tz", "timezone", "timezone_string"),
+            raw=item,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class EvidenceRecord(_Record):
+    id: Any
+    name: Any
+    type: Any
+    tlp: Any
+    size: Any
+    hash: Any
+    added: Any
+    description: Any
+    raw: Any = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_payload(cls, item: Any) -> EvidenceRecord:
+        get = _row_reader("evidences", item)
+        return cls(
+            id=get("evidence_id", "id"),
+            name=get("evidence_name", "name", "title", "filename"),
+            type=get("evidence_type", "type", "evidence_type_id", "type_id"),
+            tlp=get("tlp", "tlp_name", "color"),
+            size=get("file_size", "size"),
+            hash=get("file_hash", "hash"),
+            added=get("date_added", "created_at"),
+            description=get("file_description", "description", "evidence_description"),
+            raw=item,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class TaskRecord(_Record):
+    id: Any
+    title: Any
+    status: Any
+    assignees: Any
+    raw: Any = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_payload(cls, item: Any) -> TaskRecord:
+        get = _row_reader("tasks", item)
+        return cls(
+            id=get("task_id", "id"),
+            title=get("task_title", "title", "name"),
+            status=get("task_status", "status", "status_name", "task_status_name"),
+            assignees=get("assignees", "task_assignees"),
+            raw=item,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CustomerRecord(_Record):
+    id: Any
+    name: Any
+    sector: Any
+    description: Any = None
+    raw: Any = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_payload(cls, item: Any) -> CustomerRecord:
+        get = _row_reader("customers", item)
+        return cls(
+            id=get("customer_id", "id"),
+            name=get("customer_name", "name"),
+            sector=get("customer_sector", "sector"),
+            description=get("customer_description", "description"),
+            raw=item,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class NoteRecord(_Record):
+    id: Any
+    title: Any
+    directory_id: Any
+    content: Any = None
+    raw: Any = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_payload(cls, item: Any, endpoint: str = "notes") -> NoteRecord:
+        get = _row_reader(endpoint, item)
+        return cls(
+            id=get("note_id", "id"),
+            title=get("note_title", "title"),
+            directory_id=get("directory_id", "note_directory_id", "dir_id"),
+            content=get("note_content", "content"),
+            raw=item,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class NoteMatchRecord(_Record):
+    """One full-text search hit; ``snippet`` marks the matched words with ``**``."""
+
+    id: Any
+    title: Any
+    directory_id: Any
+    snippet: Any
+    raw: Any = field(default=None, compare=False, repr=False)
+
+
+@dataclass(frozen=True, slots=True)
+class NoteDirectoryRecord(_Record):
+    id: Any
+    name: Any
+    note_count: Any
+    notes: tuple[NoteRecord, ...] = ()
+    raw: Any = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_payload(cls, item: Any) -> NoteDirectoryRecord:
+        get = _row_reader("note_directories", item)
+        notes = item.get("notes") if isinstance(item, dict) else None
+        return cls(
+            id=get("id", "directory_id", "note_directory_id", "dir_id"),
+            name=get("name", "directory_name", "note_directory_name"),
+            note_count=get("note_count", "notes_count", "notes_nb"),
+            notes=tuple(NoteRecord.from_payload(note) for note in notes or ()),
+            raw=item,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**_Record.to_dict(self), "notes": [note.to_dict() for note in self.notes]}
+
+
+@dataclass(frozen=True, slots=True)
+class CommentRecord(_Record):
+    id: Any
+    author: Any
+    content: Any
+    raw: Any = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_payload(cls, item: Any, endpoint: str) -> CommentRecord:
+        get = _row_reader(endpoint, item)
+        author = get("user", "author", "comment_author")
+        if isinstance(author, dict):
+            author = _get_field(author, "user_login", "user_name", "name")
+        return cls(id=get("comment_id", "id"), author=author, content=get("comment_content", "comment"), raw=item)
+
+
+def _split_customer(customer: Any, customer_names: dict[int, str] | None = None) -> tuple[Any, Any]:
+    """Return ``(customer_id, customer_name)`` from an id, name or customer dict."""
+    if customer is None:
+        return None, None
     if isinstance(customer, dict):
-        name = _get_field(customer, "customer_name", "name")
-        cid = _get_field(customer, "customer_id", "id")
-        if name and cid is not None:
-            return f"{name} (ID {cid})"
-        if name:
-            return str(name)
-        if cid is not None:
-            return f"ID {cid}"
-    if isinstance(customer, int) and customer_map and customer in customer_map:
-        return f"{customer_map[customer]} (ID {customer})"
+        return _get_field(customer, "customer_id", "id"), _get_field(customer, "customer_name", "name")
     if isinstance(customer, int):
-        return f"ID {customer}"
-    return str(customer)
+        names = _CUSTOMER_DIRECTORY.cached_names() if customer_names is None else customer_names
+        return customer, names.get(customer)
+    return None, str(customer)
+
+
+def _render(header: str, lines: Iterable[str], footer: str = "") -> str:
+    """Join a header, one line per record and an optional footer into a text block."""
+    return "\n".join([header, *lines, footer])
+
+
+def _page_payload(records: Iterable[_Record], page: _Page) -> dict[str, Any]:
+    return {"items": [r.to_dict() for r in records], "total": page.total, "offset": page.start, "next_cursor": page.next_cursor}
+
+
+def _case_line(r: CaseRecord) -> str:
+    return f"- ID: {r.id}, Name: {r.name}, Customer: {r.customer_label}, Status: {r.status}"
+
+
+def _ioc_line(r: IocRecord) -> str:
+    if r.id is None and r.value is None and r.type is None and r.description is None:
+        return f"- {r.raw}"
+    return f"- ID: {r.id}, Value: {r.value}, Type: {r.type}, TLP: {r.tlp}, Tags: {r.tags}, Description: {r.description}"
+
+
+def _asset_line(r: AssetRecord) -> str:
+    if r.is_empty():
+        return f"- {r.raw}"
+    return f"- ID: {r.id}, Name: {r.name}, Type: {r.type}, Status: {r.status}"
+
+
+def _event_line(r: EventRecord) -> str:
+    if all(v is None for v in (r.id, r.title, r.category, r.tlp, r.description, r.date)):
+        return f"- {r.raw}"
+    when = f"{r.date}{' ' + r.timezone if r.timezone else ''}"
+    return f"- ID: {r.id}, Name: {r.title}, Category: {r.category}, TLP/Color: {r.tlp}, Time: {when}, Desc: {r.description}"
+
+
+def _evidence_line(r: EvidenceRecord) -> str:
+    if all(v is None for v in (r.id, r.name, r.type, r.tlp, r.size, r.hash, r.description)):
+        return f"- {r.raw}"
+    return f"- ID: {r.id}, Name: {r.name}, Type: {r.type}, TLP: {r.tlp}, Size: {r.size}, Hash: {r.hash}, Added: {r.added}, Desc: {r.description}"
+
+
+def _task_line(r: TaskRecord) -> str:
+    return f"- ID: {r.id}, Title: {r.title}, Status: {r.status}, Assignees: {r.assignees}"
+
+
+def _customer_line(r: CustomerRecord) -> str:
+    return f"- ID: {r.id}, Name: {r.name}, Sector: {r.sector}"
+
+
+def _note_line(r: NoteRecord) -> str:
+    return f"- ID: {r.id}, Title: {r.title}, Directory: {r.directory_id}"
+
+
+def _note_match_line(r: NoteMatchRecord) -> str:
+    return f"- ID: {r.id}, Title: {r.title}, Directory: {r.directory_id}\n  {r.snippet}"
+
+
+def _note_tree_line(r: NoteDirectoryRecord) -> str:
+    """A directory with its notes indented below it (``list_notes``)."""
+    count = f" — {r.note_count} notes" if r.note_count is not None else ""
+    notes = (f"  • ID: {n.id}, Title: {n.title}" for n in r.notes)
+    return "\n".join([f"- Directory {r.id} ({r.name or '(unnamed directory)'}){count}", *notes])
+
+
+def _note_directory_line(r: NoteDirectoryRecord) -> str:
+    count = f", Notes: {r.note_count}" if r.note_count is not None else ""
+    notes = (f"  • Note ID: {n.id}, Title: {n.title}" for n in r.notes)
+    return "\n".join([f"- ID: {r.id}, Name: {r.name}{count}", *notes])
+
+
+def _comment_line(r: CommentRecord) -> str:
+    return f"- ID: {r.id}, Author: {r.author}, Comment: {r.content}"
+
+
+# -------------------------------
+# Metrics
+# -------------------------------
+
+_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class _Histogram:
+    """Fixed-bucket latency histogram (Prometheus semantics, non-cumulative storage)."""
+
+    __slots__ = ("counts", "sum")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(_LATENCY_BUCKETS) + 1)
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(_LATENCY_BUCKETS, seconds)] += 1
+        self.sum += seconds
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate a quantile by linear interpolation inside the matching bucket."""
+        total = self.count
+        if not total:
+            return None
+        rank = q * total
+        seen = 0
+        lower = 0.0
+        for i, n in enumerate(self.counts):
+            upper = _LATENCY_BUCKETS[i] if i < len(_LATENCY_BUCKETS) else lower
+            if n and seen + n >= rank:
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+            lower = upper
+        return lower
+
+
+@functools.lru_cache(maxsize=1024)
+def _endpoint_label(url: str) -> str:
+    """Reduce a request URL to a low-cardinality endpoint label (``/case/ioc/{id}``)."""
+    path = urlsplit(url).path
+    return "/" + "/".join("{id}" if part.isdigit() else part for part in path.strip("/").split("/"))
+
+
+class _Metrics:
+    """In-process counters and histograms for tools and Iris API calls.
+
+    Recording is a dict lookup plus a few integer updates under one lock, so it stays
+    on permanently. ``render`` produces the Prometheus text format served on
+    ``/metrics``; ``snapshot`` feeds the ``server_stats`` tool.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._tool_latency: dict[str, _Histogram] = {}
+        self._tool_errors: dict[str, int] = {}
+        self._in_flight: dict[str, int] = {}
+        self._iris_latency: dict[tuple[str, str], _Histogram] = {}
+        self._iris_errors: dict[tuple[str, str, str], int] = {}
+
+    def tool_started(self, tool: str) -> None:
+        with self._lock:
+            self._in_flight[tool] = self._in_flight.get(tool, 0) + 1
+
+    def tool_finished(self, tool: str, seconds: float, failed: bool) -> None:
+        with self._lock:
+            self._in_flight[tool] -= 1
+            hist = self._tool_latency.get(tool)
+            if hist is None:
+                hist = self._tool_latency[tool] = _Histogram()
+            hist.observe(seconds)
+            if failed:
+                self._tool_errors[tool] = self._tool_errors.get(tool, 0) + 1
+
+    def iris_call(self, method: str, url: str, seconds: float, error: str | None = None) -> None:
+        key = (method, _endpoint_label(url))
+        with self._lock:
+            hist = self._iris_latency.get(key)
+            if hist is None:
+                hist = self._iris_latency[key] = _Histogram()
+            hist.observe(seconds)
+            if error is not None:
+                err_key = (*key, error)
+                self._iris_errors[err_key] = self._iris_errors.get(err_key, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tool_latency.clear()
+            self._tool_errors.clear()
+            self._in_flight = {k: v for k, v in self._in_flight.items() if v}
+            self._iris_latency.clear()
+            self._iris_errors.clear()
+
+    @staticmethod
+    def _summary(hist: _Histogram) -> dict[str, Any]:
+        count = hist.count
+        return {
+            "count": count,
+            "mean_ms": round(hist.sum / count * 1000, 2) if count else None,
+            **{f"p{int(q * 100)}_ms": round(v * 1000, 2) if (v := hist.quantile(q)) is not None else None for q in (0.5, 0.95, 0.99)},
+        }
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            tools = {
+                name: {**self._summary(hist), "errors": self._tool_errors.get(name, 0), "in_flight": self._in_flight.get(name, 0)}
+                for name, hist in sorted(self._tool_latency.items())
+            }
+            for name, n in self._in_flight.items():
+                tools.setdefault(name, {"count": 0, "errors": 0, "in_flight": n})
+            iris: dict[str, Any] = {f"{method} {endpoint}": self._summary(hist) for (method, endpoint), hist in sorted(self._iris_latency.items())}
+            for (method, endpoint, reason), n in self._iris_errors.items():
+                iris[f"{method} {endpoint}"].setdefault("errors", {})[reason] = n
+        return {"uptime_seconds": round(time.time() - self.started, 1), "tools": tools, "iris_calls": iris}
+
+    def render(self, caches: dict[str, dict[str, Any]]) -> str:
+        lines: list[str] = []
+
+        def histogram(name: str, help_text: str, series: dict[str, _Histogram]) -> None:
+            lines.extend((f"# HELP {name} {help_text}", f"# TYPE {name} histogram"))
+            for labels, hist in series.items():
+                cumulative = 0
+                for bound, n in zip((*_LATENCY_BUCKETS, "+Inf"), hist.counts, strict=True):
+                    cumulative += n
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.extend((f"{name}_sum{{{labels}}} {hist.sum:.6f}", f"{name}_count{{{labels}}} {cumulative}"))
+
+        def simple(name: str, kind: str, help_text: str, series: dict[str, float]) -> None:
+            lines.extend((f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"))
+            lines.extend(f"{name}{{{labels}}} {value}" for labels, value in series.items())
+
+        with self._lock:
+            histogram(
+                "iris_mcp_tool_duration_seconds",
+                "Tool call latency.",
+                {f'tool="{t}"': h for t, h in sorted(self._tool_latency.items())},
+            )
+            simple(
+                "iris_mcp_tool_errors_total",
+                "counter",
+                "Tool calls that raised or returned an error.",
+                {f'tool="{t}"': n for t, n in sorted(self._tool_errors.items())},
+            )
+            simple("iris_mcp_tool_in_flight", "gauge", "Tool calls currently running.", {f'tool="{t}"': n for t, n in sorted(self._in_flight.items())})
+            histogram(
+                "iris_mcp_iris_request_duration_seconds",
+                "Iris API request latency.",
+                {f'method="{m}",endpoint="{e}"': h for (m, e), h in sorted(self._iris_latency.items())},
+            )
+            simple(
+                "iris_mcp_iris_request_errors_total",
+                "counter",
+                "Iris API requests that failed or returned an HTTP error.",
+                {f'method="{m}",endpoint="{e}",reason="{r}"': n for (m, e, r), n in sorted(self._iris_errors.items())},
+            )
+        counted = {name: stats for name, stats in caches.items() if "hits" in stats}
+        simple("iris_mcp_cache_hits_total", "counter", "Cache hits.", {f'cache="{c}"': s["hits"] for c, s in counted.items()})
+        simple("iris_mcp_cache_misses_total", "counter", "Cache misses.", {f'cache="{c}"': s["misses"] for c, s in counted.items()})
+        simple(
+            "iris_mcp_cache_hit_ratio",
+            "gauge",
+            "Cache hits / lookups since start.",
+            {f'cache="{c}"': round(s["hits"] / (s["hits"] + s["misses"]), 4) for c, s in counted.items() if s["hits"] + s["misses"]},
+        )
+        simple("iris_mcp_uptime_seconds", "gauge", "Seconds since the server started.", {"": round(time.time() - self.started, 1)})
+        return "\n".join(line.replace("{}", "") for line in lines) + "\n"
+
+
+_METRICS = _Metrics()
+
+
+# -------------------------------
+# Session pool
+# -------------------------------
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# -------------------------------
+# Backend protection
+# -------------------------------
+
+
+class IrisUnavailableError(RuntimeError):
+    """Raised instead of calling Iris while the circuit breaker is open or no call slot frees up."""
+
+
+class _AimdLimiter:
+    """Caps concurrent Iris requests; the cap adapts by additive increase / multiplicative decrease.
+
+    Each request that completes within ``latency_target`` without a server error raises
+    the cap by ``1/limit`` (about one slot per round of requests); a slow or failed one
+    halves it, at most once per observed request latency so a burst of failures counts once.
+    """
+
+    def __init__(self, max_limit: int = 16, min_limit: int = 1, latency_target: float = 2.0, queue_timeout: float = 60.0) -> None:
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.latency_target = latency_target
+        self.queue_timeout = queue_timeout
+        self.limit = float(self.max_limit)
+        self.in_flight = 0
+        self.decreases = 0
+        self.rejected = 0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            if not self._cond.wait_for(lambda: self.in_flight < int(self.limit), timeout=self.queue_timeout):
+                self.rejected += 1
+                raise IrisUnavailableError(f"Iris API saturated: no request slot freed within {self.queue_timeout:g}s (limit {int(self.limit)})")
+            self.in_flight += 1
+
+    def release(self, latency: float, ok: bool) -> None:
+        now = time.monotonic()
+        with self._cond:
+            self.in_flight -= 1
+            if ok and latency <= self.latency_target:
+                self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+            elif now - self._last_decrease > latency:
+                self.limit = max(float(self.min_limit), self.limit / 2)
+                self._last_decrease = now
+                self.decreases += 1
+            self._cond.notify_all()
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "limit": round(self.limit, 2),
+                "max_limit": self.max_limit,
+                "in_flight": self.in_flight,
+                "decreases": self.decreases,
+                "rejected": self.rejected,
+                "latency_target_seconds": self.latency_target,
+            }
+
+
+class _CircuitBreaker:
+    """Fails fast after ``threshold`` consecutive server failures, for ``cooldown`` seconds.
+
+    After the cooldown one trial request is let through (half-open): success closes the
+    circuit, failure opens it for another cooldown.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0) -> None:
+        self.threshold = max(1, threshold)
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened = 0
+        self.short_circuited = 0
+        self.last_error = ""
+        self._opened_at: float | None = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        return "half-open" if time.monotonic() - self._opened_at >= self.cooldown else "open"
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self.cooldown - (time.monotonic() - self._opened_at)
+            if remaining <= 0 and not self._trial_running:
+                self._trial_running = True
+                return
+            self.short_circuited += 1
+            raise IrisUnavailableError(
+                f"Iris API unavailable: {self.failures} consecutive failures (last: {self.last_error}); not calling it again for {max(remaining, 0):.0f}s"
+            )
+
+    def abort_trial(self) -> None:
+        """Give up a half-open trial slot that never reached Iris."""
+        with self._lock:
+            self._trial_running = False
+
+    def record(self, error: str | None) -> None:
+        with self._lock:
+            self._trial_running = False
+            if error is None:
+                self.failures = 0
+                self._opened_at = None
+                return
+            self.failures += 1
+            self.last_error = error
+            if self.failures >= self.threshold and (self._opened_at is None or time.monotonic() - self._opened_at >= self.cooldown):
+                self._opened_at = time.monotonic()
+                self.opened += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "opened": self.opened,
+                "short_circuited": self.short_circuited,
+                "last_error": self.last_error or None,
+            }
+
+
+_RETRYABLE_STATUS = frozenset({429, 502, 503, 504})
+_SERVER_ERROR = 500
+
+
+class _IrisGuard:
+    """Limiter, circuit breaker and read retries shared by every Iris request of the process.
+
+    Only GET requests are retried (Iris reads); writes are sent once so a timed-out
+    POST is never duplicated. Backoff is "full jitter": a random delay up to
+    ``backoff * 2**attempt``, capped at ``backoff_cap``.
+    """
+
+    def __init__(self, limiter: _AimdLimiter, breaker: _CircuitBreaker, read_retries: int = 2, backoff: float = 0.2, backoff_cap: float = 2.0) -> None:
+        self.limiter = limiter
+        self.breaker = breaker
+        self.read_retries = max(0, read_retries)
+        self.backoff = backoff
+        self.backoff_cap = backoff_cap
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def send(self, method: str, call: Callable[[], requests.Response]) -> requests.Response:
+        attempts = 1 + (self.read_retries if method == "GET" else 0)
+        attempt = 0
+        while True:
+            attempt += 1
+            resp = self._attempt(call, last=attempt == attempts)
+            if resp is not None and (attempt == attempts or resp.status_code not in _RETRYABLE_STATUS):
+                return resp
+            if resp is not None:
+                resp.close()  # hand the connection back to the pool before retrying
+            with self._lock:
+                self.retries += 1
+            time.sleep(random.uniform(0, min(self.backoff_cap, self.backoff * 2 ** (attempt - 1))))
+
+    def _attempt(self, call: Callable[[], requests.Response], last: bool) -> requests.Response | None:
+        """One request through the breaker and limiter; connection errors return None unless ``last``."""
+        _check_cancelled()
+        self.breaker.before_call()
+        try:
+            self.limiter.acquire()
+        except IrisUnavailableError:
+            self.breaker.abort_trial()
+            raise
+        start = time.perf_counter()
+        error: str | None = None
+        try:
+            resp = call()
+            if resp.status_code >= _SERVER_ERROR or resp.status_code in _RETRYABLE_STATUS:
+                error = f"HTTP {resp.status_code}"
+            return resp
+        except OSError as e:  # requests' exceptions derive from IOError
+            error = type(e).__name__
+            if last:
+                raise
+            return None
+        except Exception as e:  # e.g. a malformed response; not retried, but still a failed call
+            error = type(e).__name__
+            raise
+        finally:
+            self.limiter.release(time.perf_counter() - start, error is None)
+            self.breaker.record(error)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            retries = self.retries
+        return {"limiter": self.limiter.stats(), "breaker": self.breaker.stats(), "read_retries": self.read_retries, "retries": retries}
+
+
+_IRIS_GUARD = _IrisGuard(
+    _AimdLimiter(
+        max_limit=_env_int("IRIS_MAX_CONCURRENCY", 16),
+        latency_target=_env_float("IRIS_LATENCY_TARGET", 2.0),
+        queue_timeout=_env_float("IRIS_QUEUE_TIMEOUT", 60.0),
+    ),
+    _CircuitBreaker(threshold=_env_int("IRIS_BREAKER_THRESHOLD", 5), cooldown=_env_float("IRIS_BREAKER_COOLDOWN", 30.0)),
+    read_retries=_env_int("IRIS_READ_RETRIES", 2),
+)
+
+
+class _PooledTransport:
+    """Stand-in for the ``requests`` module used by ``dfir_iris_client.session``.
+
+    The client sends every call through module-level ``requests.get``/``requests.post``,
+    which opens a new connection each time. Routing them through one shared
+    ``requests.Session`` keeps TCP/TLS connections alive between tool calls, and lets
+    ``_IrisGuard`` limit, retry and short-circuit them. With a ``pool_size`` of 0 each
+    request still opens its own connection, but goes through the guard all the same.
+    """
+
+    def __init__(self, pool_size: int, guard: _IrisGuard | None = None) -> None:
+        self.pool_size = pool_size
+        self.guard = guard or _IRIS_GUARD
+        self._lock = threading.Lock()
+        self._http = self._new_http()
+
+    def __getattr__(self, name: str) -> Any:
+        # Everything else the client reads from the module (``exceptions``, ``packages``, ...).
+        return getattr(importlib.import_module("requests"), name)
+
+    def _new_http(self) -> requests.Session | None:
+        if self.pool_size <= 0:
+            return None
+        http: requests.Session = importlib.import_module("requests").Session()
+        adapter = importlib.import_module("requests.adapters").HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        http.mount("http://", adapter)
+        http.mount("https://", adapter)
+        return http
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self._send("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self._send("POST", url, **kwargs)
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        return self.guard.send(method, functools.partial(self._request, method, url, **kwargs))
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        start = time.perf_counter()
+        try:
+            http = self._http if self._http is not None else importlib.import_module("requests")
+            resp: requests.Response = http.request(method, url, **kwargs)
+        except Exception as e:
+            _METRICS.iris_call(method, url, time.perf_counter() - start, type(e).__name__)
+            raise
+        _METRICS.iris_call(method, url, time.perf_counter() - start, None if resp.ok else str(resp.status_code))
+        return resp
+
+    def reset(self) -> None:
+        """Drop all pooled connections (new ones are opened on demand)."""
+        with self._lock:
+            old, self._http = self._http, self._new_http()
+        if old is not None:
+            old.close()
+
+
+@dataclass
+class _PooledSession:
+    client: ClientSession
+    last_used: float
+    last_checked: float
+
+
+class _SessionPool:
+    """Process-wide registry of authenticated Iris sessions.
+
+    Creating a ``ClientSession`` costs two round-trips (API key check and version
+    check), so sessions are kept per (host, api key, ssl) and reused by every tool.
+    Sessions idle for longer than ``idle_timeout`` are evicted and sessions not used
+    for ``health_interval`` seconds are pinged before being handed out again.
+    A ``pool_size`` of 0 disables reuse: every call gets a new session and connection,
+    but its requests still pass through ``_IrisGuard``.
+    """
+
+    def __init__(self, pool_size: int = 10, idle_timeout: float = 300.0, health_interval: float = 60.0) -> None:
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.health_interval = health_interval
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str, bool], _PooledSession] = {}
+        self._transport: _PooledTransport | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.pool_size > 0
+
+    def acquire(self, host: str, api_key: str, verify_ssl: bool) -> ClientSession:
+        if not self.enabled:
+            self._install_transport()
+            return ClientSession(apikey=api_key, host=host, ssl_verify=verify_ssl)
+
+        key = (host, api_key, verify_ssl)
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            entry = self._entries.get(key)
+
+        if entry is not None and now - entry.last_checked >= self.health_interval:
+            if self._is_healthy(entry.client):
+                entry.last_checked = now
+            else:
+                with self._lock:
+                    if self._entries.get(key) is entry:
+                        del self._entries[key]
+                entry = None
+
+        if entry is None:
+            self._install_transport()
+            client = ClientSession(apikey=api_key, host=host, ssl_verify=verify_ssl)
+            with self._lock:
+                entry = self._entries.setdefault(key, _PooledSession(client, now, now))
+        entry.last_used = now
+        return entry.client
+
+    def _evict_idle(self, now: float) -> None:
+        stale = [k for k, e in self._entries.items() if now - e.last_used > self.idle_timeout]
+        for k in stale:
+            del self._entries[k]
+        if stale and not self._entries and self._transport is not None:
+            self._transport.reset()
+
+    @staticmethod
+    def _is_healthy(client: ClientSession) -> bool:
+        try:
+            resp = client.pi_get("api/ping", cid=1)
+            return not resp.is_error()
+        except Exception:
+            return False
+
+    def _install_transport(self) -> None:
+        if self._transport is None:
+            self._transport = _PooledTransport(self.pool_size)
+        module = importlib.import_module("dfir_iris_client.session")
+        if getattr(module, "requests", None) is not self._transport:
+            module.requests = self._transport  # type: ignore[attr-defined]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"enabled": self.enabled, "pool_size": self.pool_size, "sessions": len(self._entries)}
+
+    def close(self) -> None:
+        """Forget all sessions and hand the client its plain ``requests`` module back."""
+        with self._lock:
+            self._entries.clear()
+            transport, self._transport = self._transport, None
+        if transport is None:
+            return
+        transport.reset()
+        module = importlib.import_module("dfir_iris_client.session")
+        if getattr(module, "requests", None) is transport:
+            module.requests = importlib.import_module("requests")  # type: ignore[attr-defined]
+
+
+_SESSION_POOL = _SessionPool(
+    pool_size=_env_int("IRIS_POOL_SIZE", 10),
+    idle_timeout=_env_float("IRIS_POOL_IDLE_TIMEOUT", 300.0),
+    health_interval=_env_float("IRIS_POOL_HEALTHCHECK_INTERVAL", 60.0),
+)
 
 
 def get_iris_client() -> ClientSession:
     """
-    Initialize and return the DFIR Iris session.
+    Return a pooled DFIR Iris session.
     Reads configuration from environment variables.
     """
     api_key = os.environ.get("IRIS_API_KEY")
@@ -245,7 +1376,151 @@ def get_iris_client() -> ClientSession:
     if not host.startswith("http"):
         host = f"https://{host}"
 
-    return ClientSession(apikey=api_key, host=host, ssl_verify=verify_ssl)
+    _check_cancelled()
+    return _SESSION_POOL.acquire(host, api_key, verify_ssl)
+
+
+# -------------------------------
+# Async tool execution
+# -------------------------------
+
+
+class ToolCancelledError(RuntimeError):
+    """Raised inside a worker once the MCP request that started it was cancelled."""
+
+
+_CANCELLED: contextvars.ContextVar[threading.Event | None] = contextvars.ContextVar("iris_tool_cancelled", default=None)
+
+
+def _check_cancelled() -> None:
+    """Abort the current tool body if its MCP request has gone away."""
+    event = _CANCELLED.get()
+    if event is not None and event.is_set():
+        raise ToolCancelledError("Tool call cancelled by the client")
+
+
+def _parse_limits(spec: str) -> dict[str, int]:
+    """Parse ``name=n,name=n`` into a per-tool concurrency map."""
+    limits: dict[str, int] = {}
+    for part in spec.split(","):
+        name, _, value = part.partition("=")
+        if name.strip() and value.strip().isdigit():
+            limits[name.strip()] = int(value)
+    return limits
+
+
+class _ToolExecutor:
+    """Runs blocking tool bodies on a bounded worker pool.
+
+    Every Iris call goes through the synchronous ``dfir_iris_client``, so tools are
+    executed off the event loop to keep one slow request from stalling every other
+    client in ``--http`` mode. Each tool also gets its own semaphore so a burst of one
+    kind of call cannot occupy all workers.
+    """
+
+    def __init__(self, workers: int = 16, default_limit: int = 8, limits: dict[str, int] | None = None) -> None:
+        self.workers = max(1, workers)
+        self.default_limit = max(1, default_limit)
+        self.limits = dict(limits or {})
+        self._lock = threading.Lock()
+        self._pool: ThreadPoolExecutor | None = None
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]] = weakref.WeakKeyDictionary()
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="iris-tool")
+            return self._pool
+
+    def _semaphore(self, name: str) -> asyncio.Semaphore:
+        per_loop = self._semaphores.setdefault(asyncio.get_running_loop(), {})
+        if name not in per_loop:
+            per_loop[name] = asyncio.Semaphore(max(1, self.limits.get(name, self.default_limit)))
+        return per_loop[name]
+
+    async def run[T](self, name: str, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        cancelled = threading.Event()
+        async with self._semaphore(name):
+            call = functools.partial(contextvars.copy_context().run, self._invoke, cancelled, fn, *args, **kwargs)
+            try:
+                return await asyncio.get_running_loop().run_in_executor(self._executor(), call)
+            except asyncio.CancelledError:
+                # The worker thread cannot be interrupted, but it stops at its next Iris call.
+                cancelled.set()
+                raise
+
+    @staticmethod
+    def _invoke[T](cancelled: threading.Event, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        _CANCELLED.set(cancelled)
+        _check_cancelled()
+        return fn(*args, **kwargs)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+_TOOL_EXECUTOR = _ToolExecutor(
+    workers=_env_int("IRIS_TOOL_WORKERS", 16),
+    default_limit=_env_int("IRIS_TOOL_CONCURRENCY", 8),
+    limits=_parse_limits(os.environ.get("IRIS_TOOL_LIMITS", "")),
+)
+
+
+def _iris_tool[**P, R](limit: int | None = None) -> Callable[[Callable[P, R]], Callable[P, Coroutine[Any, Any, R]]]:
+    """Register a blocking Iris tool as an async MCP tool backed by the worker pool."""
+
+    def decorator(fn: Callable[P, R]) -> Callable[P, Coroutine[Any, Any, R]]:
+        if limit is not None:
+            _TOOL_EXECUTOR.limits.setdefault(fn.__name__, limit)
+
+        @functools.wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            name = fn.__name__
+            _METRICS.tool_started(name)
+            start = time.perf_counter()
+            failed = True
+            try:
+                result = await _TOOL_EXECUTOR.run(name, fn, *args, **kwargs)
+                failed = isinstance(result, str) and result.startswith("Error")
+                return result
+            finally:
+                _METRICS.tool_finished(name, time.perf_counter() - start, failed)
+
+        mcp.tool()(wrapper)
+        return wrapper
+
+    return decorator
+
+
+def _fan_out[T, R](fn: Callable[[T], R], items: Iterable[T], concurrency: int = 4) -> Iterator[tuple[T, R | Exception]]:
+    """Apply ``fn`` to ``items`` with bounded parallelism, yielding ``(item, result)`` in input order.
+
+    Failures are yielded as the raised exception instead of aborting the batch. At most
+    ``2 * concurrency`` items are in flight, so ``items`` may be a lazy stream of any size.
+    Workers inherit the caller's context and therefore its cancellation flag.
+    """
+    concurrency = max(1, concurrency)
+
+    def call(item: T) -> R | Exception:
+        try:
+            return fn(item)
+        except Exception as e:
+            return e
+
+    pending: deque[tuple[T, Future[R | Exception]]] = deque()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="iris-fanout") as pool:
+        for item in items:
+            _check_cancelled()
+            pending.append((item, pool.submit(contextvars.copy_context().run, call, item)))
+            if len(pending) >= 2 * concurrency:
+                head, future = pending.popleft()
+                yield head, future.result()
+        while pending:
+            head, future = pending.popleft()
+            yield head, future.result()
 
 
 def _get_catalog(kind: str) -> list[dict[str, str]]:
@@ -272,13 +1547,57 @@ def _get_catalog(kind: str) -> list[dict[str, str]]:
         "tlps": "tlp_levels",
     }
     key = aliases.get(normalized, normalized)
-    catalog = CATALOG.get(key)
+    catalog = types_catalog.CATALOG.get(key)
     if catalog is None:
-        available = ", ".join(sorted(CATALOG))
+        available = ", ".join(sorted(types_catalog.CATALOG))
         raise ValueError(f"Unknown catalog '{kind}'. Available: {available}")
     return catalog
 
 
+# Server reference tables (uri, name key, id key) backing the local catalogs for server-specific entries.
+_CATALOG_REFERENCES = {
+    "iocs": ("manage/ioc-types/list", "type_name", "type_id"),
+    "tlp_levels": ("manage/tlp/list", "tlp_name", "tlp_id"),
+    "assets": ("manage/asset-type/list", "asset_name", "asset_id"),
+    "analysis_statuses": ("manage/analysis-status/list", "name", "id"),
+    "task_statuses": ("manage/task-status/list", "status_name", "id"),
+}
+
+
+def _server_reference(session: ClientSession | None, kind: str) -> dict[str, int]:
+    """The server's (cached) name -> ID table for a catalog, or ``{}`` when it cannot be read."""
+    spec = _CATALOG_REFERENCES.get(kind)
+    if session is None or spec is None:
+        return {}
+    try:
+        return _reference_ids(session, *spec)
+    except Exception as e:
+        log.debug("No server reference table for %s: %s", kind, e)
+        return {}
+
+
+def _resolve_catalog_name(kind: str, value: Any, label: str, session: ClientSession | None = None) -> Any:
+    """Canonical catalog spelling of a name, looked up locally first.
+
+    Names missing from the local catalog are looked up in the server's reference table
+    (cached in ``_REFERENCES``) and resolved to its ID; numeric IDs are checked against
+    that table when it can be read. Raises ValueError with the closest names otherwise.
+    """
+    if isinstance(value, str):
+        value = value.strip()
+        if not value.isdigit():
+            index = types_catalog.CATALOG_INDEX[kind]
+            if (entry := index.lookup(value)) is not None:
+                return entry[index.name_key]
+            if (ref_id := _server_reference(session, kind).get(value.lower())) is not None:
+                return ref_id
+            return index.resolve(value, label)
+        value = int(value)
+    if isinstance(value, int) and (server := _server_reference(session, kind)) and value not in server.values():
+        raise ValueError(f"Unknown {label} ID {value} (not in the server's {_CATALOG_REFERENCES[kind][0]})")
+    return value
+
+
 @mcp.tool()
 def list_types(kind: str) -> list[dict[str, str]]:
     """Return a catalog of supported types/statuses (e.g., assets, iocs, severities)."""
@@ -288,129 +1607,831 @@ def list_types(kind: str) -> list[dict[str, str]]:
 @mcp.tool()
 def list_ioc_types() -> list[dict[str, str]]:
     """Return all supported IOC types (with optional validation hints)."""
-    return IOC_TYPES
+    return types_catalog.IOC_TYPES
 
 
 @mcp.tool()
 def list_asset_types() -> list[dict[str, str]]:
     """Return all supported asset types (with icon hints)."""
-    return ASSET_TYPES
+    return types_catalog.ASSET_TYPES
 
 
 @mcp.tool()
 def list_analysis_statuses() -> list[dict[str, str]]:
     """Return all analysis statuses used for assets/IOCs."""
-    return ANALYSIS_STATUSES
+    return types_catalog.ANALYSIS_STATUSES
 
 
 @mcp.tool()
 def list_alert_resolution_statuses() -> list[dict[str, str]]:
     """Return alert resolution statuses."""
-    return ALERT_RESOLUTION_STATUSES
+    return types_catalog.ALERT_RESOLUTION_STATUSES
 
 
 @mcp.tool()
 def list_alert_statuses() -> list[dict[str, str]]:
     """Return alert lifecycle statuses."""
-    return ALERT_STATUSES
+    return types_catalog.ALERT_STATUSES
 
 
 @mcp.tool()
 def list_task_statuses() -> list[dict[str, str]]:
     """Return task statuses."""
-    return TASK_STATUSES
+    return types_catalog.TASK_STATUSES
 
 
 @mcp.tool()
 def list_severities() -> list[dict[str, str]]:
     """Return severity levels."""
-    return SEVERITIES
+    return types_catalog.SEVERITIES
 
 
 @mcp.tool()
 def list_evidence_types() -> list[dict[str, str]]:
     """Return evidence types."""
-    return EVIDENCE_TYPES
+    return types_catalog.EVIDENCE_TYPES
 
 
 @mcp.tool()
 def list_event_categories() -> list[dict[str, str]]:
     """Return event categories."""
-    return EVENT_CATEGORIES
+    return types_catalog.EVENT_CATEGORIES
 
 
 @mcp.tool()
 def list_os_types() -> list[dict[str, str]]:
     """Return operating system types."""
-    return OS_TYPES
+    return types_catalog.OS_TYPES
 
 
 @mcp.tool()
 def list_tlp_levels() -> list[dict[str, str]]:
     """Return TLP levels."""
-    return TLP_LEVELS
+    return types_catalog.TLP_LEVELS
 
 
-def _list_cases(
-    customer_id: int | None = None,
-    case_name: str | None = None,
-    description: str | None = None,
-    case_status_id: int | None = None,
-    start_date: str | None = None,
-    end_date: str | None = None,
-) -> str:
-    try:
-        session = get_iris_client()
-        # Filter out None values
-        kwargs = {
-            "case_customer": customer_id,
-            "case_name": case_name,
-            "case_description": description,
-            "case_status_id": case_status_id,
-            "case_open_date_gt": start_date,
-            "case_open_date_lt": end_date,
-        }
-        filtered_kwargs = {k: v for k, v in kwargs.items() if v is not None}
+# -------------------------------
+# Customer directory cache
+# -------------------------------
 
-        cases = Case(session).list_cases(**filtered_kwargs)
-        data = _extract_data(cases, "Listing cases")
-        items = _ensure_list(data)
 
-        customer_lookup: dict[int, str] | None = None
+class _CustomerDirectory:
+    """Shared, TTL-bound copy of the customer list.
+
+    Customers change rarely but are needed by most case listings to turn IDs into
+    names. Fresh data is served from memory; once the TTL expires the stale copy is
+    still served while a background thread refreshes it, so only the very first call
+    (or the first after ``invalidate``) waits on the API. ``invalidate`` bumps a
+    generation counter so a fetch that was already in flight cannot reinstall the
+    list it read before the change.
+    """
+
+    def __init__(self, ttl: float = 300.0, min_reload_interval: float = 10.0) -> None:
+        self.ttl = ttl
+        self.min_reload_interval = min_reload_interval
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self._lock = threading.Lock()
+        self._items: list[Any] | None = None
+        self._by_id: dict[int, Any] = {}
+        self._by_name: dict[str, Any] = {}
+        self._loaded_at = 0.0
+        self._refreshing = False
+        self._generation = 0
+
+    def _load(self, session: ClientSession | None = None) -> list[Any]:
+        with self._lock:
+            generation = self._generation
+        session = session or get_iris_client()
+        resp = Customer(session).list_customers()
+        items = _ensure_list(_extract_data(resp, "Listing customers"))
+        by_id: dict[int, Any] = {}
+        by_name: dict[str, Any] = {}
+        for cust in items:
+            cid = _get_field(cust, "customer_id", "id")
+            name = _get_field(cust, "customer_name", "name")
+            if cid is not None:
+                by_id[int(cid)] = cust
+            if name:
+                by_name[str(name).lower()] = cust
+        with self._lock:
+            if generation != self._generation:
+                return items  # invalidated mid-fetch; the next read loads afresh
+            self._items, self._by_id, self._by_name = items, by_id, by_name
+            self._loaded_at = time.monotonic()
+            self.refreshes += 1
+        return items
+
+    def _background_refresh(self) -> None:
         try:
-            customers_resp = Customer(session).list_customers()
-            customers_data = _extract_data(customers_resp, "Listing customers")
-            if customers_data:
-                customer_lookup = {}
-                for cust in _ensure_list(customers_data):
-                    cid = _get_field(cust, "customer_id", "id")
-                    name = _get_field(cust, "customer_name", "name")
-                    if cid is not None and name:
-                        customer_lookup[int(cid)] = name
+            self._load()
         except Exception:
-            # If customer lookup fails, still return cases.
-            customer_lookup = None
+            pass  # keep serving the stale copy; the next read retries
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def items(self, session: ClientSession | None = None) -> list[Any]:
+        """Return the customer list, fetching it only when nothing is cached."""
+        with self._lock:
+            items = self._items
+            stale = items is not None and time.monotonic() - self._loaded_at > self.ttl
+            if items is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                if stale and not self._refreshing:
+                    self._refreshing = True
+                    threading.Thread(target=self._background_refresh, name="iris-customer-refresh", daemon=True).start()
+        if items is None:
+            items = self._load(session)
+        return items
+
+    def _reload_on_miss(self, session: ClientSession | None) -> bool:
+        """Reload once on a lookup miss unless the copy is only seconds old."""
+        with self._lock:
+            if time.monotonic() - self._loaded_at < self.min_reload_interval:
+                return False
+        self._load(session)
+        return True
+
+    def get(self, customer_id: int, session: ClientSession | None = None) -> Any:
+        self.items(session)
+        found = self._by_id.get(int(customer_id))
+        if found is None and self._reload_on_miss(session):
+            found = self._by_id.get(int(customer_id))
+        return found
+
+    def find(self, name: str, session: ClientSession | None = None) -> Any:
+        self.items(session)
+        found = self._by_name.get(name.lower())
+        if found is None and self._reload_on_miss(session):
+            found = self._by_name.get(name.lower())
+        return found
+
+    def names(self, session: ClientSession | None = None) -> dict[int, str]:
+        self.items(session)
+        return self.cached_names()
+
+    def cached_names(self) -> dict[int, str]:
+        """ID -> name for whatever is already cached; never touches the network."""
+        with self._lock:
+            by_id = self._by_id
+        return {cid: str(name) for cid, cust in by_id.items() if (name := _get_field(cust, "customer_name", "name"))}
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._items = None
+            self._by_id, self._by_name = {}, {}
+            self._loaded_at = 0.0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._items or []),
+                "hits": self.hits,
+                "misses": self.misses,
+                "refreshes": self.refreshes,
+                "hit_ratio": round(self.hits / total, 3) if total else None,
+                "age_seconds": round(time.monotonic() - self._loaded_at, 1) if self._items is not None else None,
+                "ttl_seconds": self.ttl,
+            }
+
+
+_CUSTOMER_DIRECTORY = _CustomerDirectory(ttl=_env_float("IRIS_CUSTOMER_CACHE_TTL", 300.0))
+
+
+class _ReferenceCache:
+    """TTL-bound copies of ``manage/*/list`` reference tables (IOC types, TLPs, users, ...).
+
+    These tables change only when an administrator edits them, yet bulk imports and the
+    prewarm step read them on every call; one copy per URI is shared by all tools.
+    """
 
-        if not items:
-            return "No cases found."
+    def __init__(self, ttl: float = 600.0) -> None:
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._tables: dict[str, tuple[float, list[Any]]] = {}
+
+    def rows(self, session: ClientSession, uri: str) -> list[Any]:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._tables.get(uri)
+            if cached is not None and now - cached[0] <= self.ttl:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+        rows = _ensure_list(_extract_data(session.pi_get(uri, cid=1), f"Listing {uri}"))
+        with self._lock:
+            self._tables[uri] = (time.monotonic(), rows)
+        return rows
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"tables": sorted(self._tables), "hits": self.hits, "misses": self.misses, "ttl_seconds": self.ttl}
+
+
+_REFERENCES = _ReferenceCache(ttl=_env_float("IRIS_REFERENCE_CACHE_TTL", 600.0))
+
+
+def _cache_stats() -> dict[str, Any]:
+    return {
+        "customers": _CUSTOMER_DIRECTORY.stats(),
+        "references": _REFERENCES.stats(),
+        "collections": _COLLECTIONS.stats(),
+        "note_directories": _NOTE_DIRECTORIES.stats(),
+        "method_plans": _METHOD_PLANS.stats(),
+        "sessions": _SESSION_POOL.stats(),
+        "mirror": _MIRROR.stats(),
+        "ioc_index": _IOC_INDEX.stats(),
+        "note_index": _NOTE_INDEX.stats(),
+        "responses": _RESPONSES.stats(),
+        "changes": _CHANGES.stats(),
+        "case_members": _CASE_MEMBERS.stats(),
+    }
+
+
+@mcp.tool()
+def cache_stats() -> dict[str, Any]:
+    """Return hit/miss counters for the server-side caches."""
+    return _cache_stats()
+
+
+@mcp.tool()
+def server_stats() -> dict[str, Any]:
+    """Return per-tool and per-Iris-endpoint latency (p50/p95/p99), error and in-flight counts, plus cache counters."""
+    return {**_METRICS.snapshot(), "caches": _cache_stats(), "backend": _IRIS_GUARD.stats()}
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics_endpoint(_request: Request) -> Response:
+    """Prometheus text exposition of the same data as ``server_stats`` (HTTP mode only)."""
+    return PlainTextResponse(_METRICS.render(_cache_stats()), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+# -------------------------------
+# Collection snapshots and pagination
+# -------------------------------
+
+
+def _sort_value(value: Any) -> tuple[int, Any]:
+    """Order numbers before strings before missing values without mixed-type comparisons."""
+    if value is None:
+        return (2, "")
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return (0, value)
+    text = str(value)
+    return (0, int(text)) if text.isdigit() else (1, text)
+
+
+def _sort_key(endpoint: str, *fields: tuple[str, ...]) -> Callable[[Any], tuple[tuple[int, Any], ...]]:
+    def key(item: Any) -> tuple[tuple[int, Any], ...]:
+        get = _row_reader(endpoint, item)
+        return tuple(_sort_value(get(*names)) for names in fields)
+
+    return key
+
+
+@dataclass
+class _Snapshot:
+    snapshot_id: str
+    kind: str
+    key: tuple[Any, ...]
+    items: list[Any]
+    fetched_at: float
+
+
+class _CollectionCache:
+    """Sorted snapshots of fetched collections, so later pages are served from memory.
+
+    Each fetch is stored under a random snapshot id that cursors point at; pages of
+    one listing therefore stay consistent even if Iris changes in between. The most
+    recent snapshot per (kind, key) is also reused for plain ``offset`` paging while it
+    is younger than ``ttl``. Writes made through this server drop that "latest" link.
+    """
+
+    def __init__(self, ttl: float = 120.0, max_entries: int = 32) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._snapshots: OrderedDict[str, _Snapshot] = OrderedDict()
+        self._latest: dict[tuple[str, tuple[Any, ...]], str] = {}
+
+    def store(self, kind: str, key: tuple[Any, ...], items: list[Any]) -> _Snapshot:
+        snap = _Snapshot(secrets.token_hex(6), kind, key, items, time.monotonic())
+        with self._lock:
+            self._snapshots[snap.snapshot_id] = snap
+            self._latest[(kind, key)] = snap.snapshot_id
+            while len(self._snapshots) > self.max_entries:
+                old_id, old = self._snapshots.popitem(last=False)
+                if self._latest.get((old.kind, old.key)) == old_id:
+                    del self._latest[(old.kind, old.key)]
+        return snap
+
+    def get(self, snapshot_id: str) -> _Snapshot | None:
+        with self._lock:
+            snap = self._snapshots.get(snapshot_id)
+            if snap is not None:
+                self._snapshots.move_to_end(snapshot_id)
+                self.hits += 1
+            else:
+                self.misses += 1
+            return snap
+
+    def latest(self, kind: str, key: tuple[Any, ...]) -> _Snapshot | None:
+        with self._lock:
+            snap_id = self._latest.get((kind, key))
+            snap = self._snapshots.get(snap_id) if snap_id else None
+            if snap is None or time.monotonic() - snap.fetched_at > self.ttl:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return snap
+
+    def invalidate(self, kind: str, case_id: int | None = None) -> None:
+        """Forget the latest snapshot of ``kind`` (for one case, or all when case_id is None)."""
+        with self._lock:
+            for k in [k for k in self._latest if k[0] == kind and (case_id is None or (k[1] and k[1][0] == case_id))]:
+                del self._latest[k]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshots.clear()
+            self._latest.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "snapshots": len(self._snapshots),
+                "rows": sum(len(s.items) for s in self._snapshots.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "ttl_seconds": self.ttl,
+            }
+
+
+_COLLECTIONS = _CollectionCache(
+    ttl=_env_float("IRIS_COLLECTION_CACHE_TTL", 120.0),
+    max_entries=_env_int("IRIS_COLLECTION_CACHE_ENTRIES", 32),
+)
+
+
+def _encode_cursor(snapshot_id: str, offset: int) -> str:
+    return base64.urlsafe_b64encode(f"{snapshot_id}:{offset}".encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[str, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        snapshot_id, _, offset = raw.partition(":")
+        position = int(offset)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor '{cursor}'") from e
+    if position < 0:
+        raise ValueError(f"Invalid cursor '{cursor}': negative offset")
+    return snapshot_id, position
+
+
+@dataclass
+class _Page:
+    items: list[Any]
+    start: int
+    total: int
+    next_cursor: str | None
+    paged: bool
+    snapshot_id: str = ""
+
+    def footer(self) -> str:
+        """Position line for paged listings (empty when the whole collection was returned)."""
+        if not self.paged:
+            return ""
+        shown = (
+            f"Showing {self.start + 1}-{self.start + len(self.items)} of {self.total}." if self.items else f"No rows at offset {self.start} of {self.total}."
+        )
+        return f"{shown} Next cursor: {self.next_cursor}" if self.next_cursor else f"{shown} End of list."
+
+
+def _paginate(
+    kind: str,
+    key: tuple[Any, ...],
+    fetch: Callable[[], list[Any]],
+    sort_key: Callable[[Any], Any],
+    *,
+    limit: int | None = None,
+    offset: int = 0,
+    cursor: str | None = None,
+) -> _Page:
+    """Return one page of a collection, fetching from Iris only when no usable snapshot exists."""
+    snap = None
+    offset = max(0, offset)
+    if cursor:
+        snapshot_id, offset = _decode_cursor(cursor)
+        snap = _COLLECTIONS.get(snapshot_id)
+        if snap is not None and (snap.kind, snap.key) != (kind, key):
+            raise ValueError("Cursor belongs to a different listing")
+    elif offset:
+        snap = _COLLECTIONS.latest(kind, key)
+    if snap is None:
+        # Expired cursors fall back to a fresh fetch at the same offset.
+        snap = _COLLECTIONS.store(kind, key, sorted(fetch(), key=sort_key))
+    total = len(snap.items)
+    if cursor and offset and offset >= total:
+        raise ValueError(f"Invalid cursor '{cursor}': offset {offset} is past the end of the listing ({total} rows); start again without a cursor")
+    end = total if limit is None else min(total, offset + max(0, limit))
+    next_cursor = _encode_cursor(snap.snapshot_id, end) if end < total else None
+    return _Page(snap.items[offset:end], offset, total, next_cursor, paged=limit is not None or offset > 0 or bool(cursor), snapshot_id=snap.snapshot_id)
+
+
+# -------------------------------
+# Response budget
+# -------------------------------
+
+_UTF8_MAX_BYTES = 4
+_UTF8_CONTINUATION = 0x80  # 10xxxxxx
+
+
+class _ResponseStore:
+    """LRU of response remainders that did not fit the byte budget, bounded by total bytes.
+
+    Text over the budget is cut (at a line break when possible, never inside a UTF-8
+    sequence); the rest is kept here under a random id so ``read_more`` can serve the
+    next chunks without asking Iris again. Remainders larger than the whole store are
+    not kept.
+    """
+
+    def __init__(self, max_bytes: int = 8 << 20) -> None:
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+
+    def put(self, data: bytes) -> str | None:
+        if len(data) > self.max_bytes:
+            return None
+        key = secrets.token_hex(6)
+        with self._lock:
+            self._entries[key] = data
+            self._bytes += len(data)
+            while self._bytes > self.max_bytes:
+                _, old = self._entries.popitem(last=False)
+                self._bytes -= len(old)
+                self.evictions += 1
+        return key
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return data
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_RESPONSE_MAX_BYTES = _env_int("IRIS_RESPONSE_MAX_BYTES", 64 << 10)
+_RESPONSES = _ResponseStore(max_bytes=_env_int("IRIS_RESPONSE_CACHE_BYTES", 8 << 20))
+
+
+def _cut(data: bytes, start: int, budget: int) -> int:
+    """End offset of the chunk of ``data`` starting at ``start`` that fits ``budget`` bytes."""
+    end = start + budget
+    if end >= len(data):
+        return len(data)
+    # Prefer a line break in the second half of the chunk.
+    newline = data.rfind(b"\n", start + budget // 2, end)
+    if newline != -1:
+        return newline + 1
+    while end > start and data[end] & 0xC0 == _UTF8_CONTINUATION:
+        end -= 1
+    return end if end > start else start + budget
+
+
+def _chunk(data: bytes, start: int, budget: int, key: str | None) -> str:
+    end = _cut(data, start, budget)
+    text = data[start:end].decode(errors="replace")
+    if end >= len(data):
+        return text
+    if key is None:
+        return f"{text}\n[Truncated: response exceeds {len(data)} bytes. Narrow the request (limit/offset/filter_text) to see the rest.]"
+    handle = _encode_cursor(key, end)
+    return f'{text}\n[Truncated at byte {end} of {len(data)}. Call read_more(handle="{handle}") for the next part.]'
+
+
+def _budget(max_bytes: int | None) -> int:
+    """The byte budget for a response; 0 or less disables it, positive budgets fit at least one character."""
+    budget = _RESPONSE_MAX_BYTES if max_bytes is None else max_bytes
+    return budget if budget <= 0 else max(budget, _UTF8_MAX_BYTES)
+
+
+def _bounded(text: str, max_bytes: int | None = None) -> str:
+    """Return ``text`` unchanged when it fits the byte budget, else its first chunk plus a continuation handle."""
+    budget = _budget(max_bytes)
+    if budget <= 0 or len(text) * _UTF8_MAX_BYTES <= budget:
+        return text
+    data = text.encode()
+    if len(data) <= budget:
+        return text
+    return _chunk(data, 0, budget, _RESPONSES.put(data))
+
+
+def _bounded_page(records: Iterable[_Record], page: _Page, max_bytes: int | None = None) -> dict[str, Any]:
+    """``_page_payload`` trimmed to the rows that fit the byte budget; ``next_cursor`` continues from the snapshot."""
+    payload = _page_payload(records, page)
+    budget = _budget(max_bytes)
+    if budget <= 0 or len(json.dumps(payload, default=str)) <= budget:
+        return payload
+    size, keep = len(json.dumps({**payload, "items": []}, default=str)), 0
+    for item in payload["items"]:
+        size += len(json.dumps(item, default=str)) + 2
+        if size > budget and keep:
+            break
+        keep += 1
+    if keep < len(payload["items"]):
+        payload["items"] = payload["items"][:keep]
+        payload["next_cursor"] = _encode_cursor(page.snapshot_id, page.start + keep)
+    return payload
+
+
+def _read_more(handle: str, max_bytes: int | None = None) -> str:
+    try:
+        key, start = _decode_cursor(handle)
+        data = _RESPONSES.get(key)
+        if data is None or not 0 <= start <= len(data):
+            return "Error reading more: the handle expired or is unknown; call the original tool again (with limit/offset to narrow it)."
+        budget = _budget(max_bytes)
+        return _chunk(data, start, budget if budget > 0 else len(data), key)
+    except Exception as e:
+        return f"Error reading more: {e!s}"
+
+
+@mcp.tool()
+def read_more(handle: str, max_bytes: int | None = None) -> str:
+    """Return the next part of a truncated response.
+
+    Responses over `IRIS_RESPONSE_MAX_BYTES` end with a `read_more(handle=...)` hint; the rest is
+    kept server-side for a while, so following the handle does not query Iris again.
+    """
+    return _read_more(handle, max_bytes)
+
+
+# -------------------------------
+# Local mirror
+# -------------------------------
+
+# Cheap endpoints returning only ``{"object_state", "object_last_update"}`` for a collection.
+_MIRROR_STATE_URIS = {
+    "iocs": "case/ioc/state",
+    "assets": "case/assets/state",
+    "events": "case/timeline/state",
+    "evidences": "case/evidences/state",
+    "tasks": "case/tasks/state",
+}
+
+
+def _row_text(item: Any) -> str:
+    """Case-folded text of a row's values, used for ``filter_text`` matching."""
+    values = item.values() if isinstance(item, dict) else (item,)
+    return " ".join(str(v) for v in values if v is not None).casefold()
+
+
+def _filter_rows(items: list[Any], filter_text: str | None) -> list[Any]:
+    if not filter_text:
+        return items
+    needle = filter_text.casefold()
+    return [item for item in items if needle in _row_text(item)]
 
-        result = "Cases:\n"
-        for case in items:
-            cid = _get_field(case, "case_id", "id", "cid")
-            name = _get_field(case, "case_name", "name")
-            customer = _format_customer(
-                _get_field(case, "case_customer", "customer", "customer_id", "case_customer_id"),
-                customer_lookup,
+
+class _CaseMirror:
+    """Optional on-disk SQLite copy of per-case collections, synced by ``object_state``.
+
+    Every case gets its own database under ``<root>/<host>/case-<id>.sqlite3``. Before a
+    collection is served, Iris is asked for its ``state`` only; the full list is refetched
+    when ``object_state`` moved, otherwise rows (and ``filter_text`` matches) are read
+    from SQLite. Collections without a usable state endpoint bypass the mirror. At most
+    ``max_open`` databases stay open; the least recently used one is closed to make room.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS collections (
+            kind TEXT PRIMARY KEY, object_state TEXT NOT NULL, object_last_update TEXT, synced_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS rows (
+            kind TEXT NOT NULL, pos INTEGER NOT NULL, payload TEXT NOT NULL, search TEXT NOT NULL, PRIMARY KEY (kind, pos)
+        );
+    """
+
+    def __init__(self, root: str | None, max_open: int = 64) -> None:
+        self.root = root
+        self.max_open = max(1, max_open)
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self._lock = threading.Lock()
+        self._dbs: OrderedDict[tuple[str, int], tuple[sqlite3.Connection, threading.Lock]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.root)
+
+    def _db(self, key: tuple[str, int]) -> tuple[sqlite3.Connection, threading.Lock]:
+        evicted = []
+        with self._lock:
+            entry = self._dbs.get(key)
+            if entry is not None:
+                self._dbs.move_to_end(key)
+                return entry
+            assert self.root is not None
+            folder = os.path.join(self.root, "".join(c if c.isalnum() or c in "-." else "_" for c in key[0]))
+            os.makedirs(folder, exist_ok=True)
+            conn = sqlite3.connect(os.path.join(folder, f"case-{key[1]}.sqlite3"), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self._SCHEMA)
+            entry = self._dbs[key] = (conn, threading.Lock())
+            while len(self._dbs) > self.max_open:
+                evicted.append(self._dbs.popitem(last=False)[1])
+        for old_conn, old_lock in evicted:
+            with old_lock:  # wait for a caller still using it
+                old_conn.close()
+        return entry
+
+    @contextlib.contextmanager
+    def _connection(self, case_id: int) -> Iterator[sqlite3.Connection]:
+        """Hold a case's connection exclusively, reopening it if it was evicted meanwhile."""
+        host = urlsplit(os.environ.get("IRIS_HOST", "")).netloc or os.environ.get("IRIS_HOST", "default")
+        key = (host, case_id)
+        while True:
+            entry = self._db(key)
+            with entry[1]:
+                with self._lock:
+                    current = self._dbs.get(key) is entry
+                if current:
+                    yield entry[0]
+                    return
+
+    @staticmethod
+    def _remote_state(session: Any, case_id: int, kind: str) -> tuple[str, Any] | None:
+        try:
+            data = _extract_data(session.pi_get(_MIRROR_STATE_URIS[kind], cid=case_id), f"Getting {kind} state for case {case_id}")
+        except Exception as e:
+            log.debug("No %s state for case %s: %s", kind, case_id, e)
+            return None
+        state = _get_field(data, "object_state") if isinstance(data, dict) else None
+        return None if state is None else (str(state), _get_field(data, "object_last_update"))
+
+    def rows(self, session: Any, case_id: int, kind: str, fetch: Callable[[], list[Any]], filter_text: str | None = None) -> list[Any]:
+        """Return the collection (optionally filtered), refetching only when its state changed."""
+        remote = self._remote_state(session, case_id, kind) if kind in _MIRROR_STATE_URIS else None
+        if remote is None:
+            with self._lock:
+                self.bypassed += 1
+            return _filter_rows(fetch(), filter_text)
+        with self._connection(case_id) as conn:
+            stored = conn.execute("SELECT object_state FROM collections WHERE kind = ?", (kind,)).fetchone()
+            if stored is not None and stored[0] == remote[0]:
+                if filter_text:
+                    cur = conn.execute("SELECT payload FROM rows WHERE kind = ? AND instr(search, ?) ORDER BY pos", (kind, filter_text.casefold()))
+                else:
+                    cur = conn.execute("SELECT payload FROM rows WHERE kind = ? ORDER BY pos", (kind,))
+                items = [json.loads(payload) for (payload,) in cur]
+                with self._lock:
+                    self.hits += 1
+                return items
+        items = fetch()
+        with self._connection(case_id) as conn, conn:
+            conn.execute("DELETE FROM rows WHERE kind = ?", (kind,))
+            conn.executemany(
+                "INSERT INTO rows (kind, pos, payload, search) VALUES (?, ?, ?, ?)",
+                ((kind, pos, json.dumps(item, default=str), _row_text(item)) for pos, item in enumerate(items)),
             )
-            status = _get_field(case, "case_status_id", "status_id", "status")
-            result += f"- ID: {cid}, Name: {name}, Customer: {customer}, Status: {status}\n"
+            conn.execute("INSERT OR REPLACE INTO collections VALUES (?, ?, ?, ?)", (kind, remote[0], remote[1], time.time()))
+        with self._lock:
+            self.misses += 1
+        return _filter_rows(items, filter_text)
 
-        return result
+    def close(self) -> None:
+        with self._lock:
+            for conn, _ in self._dbs.values():
+                conn.close()
+            self._dbs.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"enabled": self.enabled, "cases": len(self._dbs), "hits": self.hits, "misses": self.misses, "bypassed": self.bypassed}
+
+
+_MIRROR = _CaseMirror(os.environ.get("IRIS_MIRROR_DIR") or None, max_open=_env_int("IRIS_MIRROR_MAX_OPEN", 64))
+
+
+def _collection_fetchers(case_obj: Any, case_id: int) -> dict[str, Callable[[], list[Any]]]:
+    """Plain (unmirrored) fetches of a case's collections, keyed by their ``_MIRROR_STATE_URIS`` kind."""
+
+    def tasks() -> list[Any]:
+        data = _extract_data(case_obj.list_tasks(cid=case_id), f"Listing tasks for case {case_id}")
+        return list(data["tasks"] or []) if isinstance(data, dict) and "tasks" in data else _ensure_list(data)
+
+    return {
+        "assets": lambda: _ensure_list(_extract_data(case_obj.list_assets(cid=case_id), f"Listing assets for case {case_id}")),
+        "iocs": lambda: _ensure_list(_extract_data(case_obj.list_iocs(cid=case_id), f"Listing IOCs for case {case_id}")),
+        "events": lambda: _ensure_list(_extract_data(case_obj.list_events(cid=case_id), f"Listing events for case {case_id}")),
+        "evidences": lambda: _ensure_list(_extract_data(case_obj.list_evidences(cid=case_id), f"Listing evidence for case {case_id}")),
+        "tasks": tasks,
+    }
+
+
+def _mirrored(session: Any, case_id: int, kind: str, fetch: Callable[[], list[Any]], filter_text: str | None = None) -> Callable[[], list[Any]]:
+    """Wrap a collection fetch so it goes through the local mirror when one is configured."""
+    if _MIRROR.enabled:
+        return lambda: _MIRROR.rows(session, case_id, kind, fetch, filter_text)
+    return lambda: _filter_rows(fetch(), filter_text)
+
+
+def _list_cases(
+    customer_id: int | None = None,
+    case_name: str | None = None,
+    description: str | None = None,
+    case_status_id: int | None = None,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    limit: int | None = None,
+    offset: int = 0,
+    cursor: str | None = None,
+    output: OutputFormat = "text",
+) -> str | dict[str, Any]:
+    try:
+        session = get_iris_client()
+        # Filter out None values
+        kwargs = {
+            "case_customer": customer_id,
+            "case_name": case_name,
+            "case_description": description,
+            "case_status_id": case_status_id,
+            "case_open_date_gt": start_date,
+            "case_open_date_lt": end_date,
+        }
+        filtered_kwargs = {k: v for k, v in kwargs.items() if v is not None}
+
+        def fetch() -> list[Any]:
+            cases = Case(session).list_cases(**filtered_kwargs)
+            return _ensure_list(_extract_data(cases, "Listing cases"))
+
+        page = _paginate(
+            "cases",
+            tuple(sorted(filtered_kwargs.items())),
+            fetch,
+            _sort_key("cases", ("case_id", "id", "cid")),
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+        customer_lookup: dict[int, str] | None = None
+        try:
+            customer_lookup = _CUSTOMER_DIRECTORY.names(session)
+        except Exception:
+            # If customer lookup fails, still return cases.
+            customer_lookup = None
+
+        records = [CaseRecord.from_payload(case, customer_lookup) for case in page.items]
+        if output == "json":
+            return _page_payload(records, page)
+        if not page.total:
+            return "No cases found."
+        return _render("Cases:", map(_case_line, records), page.footer())
     except Exception as e:
         return f"Error listing cases: {e!s}"
 
 
-@mcp.tool()
+@_iris_tool()
 def list_cases(
     customer_id: int | None = None,
     case_name: str | None = None,
@@ -418,14 +2439,22 @@ def list_cases(
     case_status_id: int | None = None,
     start_date: str | None = None,
     end_date: str | None = None,
-) -> str:
+    limit: int | None = None,
+    offset: int = 0,
+    cursor: str | None = None,
+    output: OutputFormat = "text",
+) -> str | dict[str, Any]:
     """
     List cases with optional filtering.
+
+    Results are sorted by case ID. Pass `limit` (and `offset`) to page through them; follow-up
+    pages requested with the returned `cursor` are served from the server-side snapshot.
+    With `output="json"` the page is returned as `{"items", "total", "offset", "next_cursor"}`.
     """
-    return _list_cases(customer_id, case_name, description, case_status_id, start_date, end_date)
+    return _list_cases(customer_id, case_name, description, case_status_id, start_date, end_date, limit, offset, cursor, output)
 
 
-def _get_case(case_id: int) -> str:
+def _get_case(case_id: int, output: OutputFormat = "text") -> str | dict[str, Any]:
     try:
         session = get_iris_client()
         case = Case(session).get_case(cid=case_id)
@@ -434,25 +2463,142 @@ def _get_case(case_id: int) -> str:
         if not data:
             return f"Case with ID {case_id} not found."
 
+        record = CaseRecord.from_payload(data)
+        if output == "json":
+            return record.to_dict()
         return (
             "Case Details:\n"
-            f"ID: {_get_field(data, 'case_id', 'id', 'cid')}\n"
-            f"Name: {_get_field(data, 'case_name', 'name')}\n"
-            f"Description: {_get_field(data, 'case_description', 'description')}\n"
-            f"Customer: {_format_customer(_get_field(data, 'case_customer', 'customer', 'customer_id', 'case_customer_id'))}\n"
-            f"Status: {_get_field(data, 'case_status_id', 'status_id', 'status')}\n"
-            f"Opened: {_get_field(data, 'case_open_date', 'open_date')}"
+            f"ID: {record.id}\n"
+            f"Name: {record.name}\n"
+            f"Description: {record.description}\n"
+            f"Customer: {record.customer_label}\n"
+            f"Status: {record.status}\n"
+            f"Opened: {record.open_date}"
         )
     except Exception as e:
         return f"Error getting case {case_id}: {e!s}"
 
 
-@mcp.tool()
-def get_case(case_id: int) -> str:
+@_iris_tool()
+def get_case(case_id: int, output: OutputFormat = "text") -> str | dict[str, Any]:
+    """
+    Get detailed information about a specific case (`output="json"` returns the normalized record).
+    """
+    return _get_case(case_id, output)
+
+
+_OVERVIEW_SUMMARY_CHARS = 2000
+
+
+def _note_rows(directories: list[Any]) -> list[Any]:
+    """Flatten the notes embedded in a note directory listing."""
+    return [note for directory in directories if isinstance(directory, dict) for note in directory.get("notes") or []]
+
+
+def _get_case_overview(case_id: int, recent: int = 5, output: OutputFormat = "text") -> str | dict[str, Any]:
+    try:
+        session = get_iris_client()
+        case_obj = Case(session)
+        recent = min(max(1, recent), 20)
+        collections = _collection_fetchers(case_obj, case_id)
+        fetchers: dict[str, Callable[[], Any]] = {
+            "case": lambda: _extract_data(case_obj.get_case(cid=case_id), f"Getting case {case_id}"),
+            "summary": lambda: _extract_data(case_obj.get_summary(cid=case_id), f"Getting summary for case {case_id}"),
+            "notes": lambda: _note_rows(_ensure_list(_extract_data(case_obj.list_notes_directories(cid=case_id), f"Listing notes for case {case_id}"))),
+            **{kind: _mirrored(session, case_id, kind, fetch) for kind, fetch in collections.items()},
+        }
+        # One round-trip per source, all in flight at once over the shared pooled session.
+        results = dict(_fan_out(lambda kind: fetchers[kind](), fetchers, concurrency=len(fetchers)))
+
+        if not isinstance(results["iocs"], Exception):
+            _CASE_MEMBERS.load(case_id, "iocs", _IOC_INDEX.index_case(case_id, results["iocs"]))
+        if not isinstance(results["assets"], Exception):
+            _CASE_MEMBERS.load(case_id, "assets", results["assets"])
+        case_data = results.pop("case")
+        if isinstance(case_data, Exception):
+            raise case_data
+        if not case_data:
+            return f"Case with ID {case_id} not found."
+        errors = {kind: str(value) for kind, value in results.items() if isinstance(value, Exception)}
+        summary_data = results.pop("summary")
+        summary = None if isinstance(summary_data, Exception) else _get_field(summary_data, "case_description", "summary", "content")
+        if isinstance(summary, str) and len(summary) > _OVERVIEW_SUMMARY_CHARS:
+            summary = summary[:_OVERVIEW_SUMMARY_CHARS] + "…"
+
+        newest_first = {
+            "events": _sort_key("events", ("event_date", "event_date_wtz", "date_time", "datetime"), ("event_id", "id")),
+            "iocs": _sort_key("iocs", ("ioc_id", "id")),
+            "assets": _sort_key("assets", ("asset_id", "id")),
+            "evidences": _sort_key("evidences", ("evidence_id", "id")),
+            "tasks": _sort_key("tasks", ("task_id", "id")),
+            "notes": _sort_key("notes", ("note_id", "id")),
+        }
+        counts: dict[str, int | None] = {}
+        latest: dict[str, list[Any]] = {}
+        for kind, key in newest_first.items():
+            rows = results[kind]
+            if isinstance(rows, Exception):
+                counts[kind] = None
+                continue
+            counts[kind] = len(rows)
+            latest[kind] = sorted(rows, key=key, reverse=True)[:recent]
+
+        record = CaseRecord.from_payload(case_data)
+        records: dict[str, list[Any]] = {
+            "events": [EventRecord.from_payload(r) for r in latest.get("events", [])],
+            "iocs": [IocRecord.from_payload(r) for r in latest.get("iocs", [])],
+            "assets": [AssetRecord.from_payload(r) for r in latest.get("assets", [])],
+            "evidences": [EvidenceRecord.from_payload(r) for r in latest.get("evidences", [])],
+            "tasks": [TaskRecord.from_payload(r) for r in latest.get("tasks", [])],
+        }
+        notes = [{"id": _get_field(n, "note_id", "id"), "title": _get_field(n, "note_title", "title")} for n in latest.get("notes", [])]
+        overview = {
+            "case": record.to_dict(),
+            "summary": summary,
+            "counts": counts,
+            "recent": {**{kind: [r.to_dict() for r in rows] for kind, rows in records.items()}, "notes": notes},
+            "errors": errors,
+        }
+        return overview if output == "json" else _render_case_overview(record, records, overview)
+    except Exception as e:
+        return f"Error getting overview for case {case_id}: {e!s}"
+
+
+def _render_case_overview(record: CaseRecord, records: dict[str, list[Any]], overview: dict[str, Any]) -> str:
+    labels = {"iocs": "IOCs", "evidences": "evidence"}
+    lines = [
+        f"Case Overview: {record.name} (ID {record.id})",
+        f"Customer: {record.customer_label}, Status: {record.status}, Opened: {record.open_date}",
+        "Counts: " + ", ".join(f"{labels.get(kind, kind)} {'?' if n is None else n}" for kind, n in overview["counts"].items()),
+    ]
+    if overview["summary"]:
+        lines += ["", "Summary:", str(overview["summary"])]
+    renderers: dict[str, Callable[[Any], str]] = {
+        "events": _event_line,
+        "iocs": _ioc_line,
+        "assets": _asset_line,
+        "evidences": _evidence_line,
+        "tasks": _task_line,
+    }
+    for kind, rows in records.items():
+        if rows:
+            lines += ["", f"Recent {labels.get(kind, kind)}:", *map(renderers[kind], rows)]
+    if notes := overview["recent"]["notes"]:
+        lines += ["", "Recent notes:", *(f"- ID: {n['id']}, Title: {n['title']}" for n in notes)]
+    if errors := overview["errors"]:
+        lines += ["", "Unavailable:", *(f"- {kind}: {message}" for kind, message in errors.items())]
+    return "\n".join(lines)
+
+
+@_iris_tool()
+def get_case_overview(case_id: int, recent: int = 5, output: OutputFormat = "text") -> str | dict[str, Any]:
     """
-    Get detailed information about a specific case.
+    Orient on a case in one call: details, summary text, per-collection counts and the
+    `recent` newest assets, IOCs, events, evidence, tasks and notes (max 20 each).
+
+    All sources are fetched concurrently; sections that fail are listed under "Unavailable".
     """
-    return _get_case(case_id)
+    return _get_case_overview(case_id, recent, output)
 
 
 def _create_case(name: str, customer_id: int, description: str = "", soc_id: str = "", classification_id: int | None = None) -> str:
@@ -476,12 +2622,13 @@ def _create_case(name: str, customer_id: int, description: str = "", soc_id: str
         created = _extract_data(new_case, "Creating case")
         if not created:
             return "Failed to create case."
+        _COLLECTIONS.invalidate("cases")
         return f"Case created successfully. ID: {_get_field(created, 'case_id', 'id', 'cid')}"
     except Exception as e:
         return f"Error creating case: {e!s}"
 
 
-@mcp.tool()
+@_iris_tool()
 def create_case(
     name: str,
     customer_id: int,
@@ -526,7 +2673,7 @@ def _create_alert(
         return f"Error creating alert: {e!s}"
 
 
-@mcp.tool()
+@_iris_tool()
 def create_alert(
     title: str,
     description: str,
@@ -549,40 +2696,295 @@ def _create_customer(name: str, description: str | None = None, sla: str | None
         admin_handler = AdminHelper(session)
         resp = admin_handler.add_customer(customer_name=name, customer_description=description, customer_sla=sla)
         data = _extract_data(resp, "Creating customer")
+        _CUSTOMER_DIRECTORY.invalidate()
         cid = _get_field(data, "customer_id", "id")
         return f"Customer created successfully. ID: {cid}"
     except Exception as e:
         return f"Error creating customer: {e!s}"
 
 
-@mcp.tool()
+@_iris_tool()
 def create_customer(name: str, description: str | None = None, sla: str | None = None) -> str:
     """Create a new customer."""
     return _create_customer(name, description, sla)
 
 
+class _KeyedLocks:
+    """Per-key locks that exist only while some thread holds or waits for them."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._locks: dict[Any, tuple[threading.Lock, list[int]]] = {}
+
+    @contextlib.contextmanager
+    def hold(self, key: Any) -> Iterator[None]:
+        with self._lock:
+            lock, users = self._locks.setdefault(key, (threading.Lock(), [0]))
+            users[0] += 1
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                users[0] -= 1
+                if not users[0]:
+                    del self._locks[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._locks)
+
+
+class _NoteDirectoryCache:
+    """Default note directory ID per case, resolved at most once at a time per case.
+
+    Resolving lists the case's directories and may create a "Root Notes" directory;
+    concurrent ``add_note`` calls for the same case wait on a per-case lock instead of
+    each listing (and possibly creating duplicate directories) themselves.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._ids: dict[int, int] = {}
+        self._case_locks = _KeyedLocks()
+
+    def resolve(self, case_obj: Any, case_id: int) -> int | None:
+        with self._lock:
+            dir_id = self._ids.get(case_id)
+            if dir_id is not None:
+                self.hits += 1
+                return dir_id
+            self.misses += 1
+        with self._case_locks.hold(case_id):
+            with self._lock:
+                dir_id = self._ids.get(case_id)
+            if dir_id is None:
+                dir_id = self._discover(case_obj, case_id)
+                if dir_id is not None:
+                    with self._lock:
+                        self._ids[case_id] = dir_id
+            return dir_id
+
+    @staticmethod
+    def _discover(case_obj: Any, case_id: int) -> int | None:
+        try:
+            resp = case_obj.list_notes_directories(cid=case_id)
+            data = _extract_data(resp, f"Listing note directories for case {case_id}")
+            for item in _ensure_list(data):
+                dir_id = _get_field(item, "id", "directory_id", "note_directory_id", "dir_id")
+                if dir_id is not None:
+                    return int(dir_id)
+        except Exception:
+            pass
+
+        # As a fallback, try to create a root directory
+        try:
+            resp = case_obj.add_notes_directory(directory_name="Root Notes", cid=case_id)
+            data = _extract_data(resp, f"Creating default note directory for case {case_id}")
+            val = _get_field(data, "id", "directory_id", "note_directory_id", "dir_id")
+            return int(val) if val is not None else None
+        except Exception:
+            return None
+
+    def cached(self, case_id: int) -> int | None:
+        """The cached directory ID, without counting a hit or resolving a miss."""
+        with self._lock:
+            return self._ids.get(case_id)
+
+    def invalidate(self, case_id: int | None = None) -> None:
+        with self._lock:
+            if case_id is None:
+                self._ids.clear()
+            else:
+                self._ids.pop(case_id, None)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"cases": len(self._ids), "hits": self.hits, "misses": self.misses}
+
+
+_NOTE_DIRECTORIES = _NoteDirectoryCache()
+# Iris's wording when a note targets a deleted directory; stops at "|" so echoed payloads never match.
+_MISSING_DIRECTORY = re.compile(
+    r"\b(?:invalid|unknown|missing|no such)\b[^.|]{0,20}\bdirectory|\bdirectory\b[^.|]{0,20}\b(?:not found|invalid|does not exist|missing|unknown)",
+    re.IGNORECASE,
+)
+
+
 def _resolve_note_directory_id(case_obj: Any, case_id: int, directory_id: int | None) -> int | None:
     """Return a usable directory_id, creating a default one if needed."""
     if directory_id is not None:
         return directory_id
-    try:
-        resp = case_obj.list_notes_directories(cid=case_id)
-        data = _extract_data(resp, f"Listing note directories for case {case_id}")
-        for item in _ensure_list(data):
-            dir_id = _get_field(item, "id", "directory_id", "note_directory_id", "dir_id")
-            if dir_id is not None:
-                return int(dir_id)
-    except Exception:
-        pass
+    return _NOTE_DIRECTORIES.resolve(case_obj, case_id)
 
-    # As a fallback, try to create a root directory
-    try:
-        resp = case_obj.add_notes_directory(directory_name="Root Notes", cid=case_id)
-        data = _extract_data(resp, f"Creating default note directory for case {case_id}")
-        val = _get_field(data, "id", "directory_id", "note_directory_id", "dir_id")
-        return int(val) if val is not None else None
-    except Exception:
-        return None
+
+class _NoteIndex:
+    """In-memory SQLite FTS5 index over note titles and content, per case.
+
+    The first full-text search on a case lists its note directories and fetches every
+    note once (concurrently); afterwards notes added, updated or deleted through this
+    server are applied directly. Every ``ttl`` seconds the directory listing is checked
+    again and only new, renamed or (when the listing carries a timestamp) updated notes
+    are refetched. The listing has no content hash, so every ``refetch_ttl`` seconds all
+    notes are refetched to pick up content edited in the Iris UI. At most ``max_cases``
+    cases are kept; the least recently searched one is dropped first.
+    """
+
+    def __init__(self, ttl: float = 300.0, refetch_ttl: float = 3600.0, max_cases: int = 32) -> None:
+        self.ttl = ttl
+        self.refetch_ttl = refetch_ttl
+        self.max_cases = max_cases
+        self.syncs = 0
+        self.fetched = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(":memory:", check_same_thread=False)
+        self._db.execute(
+            "CREATE VIRTUAL TABLE notes USING fts5(title, content, case_id UNINDEXED, note_id UNINDEXED, directory_id UNINDEXED, tokenize='unicode61 remove_diacritics 2')"
+        )
+        self._synced: OrderedDict[int, float] = OrderedDict()
+        self._refetched: dict[int, float] = {}
+        # (title, last update) per note as the directory listing reported it
+        self._listed: dict[tuple[int, int], tuple[Any, Any]] = {}
+        # Notes whose content was stored from our own write or re-read since the last listing
+        self._written: set[tuple[int, int]] = set()
+        self._case_locks = _KeyedLocks()
+
+    def indexed(self, case_id: int) -> bool:
+        with self._lock:
+            return case_id in self._synced
+
+    def upsert(self, case_id: int, note_id: int, title: Any, content: Any, directory_id: Any = None) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM notes WHERE case_id = ? AND note_id = ?", (case_id, note_id))
+            self._db.execute("INSERT INTO notes VALUES (?, ?, ?, ?, ?)", (title or "", content or "", case_id, note_id, directory_id))
+            # The content is current; the next listing only supplies the note's timestamp.
+            self._listed[(case_id, note_id)] = (title, self._listed.get((case_id, note_id), (None, None))[1])
+            self._written.add((case_id, note_id))
+
+    def remove(self, case_id: int, note_id: int) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM notes WHERE case_id = ? AND note_id = ?", (case_id, note_id))
+            self._listed.pop((case_id, note_id), None)
+            self._written.discard((case_id, note_id))
+
+    def refresh_note(self, case_obj: Any, case_id: int, note_id: int) -> None:
+        """Re-read one note after a change, if its case is indexed."""
+        if self.indexed(case_id):
+            data = _extract_data(case_obj.get_note(note_id=note_id, cid=case_id), f"Getting note {note_id}")
+            self._upsert_payload(case_id, note_id, data)
+
+    def _upsert_payload(self, case_id: int, note_id: int, data: Any) -> None:
+        get = _row_reader("note", data)
+        self.upsert(case_id, note_id, get("note_title", "title"), get("note_content", "content"), get("directory_id", "note_directory_id", "dir_id"))
+
+    def ensure(self, case_obj: Any, case_id: int) -> None:
+        with self._lock:
+            synced = self._synced.get(case_id)
+            if synced is not None and time.monotonic() - synced < self.ttl:
+                self._synced.move_to_end(case_id)
+                return
+        with self._case_locks.hold(case_id):
+            with self._lock:
+                synced = self._synced.get(case_id)
+            if synced is None or time.monotonic() - synced >= self.ttl:
+                self._sync(case_obj, case_id)
+
+    def _sync(self, case_obj: Any, case_id: int) -> None:
+        data = _extract_data(case_obj.list_notes_directories(cid=case_id), f"Listing notes for case {case_id}")
+        listed: dict[int, tuple[Any, Any]] = {}
+        for note in _note_rows(_ensure_list(data)):
+            get = _row_reader("note_listing", note)
+            note_id = get("id", "note_id")
+            if note_id is not None:
+                listed[int(note_id)] = (get("title", "note_title"), get("note_lastupdate", "last_update", "updated_at"))
+        now = time.monotonic()
+        with self._lock:
+            known = {nid: seen for (cid, nid), seen in self._listed.items() if cid == case_id}
+            written = {nid for cid, nid in self._written if cid == case_id}
+            refetch_all = now - self._refetched.setdefault(case_id, now) >= self.refetch_ttl
+        for note_id in known.keys() - listed.keys():
+            self.remove(case_id, note_id)
+        current = {nid for nid, seen in listed.items() if known.get(nid) == seen or (nid in written and known[nid][0] == seen[0])}
+        stale = [nid for nid in listed if refetch_all or nid not in current]
+
+        def fetch(note_id: int) -> Any:
+            return _extract_data(case_obj.get_note(note_id=note_id, cid=case_id), f"Getting note {note_id}")
+
+        for note_id, outcome in _fan_out(fetch, stale, concurrency=8):
+            if isinstance(outcome, Exception):
+                log.warning("Could not index note %s of case %s: %s", note_id, case_id, outcome)
+                continue
+            self._upsert_payload(case_id, note_id, outcome)
+            current.add(note_id)
+        with self._lock:
+            for note_id in current:
+                self._listed[(case_id, note_id)] = listed[note_id]
+                self._written.discard((case_id, note_id))
+            self._synced[case_id] = time.monotonic()
+            self._synced.move_to_end(case_id)
+            while len(self._synced) > self.max_cases:
+                self._drop_locked(next(iter(self._synced)))
+            if refetch_all:
+                self._refetched[case_id] = now
+            self.syncs += 1
+            self.fetched += len(stale)
+
+    @staticmethod
+    def match_expression(query: str) -> str:
+        """Turn free text into an FTS5 query: every word must match, as a prefix."""
+        words = re.findall(r"\w+", query)
+        if not words:
+            raise ValueError("Query must contain at least one word")
+        return " ".join(f'"{word}"*' for word in words)
+
+    def search(self, case_id: int, query: str, limit: int) -> list[tuple[Any, Any, Any, str]]:
+        """``(note_id, title, directory_id, snippet)`` ranked by BM25 (titles weigh more)."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT note_id, title, directory_id, snippet(notes, 1, '**', '**', '…', 16) FROM notes "
+                "WHERE notes MATCH ? AND case_id = ? ORDER BY bm25(notes, 5.0, 1.0) LIMIT ?",
+                (self.match_expression(query), case_id, limit),
+            ).fetchall()
+
+    def invalidate(self, case_id: int | None = None) -> None:
+        with self._lock:
+            if case_id is None:
+                self._db.execute("DELETE FROM notes")
+                self._synced.clear()
+                self._refetched.clear()
+                self._listed.clear()
+                self._written.clear()
+                return
+            self._drop_locked(case_id)
+
+    def _drop_locked(self, case_id: int) -> None:
+        self._db.execute("DELETE FROM notes WHERE case_id = ?", (case_id,))
+        self._synced.pop(case_id, None)
+        self._refetched.pop(case_id, None)
+        for key in [k for k in self._listed if k[0] == case_id]:
+            del self._listed[key]
+        self._written = {k for k in self._written if k[0] != case_id}
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "cases": len(self._synced),
+                "notes": len(self._listed),
+                "syncs": self.syncs,
+                "fetched": self.fetched,
+                "ttl_seconds": self.ttl,
+                "refetch_seconds": self.refetch_ttl,
+                "max_cases": self.max_cases,
+            }
+
+
+_NOTE_INDEX = _NoteIndex(
+    ttl=_env_float("IRIS_NOTE_INDEX_TTL", 300.0),
+    refetch_ttl=_env_float("IRIS_NOTE_INDEX_REFETCH", 3600.0),
+    max_cases=_env_int("IRIS_NOTE_INDEX_MAX_CASES", 32),
+)
 
 
 def _add_note(
@@ -597,7 +2999,9 @@ def _add_note(
         session = get_iris_client()
         case_obj = _prepare_case(session, case_id)
         # group_id is deprecated in the client; treat it as an alias if provided
-        resolved_dir = _resolve_note_directory_id(case_obj, case_id, directory_id or group_id)
+        explicit_dir = directory_id or group_id
+        cached_dir = None if explicit_dir else _NOTE_DIRECTORIES.cached(case_id)
+        resolved_dir = _resolve_note_directory_id(case_obj, case_id, explicit_dir)
         if resolved_dir is None:
             raise ValueError("No valid note directory_id found or created for this case")
 
@@ -608,45 +3012,44 @@ def _add_note(
             "custom_attributes": custom_attributes,
             "cid": case_id,
         }
-        note = case_obj.add_note(**{k: v for k, v in kwargs.items() if v is not None})
-        data = _extract_data(note, f"Adding note to case {case_id}")
+        try:
+            note = case_obj.add_note(**{k: v for k, v in kwargs.items() if v is not None})
+            data = _extract_data(note, f"Adding note to case {case_id}")
+        except Exception as e:
+            if explicit_dir or resolved_dir != cached_dir or not _MISSING_DIRECTORY.search(str(e)):
+                raise
+            # The cached default directory was deleted since it was resolved; rediscover it once.
+            _NOTE_DIRECTORIES.invalidate(case_id)
+            kwargs["directory_id"] = resolved_dir = _resolve_note_directory_id(case_obj, case_id, None)
+            if resolved_dir is None:
+                raise
+            note = case_obj.add_note(**{k: v for k, v in kwargs.items() if v is not None})
+            data = _extract_data(note, f"Adding note to case {case_id}")
         note_id = _get_field(data, "note_id", "id")
+        if note_id is not None and _NOTE_INDEX.indexed(case_id):
+            _NOTE_INDEX.upsert(case_id, int(note_id), title, content, resolved_dir)
         return f"Note added to case {case_id}. ID: {note_id}, Directory: {resolved_dir}"
     except Exception as e:
         return f"Error adding note: {e!s}"
 
 
-def _list_notes(case_id: int) -> str:
+def _list_notes(case_id: int, output: OutputFormat = "text") -> str | dict[str, Any]:
     try:
         session = get_iris_client()
         case_obj = _prepare_case(session, case_id)
         resp = case_obj.list_notes_directories(cid=case_id)
         data = _extract_data(resp, f"Listing note directories for case {case_id}")
-        directories = _ensure_list(data)
-        if not directories:
+        records = [NoteDirectoryRecord.from_payload(directory) for directory in _ensure_list(data)]
+        if output == "json":
+            return {"items": [r.to_dict() for r in records], "total": len(records)}
+        if not records:
             return f"No notes found for case {case_id}."
-
-        result = f"Notes for Case {case_id}:\n"
-        for directory in directories:
-            dir_id = _get_field(directory, "id", "directory_id", "note_directory_id", "dir_id")
-            dir_name = _get_field(directory, "name", "directory_name", "note_directory_name") or "(unnamed directory)"
-            note_count = _get_field(directory, "note_count", "notes_count", "notes_nb")
-            notes = directory.get("notes") if isinstance(directory, dict) else None
-            result += f"- Directory {dir_id} ({dir_name})"
-            if note_count is not None:
-                result += f" — {note_count} notes"
-            result += "\n"
-            if notes:
-                for note in notes:
-                    nid = _get_field(note, "id", "note_id")
-                    title = _get_field(note, "title", "note_title")
-                    result += f"  • ID: {nid}, Title: {title}\n"
-        return result.rstrip()
+        return _render(f"Notes for Case {case_id}:", map(_note_tree_line, records)).rstrip()
     except Exception as e:
         return f"Error listing notes: {e!s}"
 
 
-def _list_note_directories(case_id: int) -> str:
+def _list_note_directories(case_id: int, output: OutputFormat = "text") -> str | dict[str, Any]:
     try:
         session = get_iris_client()
         case_obj = _prepare_case(session, case_id)
@@ -656,27 +3059,14 @@ def _list_note_directories(case_id: int) -> str:
             f"Listing note directories for case {case_id}",
             [{"cid": case_id}, {"case_id": case_id}],
             allow_positional=False,
+            plan_key="list_note_directories",
         )
-        items = _ensure_list(data)
-        if not items:
+        records = [NoteDirectoryRecord.from_payload(item) for item in _ensure_list(data)]
+        if output == "json":
+            return {"items": [r.to_dict() for r in records], "total": len(records)}
+        if not records:
             return f"No note directories found for case {case_id} (method {used})."
-
-        result = f"Note directories for Case {case_id} (method {used}):\n"
-        for item in items:
-            dir_id = _get_field(item, "id", "directory_id", "note_directory_id", "dir_id")
-            name = _get_field(item, "name", "directory_name", "note_directory_name")
-            note_count = _get_field(item, "note_count", "notes_count", "notes_nb")
-            notes = item.get("notes") if isinstance(item, dict) else None
-            result += f"- ID: {dir_id}, Name: {name}"
-            if note_count is not None:
-                result += f", Notes: {note_count}"
-            result += "\n"
-            if notes:
-                for note in notes:
-                    nid = _get_field(note, "id", "note_id")
-                    title = _get_field(note, "title", "note_title")
-                    result += f"  • Note ID: {nid}, Title: {title}\n"
-        return result.rstrip()
+        return _render(f"Note directories for Case {case_id} (method {used}):", map(_note_directory_line, records)).rstrip()
     except Exception as e:
         return f"Error listing note directories: {e!s}"
 
@@ -685,46 +3075,28 @@ def _create_note_directory(case_id: int, name: str, parent_directory_id: int | N
     try:
         session = get_iris_client()
         case_obj = _prepare_case(session, case_id)
-        try:
-            resp = case_obj.add_notes_directory(directory_name=name, parent_directory_id=parent_directory_id, cid=case_id)
-            data = _extract_data(resp, f"Creating note directory '{name}' for case {case_id}")
-            dir_id = _get_field(data, "id", "directory_id", "note_directory_id", "dir_id")
-            return f"Note directory created. ID: {dir_id}"
-        except Exception:
-            pass
-
-        # Fallback to other potential method names if the above failed
-        candidates = ["add_note_directory", "create_note_directory", "add_notedirectory"]
-        for meth in candidates:
-            if not hasattr(case_obj, meth):
-                continue
-            kw_options = [
-                {"cid": case_id, "directory_name": name, "parent_directory_id": parent_directory_id},
-                {"cid": case_id, "name": name, "parent_directory_id": parent_directory_id},
-            ]
-            try:
-                data, used = _try_case_methods(case_obj, [meth], f"Creating note directory '{name}' for case {case_id}", kw_options)
-                dir_id = _get_field(data, "directory_id", "id", "note_directory_id", "dir_id")
-                return f"Note directory created. ID: {dir_id} (via {used})"
-            except Exception:
-                continue
-
-        note_methods = [m for m in dir(case_obj) if "note" in m]
-        return f"Note directory creation not available on Case client. Available note-related attributes: {note_methods}"
+        if not hasattr(case_obj, "add_notes_directory"):
+            note_methods = [m for m in dir(case_obj) if "note" in m]
+            return f"Note directory creation not available on Case client. Available note-related attributes: {note_methods}"
+        _NOTE_DIRECTORIES.invalidate(case_id)
+        resp = case_obj.add_notes_directory(directory_name=name, parent_directory_id=parent_directory_id, cid=case_id)
+        data = _extract_data(resp, f"Creating note directory '{name}' for case {case_id}")
+        dir_id = _get_field(data, "id", "directory_id", "note_directory_id", "dir_id")
+        return f"Note directory created. ID: {dir_id}"
     except Exception as e:
         return f"Error creating note directory: {e!s}"
 
 
-def _get_note(note_id: int, case_id: int) -> str:
+def _get_note(note_id: int, case_id: int, max_bytes: int | None = None, output: OutputFormat = "text") -> str | dict[str, Any]:
     try:
         session = get_iris_client()
         case_obj = _prepare_case(session, case_id)
         resp = case_obj.get_note(note_id=note_id, cid=case_id)
         data = _extract_data(resp, f"Getting note {note_id}")
-        title = _get_field(data, "note_title", "title")
-        content = _get_field(data, "note_content", "content")
-        directory = _get_field(data, "directory_id", "note_directory_id", "dir_id")
-        return f"Note {note_id} (Case {case_id}):\nTitle: {title}\nDirectory: {directory}\nContent:\n{content}"
+        record = NoteRecord.from_payload(data, "note")
+        if output == "json":
+            return record.to_dict()
+        return _bounded(f"Note {note_id} (Case {case_id}):\nTitle: {record.title}\nDirectory: {record.directory_id}\nContent:\n{record.content}", max_bytes)
     except Exception as e:
         return f"Error getting note: {e!s}"
 
@@ -737,6 +3109,11 @@ def _update_note(note_id: int, case_id: int, **fields: Any) -> str:
         payload.update({k: v for k, v in fields.items() if v is not None})
         resp = case_obj.update_note(**payload)
         _extract_data(resp, f"Updating note {note_id}")
+        try:
+            _NOTE_INDEX.refresh_note(case_obj, case_id, note_id)
+        except Exception:
+            # A stale entry is corrected by the next periodic sync; drop it meanwhile.
+            _NOTE_INDEX.remove(case_id, note_id)
         return f"Note {note_id} updated."
     except Exception as e:
         return f"Error updating note: {e!s}"
@@ -748,6 +3125,7 @@ def _delete_note(note_id: int, case_id: int) -> str:
         case_obj = _prepare_case(session, case_id)
         resp = case_obj.delete_note(note_id=note_id, cid=case_id)
         _extract_data(resp, f"Deleting note {note_id}")
+        _NOTE_INDEX.remove(case_id, note_id)
         return f"Note {note_id} deleted."
     except Exception as e:
         return f"Error deleting note: {e!s}"
@@ -764,73 +3142,86 @@ def _add_note_comment(note_id: int, comment: str, case_id: int) -> str:
         return f"Error adding note comment: {e!s}"
 
 
-def _list_note_comments(note_id: int, case_id: int) -> str:
+def _list_note_comments(note_id: int, case_id: int, output: OutputFormat = "text") -> str | dict[str, Any]:
     try:
         session = get_iris_client()
         case_obj = _prepare_case(session, case_id)
         resp = case_obj.list_note_comments(note_id=note_id, cid=case_id)
         data = _extract_data(resp, f"Listing note comments for note {note_id}")
-        items = _ensure_list(data)
-        if not items:
+        records = [CommentRecord.from_payload(c, "note_comments") for c in _ensure_list(data)]
+        if output == "json":
+            return {"items": [r.to_dict() for r in records], "total": len(records)}
+        if not records:
             return f"No comments found for note {note_id}."
-        result = f"Comments for note {note_id}:\n"
-        for c in items:
-            cid = _get_field(c, "comment_id", "id")
-            author = _get_field(c, "user", "author", "comment_author")
-            if isinstance(author, dict):
-                author = _get_field(author, "user_login", "user_name", "name")
-            content = _get_field(c, "comment_content", "comment")
-            result += f"- ID: {cid}, Author: {author}, Comment: {content}\n"
-        return result.rstrip()
+        return _render(f"Comments for note {note_id}:", map(_comment_line, records)).rstrip()
     except Exception as e:
         return f"Error listing note comments: {e!s}"
 
 
-def _search_notes(case_id: int, search_term: str = "%") -> str:
+def _search_notes(case_id: int, search_term: str = "%", output: OutputFormat = "text") -> str | dict[str, Any]:
     try:
         session = get_iris_client()
         case_obj = _prepare_case(session, case_id)
         resp = case_obj.search_notes(search_term=search_term, cid=case_id)
         data = _extract_data(resp, f"Searching notes for case {case_id}")
-        items = _ensure_list(data)
-        if not items:
+        records = [NoteRecord.from_payload(note, "notes_search") for note in _ensure_list(data)]
+        if output == "json":
+            return {"items": [r.to_dict() for r in records], "total": len(records)}
+        if not records:
             return f"No notes matched '{search_term}' in case {case_id}."
-        result = f"Notes matching '{search_term}' in case {case_id}:\n"
-        for note in items:
-            nid = _get_field(note, "note_id", "id")
-            title = _get_field(note, "note_title", "title")
-            directory = _get_field(note, "directory_id", "note_directory_id", "dir_id")
-            result += f"- ID: {nid}, Title: {title}, Directory: {directory}\n"
-        return result.rstrip()
+        return _render(f"Notes matching '{search_term}' in case {case_id}:", map(_note_line, records)).rstrip()
+    except Exception as e:
+        return f"Error searching notes: {e!s}"
+
+
+def _search_notes_fulltext(case_id: int, query: str, limit: int = 10, output: OutputFormat = "text") -> str | dict[str, Any]:
+    try:
+        session = get_iris_client()
+        case_obj = _prepare_case(session, case_id)
+        _NOTE_INDEX.ensure(case_obj, case_id)
+        rows = _NOTE_INDEX.search(case_id, query, min(max(1, limit), 50))
+        records = [NoteMatchRecord(note_id, title, directory, " ".join(snippet.split())) for note_id, title, directory, snippet in rows]
+        if output == "json":
+            return {"items": [r.to_dict() for r in records], "total": len(records)}
+        if not records:
+            return f"No notes matched '{query}' in case {case_id}."
+        return _render(f"Notes matching '{query}' in case {case_id} (best first):", map(_note_match_line, records)).rstrip()
     except Exception as e:
         return f"Error searching notes: {e!s}"
 
 
-def _list_evidence(case_id: int) -> str:
+def _list_evidence(
+    case_id: int,
+    limit: int | None = None,
+    offset: int = 0,
+    cursor: str | None = None,
+    output: OutputFormat = "text",
+    *,
+    filter_text: str | None = None,
+) -> str | dict[str, Any]:
     try:
         session = get_iris_client()
         case_obj = _prepare_case(session, case_id)
-        resp = case_obj.list_evidences(cid=case_id)
-        data = _extract_data(resp, f"Listing evidence for case {case_id}")
-        items = _ensure_list(data)
-        if not items:
+
+        def fetch() -> list[Any]:
+            resp = case_obj.list_evidences(cid=case_id)
+            return _ensure_list(_extract_data(resp, f"Listing evidence for case {case_id}"))
+
+        page = _paginate(
+            "evidences",
+            (case_id, filter_text),
+            _mirrored(session, case_id, "evidences", fetch, filter_text),
+            _sort_key("evidences", ("evidence_id", "id")),
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+        records = [EvidenceRecord.from_payload(ev) for ev in page.items]
+        if output == "json":
+            return _page_payload(records, page)
+        if not page.total:
             return f"No evidence found for case {case_id}."
-        result = f"Evidence for Case {case_id}:\n"
-        for ev in items:
-            evid = _get_field(ev, "evidence_id", "id")
-            name = _get_field(ev, "evidence_name", "name", "title", "filename")
-            etype = _get_field(ev, "evidence_type", "type", "evidence_type_id", "type_id")
-            tlp = _get_field(ev, "tlp", "tlp_name", "color")
-            size = _get_field(ev, "file_size", "size")
-            file_hash = _get_field(ev, "file_hash", "hash")
-            desc = _get_field(ev, "file_description", "description", "evidence_description")
-            added = _get_field(ev, "date_added", "created_at")
-
-            if all(v is None for v in (evid, name, etype, tlp, size, file_hash, desc)):
-                result += f"- {ev}\n"
-            else:
-                result += f"- ID: {evid}, Name: {name}, Type: {etype}, TLP: {tlp}, Size: {size}, Hash: {file_hash}, Added: {added}, Desc: {desc}\n"
-        return result
+        return _render(f"Evidence for Case {case_id}:", map(_evidence_line, records), page.footer())
     except Exception as e:
         return f"Error listing evidence: {e!s}"
 
@@ -872,6 +3263,7 @@ def _add_evidence(
         )
         data = _extract_data(resp, f"Adding evidence to case {case_id}")
         evid = _get_field(data, "evidence_id", "id")
+        _COLLECTIONS.invalidate("evidences", case_id)
         return f"Evidence added. ID: {evid}"
     except Exception as e:
         return f"Error adding evidence: {e!s}"
@@ -889,6 +3281,7 @@ def _update_evidence(evidence_id: int, case_id: int | None = None, **fields: Any
         payload.update({k: v for k, v in fields.items() if v is not None})
         resp = case_obj.update_evidence(**payload)
         _extract_data(resp, f"Updating evidence {evidence_id}")
+        _COLLECTIONS.invalidate("evidences", case_id)
         return f"Evidence {evidence_id} updated."
     except Exception as e:
         return f"Error updating evidence: {e!s}"
@@ -903,39 +3296,112 @@ def _delete_evidence(evidence_id: int, case_id: int | None = None) -> str:
             payload["cid"] = case_id
         resp = case_obj.delete_evidence(**payload)
         _extract_data(resp, f"Deleting evidence {evidence_id}")
+        _COLLECTIONS.invalidate("evidences", case_id)
         return f"Evidence {evidence_id} deleted."
     except Exception as e:
         return f"Error deleting evidence: {e!s}"
 
 
-def _list_events(case_id: int) -> str:
+def _list_events(
+    case_id: int,
+    limit: int | None = None,
+    offset: int = 0,
+    cursor: str | None = None,
+    output: OutputFormat = "text",
+    *,
+    filter_text: str | None = None,
+    max_bytes: int | None = None,
+) -> str | dict[str, Any]:
     try:
         session = get_iris_client()
         case_obj = _prepare_case(session, case_id)
-        resp = case_obj.list_events(cid=case_id)
-        data = _extract_data(resp, f"Listing events for case {case_id}")
-        items = _ensure_list(data)
-        if not items:
+
+        def fetch() -> list[Any]:
+            resp = case_obj.list_events(cid=case_id)
+            return _ensure_list(_extract_data(resp, f"Listing events for case {case_id}"))
+
+        page = _paginate(
+            "events",
+            (case_id, filter_text),
+            _mirrored(session, case_id, "events", fetch, filter_text),
+            _sort_key("events", ("event_date", "event_date_wtz", "date_time", "datetime"), ("event_id", "id")),
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+        records = [EventRecord.from_payload(ev) for ev in page.items]
+        if output == "json":
+            return _bounded_page(records, page, max_bytes)
+        if not page.total:
             return f"No events found for case {case_id}."
-        result = f"Events for Case {case_id}:\n"
-        for ev in items:
-            evid = _get_field(ev, "event_id", "id")
-            name = _get_field(ev, "event_title", "event_name", "name", "title")
-            desc = _get_field(ev, "event_content", "event_description", "description", "content")
-            category = _get_field(ev, "category_name", "event_category", "category", "event_category_name", "event_category_id")
-            tlp = _get_field(ev, "tlp", "tlp_name", "color", "event_color")
-            dt = _get_field(ev, "event_date", "event_date_wtz", "date_time", "datetime", "event_datetime", "time", "timestamp")
-            tz = _get_field(ev, "event_tz", "timezone", "timezone_string")
-            if all(v is None for v in (evid, name, category, tlp, desc, dt)):
-                result += f"- {ev}\n"
-            else:
-                when = f"{dt}{' ' + tz if tz else ''}"
-                result += f"- ID: {evid}, Name: {name}, Category: {category}, TLP/Color: {tlp}, Time: {when}, Desc: {desc}\n"
-        return result
+        return _bounded(_render(f"Events for Case {case_id}:", map(_event_line, records), page.footer()), max_bytes)
     except Exception as e:
         return f"Error listing events: {e!s}"
 
 
+_EPOCH_SECONDS_MAX = 1e11  # ~year 5138; anything larger is taken as ms/us
+
+_DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y/%m/%d %H:%M:%S",
+    "%d/%m/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M:%S",
+    "%d.%m.%Y %H:%M:%S",
+    "%b %d %Y %H:%M:%S",
+)
+
+# Digit-only strings of these lengths are compact dates; other digit strings are epochs only from 10 digits on.
+_COMPACT_DATE_FORMATS = {8: "%Y%m%d", 14: "%Y%m%d%H%M%S"}
+_EPOCH_TEXT = re.compile(r"-?\d{10,}(?:\.\d*)?")
+
+
+def _parse_datetime_text(text: str) -> datetime | float | None:
+    """Parse a date string, or return the epoch it spells; None if unparseable."""
+    if text.isdigit() and len(text) in _COMPACT_DATE_FORMATS:
+        try:
+            return datetime.strptime(text, _COMPACT_DATE_FORMATS[len(text)])
+        except ValueError:
+            return None
+    if _EPOCH_TEXT.fullmatch(text):
+        return float(text)
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        pass
+    for fmt in _DATETIME_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _parse_datetime(value: Any) -> datetime | None:
+    """Parse ISO 8601, epoch (s/ms/us) and a few common log formats; None if unparseable.
+
+    Short digit strings are never taken as epochs: "20240115" is a compact date and "12345" is rejected.
+    """
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        epoch = float(value)
+    elif isinstance(value, str) and value.strip():
+        parsed = _parse_datetime_text(value.strip())
+        if not isinstance(parsed, float):
+            return parsed
+        epoch = parsed
+    else:
+        return None
+    # Scale milli/microsecond epochs (e.g. plaso timestamps) down to seconds
+    while abs(epoch) > _EPOCH_SECONDS_MAX:
+        epoch /= 1000
+    try:
+        return datetime.fromtimestamp(epoch, tz=UTC)
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
 def _add_event(
     case_id: int,
     name: str,
@@ -962,14 +3428,9 @@ def _add_event(
         extra = extra or {}
         if date_time is None:
             date_time = extra.get("date_time") or extra.get("datetime")
-        parsed_dt: Any = date_time
-        if isinstance(parsed_dt, str):
-            try:
-                parsed_dt = datetime.fromisoformat(parsed_dt)
-            except Exception:
-                parsed_dt = None
+        parsed_dt = _parse_datetime(date_time)
         if parsed_dt is None:
-            raise ValueError("date_time is required for an event and must be ISO format if string")
+            raise ValueError("date_time is required for an event (ISO 8601, epoch or 'YYYY-MM-DD HH:MM:SS')")
 
         if color is None and tlp is not None:
             color = tlp
@@ -996,6 +3457,7 @@ def _add_event(
         resp = case_obj.add_event(**{k: v for k, v in payload.items() if v is not None})
         data = _extract_data(resp, f"Adding event to case {case_id}")
         evid = _get_field(data, "event_id", "id")
+        _COLLECTIONS.invalidate("events", case_id)
         return f"Event added. ID: {evid}"
     except Exception as e:
         return f"Error adding event: {e!s}"
@@ -1014,6 +3476,7 @@ def _update_event(event_id: int, case_id: int | None = None, **fields: Any) -> s
         payload.update({k: v for k, v in fields.items() if v is not None})
         resp = case_obj.update_event(**payload)
         _extract_data(resp, f"Updating event {event_id}")
+        _COLLECTIONS.invalidate("events", case_id)
         return f"Event {event_id} updated."
     except Exception as e:
         return f"Error updating event: {e!s}"
@@ -1028,36 +3491,51 @@ def _delete_event(event_id: int, case_id: int | None = None) -> str:
             payload["cid"] = case_id
         resp = case_obj.delete_event(**payload)
         _extract_data(resp, f"Deleting event {event_id}")
+        _COLLECTIONS.invalidate("events", case_id)
         return f"Event {event_id} deleted."
     except Exception as e:
         return f"Error deleting event: {e!s}"
 
 
-@mcp.tool()
-def list_notes(case_id: int) -> str:
-    """List notes for a case (includes directory ids)."""
-    return _list_notes(case_id)
+@_iris_tool()
+def list_notes(case_id: int, output: OutputFormat = "text") -> str | dict[str, Any]:
+    """List notes for a case (includes directory ids; `output="json"` returns `{"items", "total"}`)."""
+    return _list_notes(case_id, output)
 
 
-@mcp.tool()
-def list_note_directories(case_id: int) -> str:
-    """List note directories for a case (best-effort across client versions)."""
-    return _list_note_directories(case_id)
+@_iris_tool()
+def list_note_directories(case_id: int, output: OutputFormat = "text") -> str | dict[str, Any]:
+    """List note directories for a case (best-effort across client versions; `output="json"` returns `{"items", "total"}`)."""
+    return _list_note_directories(case_id, output)
 
 
-@mcp.tool()
+@_iris_tool()
 def create_note_directory(case_id: int, name: str, parent_directory_id: int | None = None) -> str:
     """Create a note directory for a case (best-effort across client versions)."""
     return _create_note_directory(case_id, name, parent_directory_id)
 
 
-@mcp.tool()
-def list_evidence(case_id: int) -> str:
-    """List evidence for a case (best-effort across client versions)."""
-    return _list_evidence(case_id)
+@_iris_tool()
+def list_evidence(
+    case_id: int,
+    limit: int | None = None,
+    offset: int = 0,
+    cursor: str | None = None,
+    output: OutputFormat = "text",
+    *,
+    filter_text: str | None = None,
+) -> str | dict[str, Any]:
+    """List evidence for a case (best-effort across client versions).
+
+    Results are sorted by evidence ID. Pass `limit` (and `offset`) to page through them; follow-up
+    pages requested with the returned `cursor` are served from the server-side snapshot.
+    With `output="json"` the page is returned as `{"items", "total", "offset", "next_cursor"}`.
+    `filter_text` keeps only rows containing the text (case-insensitive) in any field.
+    """
+    return _list_evidence(case_id, limit, offset, cursor, output, filter_text=filter_text)
 
 
-@mcp.tool()
+@_iris_tool()
 def add_evidence(
     case_id: int,
     filename: str | None = None,
@@ -1072,26 +3550,43 @@ def add_evidence(
     return _add_evidence(case_id, filename, file_size, description, file_hash, custom_attributes, extra, name)
 
 
-@mcp.tool()
+@_iris_tool()
 def update_evidence(evidence_id: int, case_id: int | None = None, fields: dict[str, Any] | None = None) -> str:
     """Update evidence fields (pass additional fields in 'fields')."""
     fields = fields or {}
     return _update_evidence(evidence_id, case_id, **fields)
 
 
-@mcp.tool()
+@_iris_tool()
 def delete_evidence(evidence_id: int, case_id: int | None = None) -> str:
     """Delete an evidence item."""
     return _delete_evidence(evidence_id, case_id)
 
 
-@mcp.tool()
-def list_events(case_id: int) -> str:
-    """List events for a case."""
-    return _list_events(case_id)
+@_iris_tool()
+def list_events(
+    case_id: int,
+    limit: int | None = None,
+    offset: int = 0,
+    cursor: str | None = None,
+    output: OutputFormat = "text",
+    *,
+    filter_text: str | None = None,
+    max_bytes: int | None = None,
+) -> str | dict[str, Any]:
+    """List events for a case.
+
+    Results are sorted by event time, then ID. Pass `limit` (and `offset`) to page through them; follow-up
+    pages requested with the returned `cursor` are served from the server-side snapshot.
+    With `output="json"` the page is returned as `{"items", "total", "offset", "next_cursor"}`.
+    `filter_text` keeps only rows containing the text (case-insensitive) in any field.
+    Responses are capped at `max_bytes` (default `IRIS_RESPONSE_MAX_BYTES`, 0 = no cap): text ends with a
+    `read_more` handle, JSON keeps the rows that fit and sets `next_cursor`.
+    """
+    return _list_events(case_id, limit, offset, cursor, output, filter_text=filter_text, max_bytes=max_bytes)
 
 
-@mcp.tool()
+@_iris_tool()
 def add_event(
     case_id: int,
     name: str,
@@ -1135,26 +3630,235 @@ def add_event(
     )
 
 
-@mcp.tool()
+@_iris_tool()
 def update_event(event_id: int, case_id: int | None = None, fields: dict[str, Any] | None = None) -> str:
     """Update an event's fields (pass additional fields in 'fields')."""
     fields = fields or {}
     return _update_event(event_id, case_id, **fields)
 
 
-@mcp.tool()
+@_iris_tool()
 def delete_event(event_id: int, case_id: int | None = None) -> str:
     """Delete an event."""
     return _delete_event(event_id, case_id)
 
 
-@mcp.tool()
-def debug_case_methods(case_id: int, filter_text: str = "") -> str:
+# -------------------------------
+# Timeline import
+# -------------------------------
+
+_TIMELINE_ERROR_SAMPLE = 20
+
+
+def _serving_http() -> bool:
+    return "--http" in sys.argv
+
+
+def _import_path(path: str) -> str:
+    """Resolve a server-side file for import, confined to ``IRIS_IMPORT_ROOT`` when it is set.
+
+    Without a root, files are only readable over stdio, where the client already runs as the
+    server's user; over ``--http`` any caller could otherwise read arbitrary server files.
+    """
+    root = os.environ.get("IRIS_IMPORT_ROOT")
+    if not root:
+        if _serving_http():
+            raise ValueError("reading server files over --http requires IRIS_IMPORT_ROOT; pass 'content' instead")
+        return os.path.expanduser(path)
+    base = os.path.realpath(os.path.expanduser(root))
+    resolved = os.path.realpath(os.path.join(base, os.path.expanduser(path)))
+    if os.path.commonpath([base, resolved]) != base:
+        raise ValueError(f"path must be inside IRIS_IMPORT_ROOT ({base})")
+    return resolved
+
+
+def _read_timeline_records(path: str | None, content: str | None, fmt: str | None) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Yield ``(row_number, record)`` from a CSV/JSONL file or inline blob without loading it whole."""
+    if (path is None) == (content is None):
+        raise ValueError("Provide exactly one of 'path' or 'content'")
+
+    def lines() -> Iterator[str]:
+        if content is not None:
+            yield from content.splitlines()
+            return
+        with open(os.path.expanduser(path or ""), encoding="utf-8-sig", newline="") as fh:
+            yield from fh
+
+    stream = lines()
+    first = next(stream, None)
+    while first is not None and not first.strip():
+        first = next(stream, None)
+    if first is None:
+        return
+    head = first
+    kind = (fmt or "").lower() or (os.path.splitext(path)[1].lstrip(".").lower() if path else "")
+    if kind not in ("csv", "jsonl", "ndjson"):
+        kind = "jsonl" if head.lstrip().startswith("{") else "csv"
+
+    def replay() -> Iterator[str]:
+        yield head
+        yield from stream
+
+    if kind == "csv":
+        for row_no, record in enumerate(csv.DictReader(replay()), start=1):
+            yield row_no, record
+        return
+    for row_no, line in enumerate(replay(), start=1):
+        if line.strip():
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield row_no, {"__error__": f"invalid JSON ({e.msg})"}
+                continue
+            yield row_no, record if isinstance(record, dict) else {"__error__": "not a JSON object"}
+
+
+def _timeline_event(record: dict[str, Any], categories: dict[str, int] | None, default_category: str | int | None) -> dict[str, Any]:
+    """Validate one record and map it to `Case.add_event` keyword arguments."""
+    if "__error__" in record:
+        raise ValueError(record["__error__"])
+    get = _row_reader("timeline_import", record)
+    when = _parse_datetime(get("date_time", "datetime", "event_date", "timestamp", "date", "time"))
+    if when is None:
+        raise ValueError("missing or unparseable date/time")
+    content = get("description", "content", "event_content", "message", "long")
+    title = get("title", "event_title", "name", "event_name", "short", "message") or content
+    if not title:
+        raise ValueError("missing title")
+    category: Any = get("category", "event_category", "category_name") or default_category
+    if isinstance(category, str):
+        name = category.strip()
+        if name.isdigit():
+            category = int(name)
+        elif categories is None:
+            raise ValueError(f"cannot resolve event category {name!r}: category list unavailable")
+        elif (category := categories.get(name.lower())) is None:
+            raise ValueError(f"unknown event category {name!r}")
+    tags = get("tags", "tag", "event_tags")
+    if isinstance(tags, str):
+        tags = [t.strip() for t in tags.split(",") if t.strip()]
+    payload = {
+        "title": str(title)[:255],
+        "date_time": when,
+        "content": content,
+        "raw_content": get("raw_content", "raw"),
+        "source": get("source", "source_long", "event_source"),
+        "category": category,
+        "tags": tags or None,
+        "color": get("color", "event_color"),
+        "timezone_string": get("timezone_string", "timezone", "tz", "event_tz"),
+    }
+    return {k: v for k, v in payload.items() if v not in (None, "")}
+
+
+def _import_timeline(
+    case_id: int,
+    path: str | None = None,
+    content: str | None = None,
+    fmt: str | None = None,
+    default_category: str | int | None = None,
+    start_row: int = 1,
+    max_rows: int | None = None,
+    concurrency: int = 4,
+    dry_run: bool = False,
+) -> str:
+    try:
+        if path is not None:
+            path = _import_path(path)
+        session = get_iris_client()
+        case_obj = _prepare_case(session, case_id)
+        categories: dict[str, int] | None
+        try:
+            categories = _reference_ids(session, "manage/event-categories/list", "name", "id")
+        except Exception:
+            categories = None
+
+        counts = {"read": 0, "invalid": 0, "added": 0, "failed": 0}
+        errors: list[str] = []
+        last_row = 0
+
+        def note_error(row_no: int, message: str) -> None:
+            if len(errors) < _TIMELINE_ERROR_SAMPLE:
+                errors.append(f"row {row_no}: {message}")
+
+        def validated() -> Iterator[tuple[int, dict[str, Any]]]:
+            for row_no, record in _read_timeline_records(path, content, fmt):
+                if row_no < start_row:
+                    continue
+                if max_rows is not None and counts["read"] >= max_rows:
+                    return
+                counts["read"] += 1
+                try:
+                    yield row_no, _timeline_event(record, categories, default_category)
+                except ValueError as e:
+                    counts["invalid"] += 1
+                    note_error(row_no, str(e))
+
+        def submit(entry: tuple[int, dict[str, Any]]) -> Any:
+            if dry_run:
+                return None
+            resp = case_obj.add_event(**entry[1], cid=case_id)
+            return _get_field(_extract_data(resp, f"Adding event to case {case_id}"), "event_id", "id")
+
+        for (row_no, _payload), outcome in _fan_out(submit, validated(), min(max(1, concurrency), 16)):
+            last_row = max(last_row, row_no)
+            if isinstance(outcome, Exception):
+                counts["failed"] += 1
+                note_error(row_no, str(outcome))
+            else:
+                counts["added"] += 1
+        if counts["added"] and not dry_run:
+            _COLLECTIONS.invalidate("events", case_id)
+
+        verb = "validated" if dry_run else "added"
+        summary = (
+            f"Timeline import for case {case_id}{' (dry run)' if dry_run else ''}: "
+            f"{counts['read']} rows read, {counts['added']} {verb}, {counts['invalid']} invalid, {counts['failed']} failed"
+        )
+        if last_row:
+            summary += f"; last submitted row {last_row}"
+        if errors:
+            more = counts["invalid"] + counts["failed"] - len(errors)
+            summary += "\nErrors:\n" + "\n".join(f"- {e}" for e in errors)
+            if more > 0:
+                summary += f"\n- ... {more} more"
+        return summary
+    except Exception as e:
+        return f"Error importing timeline: {e!s}"
+
+
+@_iris_tool(limit=1)
+def import_timeline(
+    case_id: int,
+    path: str | None = None,
+    content: str | None = None,
+    fmt: str | None = None,
+    default_category: str | int | None = None,
+    start_row: int = 1,
+    max_rows: int | None = None,
+    concurrency: int = 4,
+    dry_run: bool = False,
+) -> str:
+    """
+    Stream a CSV or JSONL timeline into case events.
+
+    Pass a server-local `path` or an inline `content` blob; `fmt` ("csv"/"jsonl") is detected when omitted.
+    `path` must lie under IRIS_IMPORT_ROOT when that is set; over --http it is refused without it.
+    Columns are matched loosely: title/name/message, date_time/datetime/timestamp (ISO 8601 or epoch),
+    description/content, category, source, raw_content, tags, color, timezone.
+    Rows without a category use `default_category`; unknown category names are reported as invalid rows.
+    Use `start_row`/`max_rows` to resume or chunk large files and `dry_run` to validate only.
+    """
+    return _import_timeline(case_id, path, content, fmt, default_category, start_row, max_rows, concurrency, dry_run)
+
+
+@_iris_tool()
+def debug_case_methods(case_id: int, filter_text: str = "") -> str:
     """List available Case methods (optionally filtered), useful for wiring missing tools."""
     return _introspect_case_methods(case_id, filter_text)
 
 
-@mcp.tool()
+@_iris_tool()
 def add_note(
     case_id: int,
     content: str,
@@ -1169,41 +3873,57 @@ def add_note(
     return _add_note(case_id, content, title, directory_id, group_id, custom_attributes)
 
 
-@mcp.tool()
-def get_note(case_id: int, note_id: int) -> str:
-    """Fetch a specific note (title, directory, and content)."""
-    return _get_note(note_id, case_id)
+@_iris_tool()
+def get_note(case_id: int, note_id: int, max_bytes: int | None = None, output: OutputFormat = "text") -> str | dict[str, Any]:
+    """Fetch a specific note (title, directory, and content).
+
+    Notes longer than `max_bytes` (default `IRIS_RESPONSE_MAX_BYTES`, 0 = no cap) end with a
+    `read_more` handle for the rest. `output="json"` returns the whole normalized record.
+    """
+    return _get_note(note_id, case_id, max_bytes, output)
 
 
-@mcp.tool()
+@_iris_tool()
 def update_note(case_id: int, note_id: int, fields: dict[str, Any] | None = None) -> str:
     """Update a note (title/content/custom_attributes/directory_id)."""
     fields = fields or {}
     return _update_note(note_id, case_id, **fields)
 
 
-@mcp.tool()
+@_iris_tool()
 def delete_note(case_id: int, note_id: int) -> str:
     """Delete a note."""
     return _delete_note(note_id, case_id)
 
 
-@mcp.tool()
+@_iris_tool()
 def add_note_comment(case_id: int, note_id: int, comment: str) -> str:
     """Add a comment to a note."""
     return _add_note_comment(note_id, comment, case_id)
 
 
-@mcp.tool()
-def list_note_comments(case_id: int, note_id: int) -> str:
-    """List comments for a note."""
-    return _list_note_comments(note_id, case_id)
+@_iris_tool()
+def list_note_comments(case_id: int, note_id: int, output: OutputFormat = "text") -> str | dict[str, Any]:
+    """List comments for a note (`output="json"` returns `{"items", "total"}`)."""
+    return _list_note_comments(note_id, case_id, output)
 
 
-@mcp.tool()
-def search_notes(case_id: int, search_term: str = "%") -> str:
-    """Search notes by term (use '%' to list all titles/ids)."""
-    return _search_notes(case_id, search_term)
+@_iris_tool()
+def search_notes(case_id: int, search_term: str = "%", output: OutputFormat = "text") -> str | dict[str, Any]:
+    """Search notes by term (use '%' to list all titles/ids; `output="json"` returns `{"items", "total"}`)."""
+    return _search_notes(case_id, search_term, output)
+
+
+@_iris_tool()
+def search_notes_fulltext(case_id: int, query: str, limit: int = 10, output: OutputFormat = "text") -> str | dict[str, Any]:
+    """
+    Full-text search over note titles and content, ranked best first with highlighted snippets.
+
+    Every word of `query` must match (as a word prefix). The case's notes are indexed locally
+    on first use and kept current as notes are changed through this server.
+    With `output="json"` the matches are returned as `{"items", "total"}`.
+    """
+    return _search_notes_fulltext(case_id, query, limit, output)
 
 
 # -------------------------------
@@ -1211,29 +3931,42 @@ def search_notes(case_id: int, search_term: str = "%") -> str:
 # -------------------------------
 
 
-def _list_tasks(case_id: int) -> str:
+def _list_tasks(
+    case_id: int,
+    limit: int | None = None,
+    offset: int = 0,
+    cursor: str | None = None,
+    output: OutputFormat = "text",
+    *,
+    filter_text: str | None = None,
+) -> str | dict[str, Any]:
     try:
         session = get_iris_client()
         case_obj = _prepare_case(session, case_id)
-        resp = case_obj.list_tasks(cid=case_id)
-        data = _extract_data(resp, f"Listing tasks for case {case_id}")
-
-        # The API returns a dict with 'tasks' key
-        if isinstance(data, dict) and "tasks" in data:
-            items = data["tasks"]
-        else:
-            items = _ensure_list(data)
 
-        if not items:
+        def fetch() -> list[Any]:
+            resp = case_obj.list_tasks(cid=case_id)
+            data = _extract_data(resp, f"Listing tasks for case {case_id}")
+            # The API returns a dict with 'tasks' key
+            if isinstance(data, dict) and "tasks" in data:
+                return list(data["tasks"] or [])
+            return _ensure_list(data)
+
+        page = _paginate(
+            "tasks",
+            (case_id, filter_text),
+            _mirrored(session, case_id, "tasks", fetch, filter_text),
+            _sort_key("tasks", ("task_id", "id")),
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+        records = [TaskRecord.from_payload(task) for task in page.items]
+        if output == "json":
+            return _page_payload(records, page)
+        if not page.total:
             return f"No tasks found for case {case_id}."
-        result = f"Tasks for Case {case_id}:\n"
-        for task in items:
-            tid = _get_field(task, "task_id", "id")
-            title = _get_field(task, "task_title", "title", "name")
-            status = _get_field(task, "task_status", "status", "status_name", "task_status_name")
-            assignees = _get_field(task, "assignees", "task_assignees")
-            result += f"- ID: {tid}, Title: {title}, Status: {status}, Assignees: {assignees}\n"
-        return result.rstrip()
+        return _render(f"Tasks for Case {case_id}:", map(_task_line, records), page.footer()).rstrip()
     except Exception as e:
         return f"Error listing tasks: {e!s}"
 
@@ -1249,6 +3982,7 @@ def _add_task(
 ) -> str:
     try:
         session = get_iris_client()
+        status = _resolve_catalog_name("task_statuses", status, "task status", session)
         case_obj = _prepare_case(session, case_id)
         resp = case_obj.add_task(
             title=title,
@@ -1261,6 +3995,7 @@ def _add_task(
         )
         data = _extract_data(resp, f"Adding task to case {case_id}")
         tid = _get_field(data, "task_id", "id")
+        _COLLECTIONS.invalidate("tasks", case_id)
         return f"Task added. ID: {tid}"
     except Exception as e:
         return f"Error adding task: {e!s}"
@@ -1274,6 +4009,7 @@ def _update_task(case_id: int, task_id: int, **fields: Any) -> str:
         payload.update({k: v for k, v in fields.items() if v is not None})
         resp = case_obj.update_task(**payload)
         _extract_data(resp, f"Updating task {task_id}")
+        _COLLECTIONS.invalidate("tasks", case_id)
         return f"Task {task_id} updated."
     except Exception as e:
         return f"Error updating task: {e!s}"
@@ -1285,6 +4021,7 @@ def _delete_task(case_id: int, task_id: int) -> str:
         case_obj = _prepare_case(session, case_id)
         resp = case_obj.delete_task(task_id=task_id, cid=case_id)
         _extract_data(resp, f"Deleting task {task_id}")
+        _COLLECTIONS.invalidate("tasks", case_id)
         return f"Task {task_id} deleted."
     except Exception as e:
         return f"Error deleting task: {e!s}"
@@ -1301,24 +4038,18 @@ def _add_task_comment(case_id: int, task_id: int, comment: str) -> str:
         return f"Error adding task comment: {e!s}"
 
 
-def _list_task_comments(case_id: int, task_id: int) -> str:
+def _list_task_comments(case_id: int, task_id: int, output: OutputFormat = "text") -> str | dict[str, Any]:
     try:
         session = get_iris_client()
         case_obj = _prepare_case(session, case_id)
         resp = case_obj.list_task_comments(task_id=task_id, cid=case_id)
         data = _extract_data(resp, f"Listing task comments for task {task_id}")
-        items = _ensure_list(data)
-        if not items:
+        records = [CommentRecord.from_payload(c, "task_comments") for c in _ensure_list(data)]
+        if output == "json":
+            return {"items": [r.to_dict() for r in records], "total": len(records)}
+        if not records:
             return f"No comments found for task {task_id}."
-        result = f"Comments for task {task_id}:\n"
-        for c in items:
-            cid = _get_field(c, "comment_id", "id")
-            author = _get_field(c, "user", "author")
-            if isinstance(author, dict):
-                author = _get_field(author, "user_login", "user_name", "name")
-            content = _get_field(c, "comment_content", "comment")
-            result += f"- ID: {cid}, Author: {author}, Comment: {content}\n"
-        return result.rstrip()
+        return _render(f"Comments for task {task_id}:", map(_comment_line, records)).rstrip()
     except Exception as e:
         return f"Error listing task comments: {e!s}"
 
@@ -1345,13 +4076,27 @@ def _delete_task_comment(case_id: int, task_id: int, comment_id: int) -> str:
         return f"Error deleting task comment: {e!s}"
 
 
-@mcp.tool()
-def list_tasks(case_id: int) -> str:
-    """List tasks for a case."""
-    return _list_tasks(case_id)
+@_iris_tool()
+def list_tasks(
+    case_id: int,
+    limit: int | None = None,
+    offset: int = 0,
+    cursor: str | None = None,
+    output: OutputFormat = "text",
+    *,
+    filter_text: str | None = None,
+) -> str | dict[str, Any]:
+    """List tasks for a case.
+
+    Results are sorted by task ID. Pass `limit` (and `offset`) to page through them; follow-up
+    pages requested with the returned `cursor` are served from the server-side snapshot.
+    With `output="json"` the page is returned as `{"items", "total", "offset", "next_cursor"}`.
+    `filter_text` keeps only rows containing the text (case-insensitive) in any field.
+    """
+    return _list_tasks(case_id, limit, offset, cursor, output, filter_text=filter_text)
 
 
-@mcp.tool()
+@_iris_tool()
 def add_task(
     case_id: int,
     title: str,
@@ -1365,81 +4110,108 @@ def add_task(
     return _add_task(case_id, title, status, assignees, description, tags, custom_attributes)
 
 
-@mcp.tool()
+@_iris_tool()
 def update_task(case_id: int, task_id: int, fields: dict[str, Any] | None = None) -> str:
     """Update a task (status/title/assignees/etc)."""
     fields = fields or {}
     return _update_task(case_id, task_id, **fields)
 
 
-@mcp.tool()
+@_iris_tool()
 def delete_task(case_id: int, task_id: int) -> str:
     """Delete a task."""
     return _delete_task(case_id, task_id)
 
 
-@mcp.tool()
+@_iris_tool()
 def add_task_comment(case_id: int, task_id: int, comment: str) -> str:
     """Add a comment to a task."""
     return _add_task_comment(case_id, task_id, comment)
 
 
-@mcp.tool()
-def list_task_comments(case_id: int, task_id: int) -> str:
-    """List comments for a task."""
-    return _list_task_comments(case_id, task_id)
+@_iris_tool()
+def list_task_comments(case_id: int, task_id: int, output: OutputFormat = "text") -> str | dict[str, Any]:
+    """List comments for a task (`output="json"` returns `{"items", "total"}`)."""
+    return _list_task_comments(case_id, task_id, output)
 
 
-@mcp.tool()
+@_iris_tool()
 def update_task_comment(case_id: int, task_id: int, comment_id: int, comment: str) -> str:
     """Update a task comment."""
     return _update_task_comment(case_id, task_id, comment_id, comment)
 
 
-@mcp.tool()
+@_iris_tool()
 def delete_task_comment(case_id: int, task_id: int, comment_id: int) -> str:
     """Delete a task comment."""
     return _delete_task_comment(case_id, task_id, comment_id)
 
 
-def _list_assets(case_id: int) -> str:
+def _list_assets(
+    case_id: int,
+    limit: int | None = None,
+    offset: int = 0,
+    cursor: str | None = None,
+    output: OutputFormat = "text",
+    *,
+    filter_text: str | None = None,
+) -> str | dict[str, Any]:
     try:
         session = get_iris_client()
-        assets = Case(session).list_assets(cid=case_id)
-        data = _extract_data(assets, f"Listing assets for case {case_id}")
-        items = _ensure_list(data)
-        if not items:
-            return f"No assets found for case {case_id}."
 
-        result = f"Assets for Case {case_id}:\n"
-        for asset in items:
-            aid = _get_field(asset, "asset_id", "id")
-            name = _get_field(asset, "asset_name", "name")
-            atype = _get_field(asset, "asset_type_id", "asset_type", "asset_type_name")
-            status = _get_field(asset, "analysis_status_id", "analysis_status", "analysis_status_name")
+        def fetch() -> list[Any]:
+            assets = Case(session).list_assets(cid=case_id)
+            return _ensure_list(_extract_data(assets, f"Listing assets for case {case_id}"))
 
-            if aid is None and name is None and atype is None and status is None:
-                result += f"- {asset}\n"
-            else:
-                result += f"- ID: {aid}, Name: {name}, Type: {atype}, Status: {status}\n"
-        return result
+        def listing() -> list[Any]:
+            rows = _mirrored(session, case_id, "assets", fetch, filter_text)()
+            return rows if filter_text else _CASE_MEMBERS.load(case_id, "assets", rows)
+
+        page = _paginate(
+            "assets",
+            (case_id, filter_text),
+            listing,
+            _sort_key("assets", ("asset_id", "id")),
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+        records = [AssetRecord.from_payload(asset) for asset in page.items]
+        if output == "json":
+            return _page_payload(records, page)
+        if not page.total:
+            return f"No assets found for case {case_id}."
+        return _render(f"Assets for Case {case_id}:", map(_asset_line, records), page.footer())
     except Exception as e:
         return f"Error listing assets: {e!s}"
 
 
-@mcp.tool()
-def list_assets(case_id: int) -> str:
+@_iris_tool()
+def list_assets(
+    case_id: int,
+    limit: int | None = None,
+    offset: int = 0,
+    cursor: str | None = None,
+    output: OutputFormat = "text",
+    *,
+    filter_text: str | None = None,
+) -> str | dict[str, Any]:
     """
     List assets for a specific case.
+
+    Results are sorted by asset ID. Pass `limit` (and `offset`) to page through them; follow-up
+    pages requested with the returned `cursor` are served from the server-side snapshot.
+    With `output="json"` the page is returned as `{"items", "total", "offset", "next_cursor"}`.
+    `filter_text` keeps only rows containing the text (case-insensitive) in any field.
     """
-    return _list_assets(case_id)
+    return _list_assets(case_id, limit, offset, cursor, output, filter_text=filter_text)
 
 
 def _add_asset(
     case_id: int,
     name: str,
     asset_type: str,
-    analysis_status: str = "New",
+    analysis_status: str = "Unspecified",
     description: str = "",
     compromise_status: str | int | None = None,
     tags: list[str] | str | None = None,
@@ -1448,9 +4220,16 @@ def _add_asset(
     additional_info: str | None = None,
     ioc_links: list[int] | None = None,
     custom_attributes: dict[str, Any] | None = None,
+    allow_duplicate: bool = False,
 ) -> str:
+    reserved = False
     try:
         session = get_iris_client()
+        asset_type = _resolve_catalog_name("assets", asset_type, "asset type", session)
+        analysis_status = _resolve_catalog_name("analysis_statuses", analysis_status, "analysis status", session)
+        existing, reserved = (None, False) if allow_duplicate else _claim_member(session, case_id, "assets", (name, None))
+        if existing is not None:
+            return _duplicate_message("Asset", case_id, name, existing)
         if isinstance(tags, str):
             tags = [t.strip() for t in tags.split(",") if t.strip()]
         asset = Case(session).add_asset(
@@ -1468,17 +4247,23 @@ def _add_asset(
             cid=case_id,
         )
         data = _extract_data(asset, f"Adding asset to case {case_id}")
-        return f"Asset added successfully. ID: {_get_field(data, 'asset_id', 'id')}"
+        asset_id = _get_field(data, "asset_id", "id")
+        reserved = False
+        _CASE_MEMBERS.settle(case_id, "assets", (name, None), asset_id)
+        _COLLECTIONS.invalidate("assets", case_id)
+        return f"Asset added successfully. ID: {asset_id}"
     except Exception as e:
+        if reserved:
+            _CASE_MEMBERS.settle(case_id, "assets", (name, None))
         return f"Error adding asset: {e!s}"
 
 
-@mcp.tool()
+@_iris_tool()
 def add_asset(
     case_id: int,
     name: str,
     asset_type: str,
-    analysis_status: str = "New",
+    analysis_status: str = "Unspecified",
     description: str = "",
     compromise_status: str | int | None = None,
     tags: list[str] | str | None = None,
@@ -1487,9 +4272,15 @@ def add_asset(
     additional_info: str | None = None,
     ioc_links: list[int] | None = None,
     custom_attributes: dict[str, Any] | None = None,
+    allow_duplicate: bool = False,
 ) -> str:
     """
     Add an asset to a case.
+
+    `asset_type` and `analysis_status` are matched against `list_types` ignoring case, spaces,
+    `-` and `_` (e.g. "windows computer"); unknown names are rejected with suggestions.
+    An asset name already in the case is not added again; its ID is returned instead, unless
+    `allow_duplicate` is set.
     """
     return _add_asset(
         case_id,
@@ -1504,145 +4295,1121 @@ def add_asset(
         additional_info,
         ioc_links,
         custom_attributes,
+        allow_duplicate,
     )
 
 
-def _list_iocs(case_id: int) -> str:
+def _list_iocs(
+    case_id: int,
+    limit: int | None = None,
+    offset: int = 0,
+    cursor: str | None = None,
+    output: OutputFormat = "text",
+    *,
+    filter_text: str | None = None,
+) -> str | dict[str, Any]:
     try:
         session = get_iris_client()
-        iocs = Case(session).list_iocs(cid=case_id)
-        data = _extract_data(iocs, f"Listing IOCs for case {case_id}")
-        items = _ensure_list(data)
-        if not items:
-            return f"No IOCs found for case {case_id}."
 
-        result = f"IOCs for Case {case_id}:\n"
-        for ioc in items:
-            iid = _get_field(ioc, "ioc_id", "id")
-            value = _get_field(ioc, "ioc_value", "value", "ioc", "indicator")
-            itype = _get_field(ioc, "ioc_type", "ioc_type_id", "ioc_type_name", "type")
-            desc = _get_field(ioc, "ioc_description", "description", "ioc_desc")
-            tlp = _get_field(ioc, "tlp_name", "ioc_tlp", "ioc_tlp_id", "tlp")
-            tags = _get_field(ioc, "ioc_tags", "tags")
-
-            if iid is None and value is None and itype is None and desc is None:
-                result += f"- {ioc}\n"
-            else:
-                result += f"- ID: {iid}, Value: {value}, Type: {itype}, TLP: {tlp}, Tags: {tags}, Description: {desc}\n"
-        return result
+        def fetch() -> list[Any]:
+            iocs = Case(session).list_iocs(cid=case_id)
+            return _ensure_list(_extract_data(iocs, f"Listing IOCs for case {case_id}"))
+
+        def listing() -> list[Any]:
+            rows = _mirrored(session, case_id, "iocs", fetch, filter_text)()
+            return rows if filter_text else _CASE_MEMBERS.load(case_id, "iocs", _IOC_INDEX.index_case(case_id, rows))
+
+        page = _paginate(
+            "iocs",
+            (case_id, filter_text),
+            listing,
+            _sort_key("iocs", ("ioc_id", "id")),
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+        records = [IocRecord.from_payload(ioc) for ioc in page.items]
+        if output == "json":
+            return _page_payload(records, page)
+        if not page.total:
+            return f"No IOCs found for case {case_id}."
+        return _render(f"IOCs for Case {case_id}:", map(_ioc_line, records), page.footer())
     except Exception as e:
         return f"Error listing IOCs: {e!s}"
 
 
-@mcp.tool()
-def list_iocs(case_id: int) -> str:
+@_iris_tool()
+def list_iocs(
+    case_id: int,
+    limit: int | None = None,
+    offset: int = 0,
+    cursor: str | None = None,
+    output: OutputFormat = "text",
+    *,
+    filter_text: str | None = None,
+) -> str | dict[str, Any]:
     """
     List IOCs for a specific case.
+
+    Results are sorted by IOC ID. Pass `limit` (and `offset`) to page through them; follow-up
+    pages requested with the returned `cursor` are served from the server-side snapshot.
+    With `output="json"` the page is returned as `{"items", "total", "offset", "next_cursor"}`.
+    `filter_text` keeps only rows containing the text (case-insensitive) in any field.
     """
-    return _list_iocs(case_id)
+    return _list_iocs(case_id, limit, offset, cursor, output, filter_text=filter_text)
+
+
+# -------------------------------
+# IOC validation
+# -------------------------------
+
+_is_hex = frozenset("0123456789abcdefABCDEF").issuperset
+_FIXED_HEX = re.compile(r"\[a-f0-9\]\{(\d+)\}")
+_FILENAME_HEX = re.compile(r"\.\+\\\|\[a-f0-9\]\{(\d+)\}")
+_VALIDATION_CHUNK = 64
+
+
+class _IocRule:
+    """One ``validation_regex``, applied as Iris does: full match, case-insensitive."""
+
+    __slots__ = ("expectation", "fullmatch")
+
+    def __init__(self, regex: str, expectation: str) -> None:
+        self.fullmatch = re.compile(regex, re.IGNORECASE).fullmatch
+        self.expectation = expectation
+
+    def matches(self, value: str) -> bool:
+        return self.fullmatch(value) is not None
+
+    def matches_many(self, values: list[str]) -> list[bool]:
+        return list(map(self.matches, values))
+
+
+class _HexRule(_IocRule):
+    """``[a-f0-9]{N}`` as a length and character-set check; batches are checked chunk-wise."""
+
+    __slots__ = ("length",)
+
+    def __init__(self, regex: str, expectation: str, length: int) -> None:
+        super().__init__(regex, expectation)
+        self.length = length
+
+    def matches(self, value: str) -> bool:
+        return len(value) == self.length and _is_hex(value)
+
+    def matches_many(self, values: list[str]) -> list[bool]:
+        out: list[bool] = []
+        for start in range(0, len(values), _VALIDATION_CHUNK):
+            chunk = values[start : start + _VALIDATION_CHUNK]
+            # Valid input is the common case: one join and one scan settle the whole chunk.
+            if set(map(len, chunk)) == {self.length} and _is_hex("".join(chunk)):
+                out.extend(itertools.repeat(True, len(chunk)))
+            else:
+                out.extend(map(self.matches, chunk))
+        return out
+
+
+class _FilenameHexRule(_IocRule):
+    """``.+\\|[a-f0-9]{N}`` without backtracking: a non-empty single-line name, ``|``, then N hex digits."""
+
+    __slots__ = ("length",)
+
+    def __init__(self, regex: str, expectation: str, length: int) -> None:
+        super().__init__(regex, expectation)
+        self.length = length
+
+    def matches(self, value: str) -> bool:
+        sep = len(value) - self.length - 1
+        return sep > 0 and value[sep] == "|" and _is_hex(value[sep + 1 :]) and "\n" not in value[:sep]
+
+
+def _compile_ioc_rule(regex: str, expectation: str) -> _IocRule:
+    if match := _FIXED_HEX.fullmatch(regex):
+        return _HexRule(regex, expectation, int(match.group(1)))
+    if match := _FILENAME_HEX.fullmatch(regex):
+        return _FilenameHexRule(regex, expectation, int(match.group(1)))
+    return _IocRule(regex, expectation)
+
+
+class _IocValidator:
+    """``IOC_VALIDATIONS`` compiled once, on first use; validates single values or whole batches locally.
+
+    Types without a ``validation_regex`` (and numeric type IDs) are not checked.
+    """
+
+    def __init__(self, validations: Callable[[], dict[str, dict[str, str]]]) -> None:
+        self._validations = validations
+
+    @functools.cached_property
+    def _rules(self) -> dict[str, _IocRule]:
+        return {
+            name.lower(): _compile_ioc_rule(spec["validation_regex"], spec.get("validation_expectation") or spec["validation_regex"])
+            for name, spec in self._validations().items()
+            if spec.get("validation_regex")
+        }
+
+    def rule(self, ioc_type: Any) -> _IocRule | None:
+        return self._rules.get(ioc_type.strip().lower()) if isinstance(ioc_type, str) else None
+
+    def check(self, ioc_type: Any, value: str) -> str | None:
+        """Return why ``value`` is not a valid ``ioc_type`` (None when valid or not checkable)."""
+        rule = self.rule(ioc_type)
+        if rule is None or rule.matches(value):
+            return None
+        return f"invalid {ioc_type} value (expected {rule.expectation})"
+
+    def check_many(self, ioc_type: Any, values: list[str]) -> list[bool]:
+        """Validity of each value for a single type."""
+        rule = self.rule(ioc_type)
+        return [True] * len(values) if rule is None else rule.matches_many(values)
+
+    def check_batch(self, rows: Iterable[tuple[Any, str]]) -> list[str | None]:
+        """Problems for ``(ioc_type, value)`` rows, in order; values are validated per type in one pass."""
+        groups: dict[Any, tuple[list[int], list[str]]] = {}
+        count = 0
+        for count, (ioc_type, value) in enumerate(rows, start=1):
+            group = groups.get(ioc_type)
+            if group is None:
+                group = groups[ioc_type] = ([], [])
+            group[0].append(count - 1)
+            group[1].append(value)
+        problems: list[str | None] = [None] * count
+        for ioc_type, (indices, values) in groups.items():
+            rule = self.rule(ioc_type)
+            if rule is None:
+                continue
+            problem = f"invalid {ioc_type} value (expected {rule.expectation})"
+            for idx in itertools.compress(indices, map(operator.not_, rule.matches_many(values))):
+                problems[idx] = problem
+        return problems
+
+
+_IOC_VALIDATOR = _IocValidator(lambda: types_catalog.IOC_VALIDATIONS)
+
+
+# -------------------------------
+# IOC type detection
+# -------------------------------
+
+# Hex digests by length; the first listed name present in the catalog wins.
+_HEX_DIGESTS = {32: "md5", 40: "sha1", 56: "sha224", 64: "sha256", 70: "tlsh", 96: "sha384", 128: "sha512"}
+_REGKEY_PREFIXES = ("hklm\\", "hkcu\\", "hku\\", "hkcr\\", "hkcc\\", "hkey_")
+_is_ipv4_chars = frozenset("0123456789./").issuperset
+_is_digits = frozenset("0123456789").issuperset
+_MAX_PORT = 65535
+_HOST = r"(?:[a-z0-9_](?:[a-z0-9_-]{0,61}[a-z0-9_])?\.)+[a-z](?:[a-z0-9-]{0,61}[a-z0-9])?"
+_HOST_RE = re.compile(_HOST, re.IGNORECASE)
+_EMAIL_RE = re.compile(r"[^@\s]+@" + _HOST, re.IGNORECASE)
+_URL_RE = re.compile(r"[a-z][a-z0-9+.-]*://[^\s/?#]+\S*", re.IGNORECASE)
+_MAC_RE = re.compile(r"[0-9a-f]{2}([:-])[0-9a-f]{2}(?:\1[0-9a-f]{2}){4}", re.IGNORECASE)
+_SSDEEP_RE = re.compile(r"\d+:[a-z0-9/+]+:[a-z0-9/+]+(?:,\S*)?", re.IGNORECASE)
+_CVE_RE = re.compile(r"cve-\d{4}-\d{4,}", re.IGNORECASE)
+_ASN_RE = re.compile(r"as\d{1,10}", re.IGNORECASE)
+_TLSH_RE = re.compile(r"t1[a-f0-9]{70}", re.IGNORECASE)
+# File extensions that make a dotted name as likely a file as a domain (some are also TLDs).
+_FILE_EXTENSIONS = frozenset(
+    "exe dll sys scr msi bat cmd ps1 psm1 vbs vbe js jse wsf hta lnk jar py sh bin elf so dylib apk dmg pkg iso img vhd vhdx "
+    "zip rar 7z gz tgz tar cab doc docx docm xls xlsx xlsm ppt pptx pdf rtf one txt log csv tmp dat ini cfg xml htm html eml msg evtx".split()
+)
+
+
+def _ambiguous_domain(value: str, ioc_type: str | None) -> bool:
+    """True for a detected domain such as ``evil.exe`` whose last label is a common file extension."""
+    return ioc_type == "domain" and value.strip().rpartition(".")[2].lower() in _FILE_EXTENSIONS
+
+
+def _is_ip(value: str) -> bool:
+    try:
+        if "/" in value:
+            ipaddress.ip_network(value, strict=False)
+        else:
+            ipaddress.ip_address(value)
+    except ValueError:
+        return False
+    return True
+
+
+class _IocClassifier:
+    """Guess the ``IOC_TYPES`` entry of raw indicator strings.
+
+    Cheap tests (character set, length, a separator or scheme) pick at most one candidate
+    before any regex runs, so most values cost a couple of set lookups. Only types present
+    in the catalog are returned, and a hex guess always passes that type's validation.
+    """
+
+    def __init__(self, ioc_types: Callable[[], list[dict[str, str]]]) -> None:
+        self._ioc_types = ioc_types
+        # Patterns that can only match values starting with a given (lowercase) character.
+        self._by_first: dict[str, list[tuple[re.Pattern[str], str]]] = {}
+        for chars, pattern, name in (
+            ("0123456789abcdef", _MAC_RE, "mac-address"),
+            ("0123456789", _SSDEEP_RE, "ssdeep"),
+            ("c", _CVE_RE, "vulnerability"),
+            ("a", _ASN_RE, "AS"),
+            ("t", _TLSH_RE, "tlsh"),
+        ):
+            for char in chars:
+                self._by_first.setdefault(char, []).append((pattern, name))
+
+    @functools.cached_property
+    def _known(self) -> frozenset[str]:
+        return frozenset(item["type"] for item in self._ioc_types())
+
+    @functools.cached_property
+    def _digests(self) -> dict[int, str]:
+        return {length: name for length, name in _HEX_DIGESTS.items() if name in self._known}
+
+    def _pick(self, name: str) -> str | None:
+        return name if name in self._known else None
+
+    def _pair(self, value: str) -> str | None:
+        left, _, right = value.rpartition("|")
+        if not left or not right:
+            return None
+        if _is_hex(right) and (digest := self._digests.get(len(right))) and "\n" not in left:
+            return self._pick(f"filename|{digest}")
+        if _TLSH_RE.fullmatch(right):
+            return self._pick("filename|tlsh")
+        if _is_digits(right) and int(right) <= _MAX_PORT:
+            if _is_ip(left):
+                return self._pick("ip-dst|port")
+            return self._pick("hostname|port") if _HOST_RE.fullmatch(left) else None
+        if _HOST_RE.fullmatch(left) and _is_ip(right):
+            return self._pick("domain|ip")
+        return None
+
+    def _classify(self, value: str) -> str | None:
+        if _is_hex(value):
+            return self._digests.get(len(value))
+        if "|" in value:
+            return self._pair(value)
+        if "://" in value:
+            return self._pick("url") if _URL_RE.fullmatch(value) else None
+        if "@" in value:
+            return self._pick("email") if _EMAIL_RE.fullmatch(value) else None
+        if (_is_ipv4_chars(value) or ":" in value) and _is_ip(value):
+            return self._pick("ip-dst")
+        lowered = value[:5].lower()
+        if lowered.startswith(_REGKEY_PREFIXES):
+            return self._pick("regkey")
+        for pattern, name in self._by_first.get(lowered[0], ()):
+            if pattern.fullmatch(value):
+                return self._pick(name)
+        if "\\" in value or value.startswith("/"):
+            return self._pick("file-path")
+        return self._pick("domain") if "." in value and _HOST_RE.fullmatch(value) else None
+
+    def classify(self, value: Any) -> str | None:
+        """Return the detected type name, or None when the value is not recognized."""
+        if not isinstance(value, str):
+            return None
+        value = value.strip()
+        return self._classify(value) if value else None
+
+    def classify_many(self, values: Iterable[Any]) -> list[str | None]:
+        """Classify values in order; repeated values are classified once."""
+        memo: dict[Any, str | None] = {}
+        return [memo[value] if value in memo else memo.setdefault(value, self.classify(value)) for value in values]
+
+
+_IOC_CLASSIFIER = _IocClassifier(lambda: types_catalog.IOC_TYPES)
+
+
+def _split_tags(tags: list[str] | str | None) -> list[str] | None:
+    if isinstance(tags, str):
+        return [t.strip() for t in tags.split(",") if t.strip()]
+    return tags
+
+
+def _submit_ioc(
+    case_obj: Any,
+    case_id: int,
+    value: str,
+    ioc_type: str | int,
+    description: str = "",
+    ioc_tlp: str | int | None = None,
+    ioc_tags: list[str] | str | None = None,
+    custom_attributes: dict[str, Any] | None = None,
+) -> Any:
+    """Create one IOC and return its ID (raises on API errors)."""
+    ioc = case_obj.add_ioc(
+        value=value,
+        ioc_type=ioc_type,
+        description=description,
+        ioc_tlp=ioc_tlp,
+        ioc_tags=_split_tags(ioc_tags),
+        custom_attributes=custom_attributes,
+        cid=case_id,
+    )
+    data = _extract_data(ioc, f"Adding IOC to case {case_id}")
+    return _get_field(data, "ioc_id", "id")
 
 
 def _add_ioc(
     case_id: int,
     value: str,
-    ioc_type: str,
+    ioc_type: str | None = None,
     description: str = "",
     ioc_tlp: str | int | None = None,
     ioc_tags: list[str] | str | None = None,
     custom_attributes: dict[str, Any] | None = None,
+    allow_duplicate: bool = False,
 ) -> str:
+    reserved = False
     try:
+        detected = ""
+        if not ioc_type:
+            ioc_type = _IOC_CLASSIFIER.classify(value)
+            if ioc_type is None:
+                return "Error adding IOC: could not detect the IOC type of this value; pass ioc_type (see list_ioc_types)"
+            if _ambiguous_domain(value, ioc_type):
+                return f"Error adding IOC: '{value}' could be a file name or a domain; pass ioc_type (e.g. 'filename' or 'domain')"
+            detected = f" (detected type: {ioc_type})"
         session = get_iris_client()
-        if isinstance(ioc_tags, str):
-            ioc_tags = [t.strip() for t in ioc_tags.split(",") if t.strip()]
-        ioc = Case(session).add_ioc(
-            value=value,
-            ioc_type=ioc_type,
-            description=description,
-            ioc_tlp=ioc_tlp,
-            ioc_tags=ioc_tags,
-            custom_attributes=custom_attributes,
-            cid=case_id,
-        )
-        data = _extract_data(ioc, f"Adding IOC to case {case_id}")
-        return f"IOC added successfully. ID: {_get_field(data, 'ioc_id', 'id')}"
+        ioc_type = _resolve_catalog_name("iocs", ioc_type, "IOC type", session)
+        ioc_tlp = _resolve_catalog_name("tlp_levels", ioc_tlp, "TLP", session)
+        if problem := _IOC_VALIDATOR.check(ioc_type, value):
+            return f"Error adding IOC: {problem}"
+        # Listings name the type, so a numeric or server-only type is keyed by its server name.
+        member = (value, _ioc_type_name(session, ioc_type))
+        existing, reserved = (None, False) if allow_duplicate else _claim_member(session, case_id, "iocs", member)
+        if existing is not None:
+            return _duplicate_message("IOC", case_id, value, existing)
+        ioc_id = _submit_ioc(Case(session), case_id, value, ioc_type, description, ioc_tlp, ioc_tags, custom_attributes)
+        reserved = False
+        _CASE_MEMBERS.settle(case_id, "iocs", member, ioc_id)
+        _COLLECTIONS.invalidate("iocs", case_id)
+        _IOC_INDEX.add(case_id, ioc_id, value, ioc_type)
+        return f"IOC added successfully. ID: {ioc_id}{detected}"
     except Exception as e:
+        if reserved:
+            _CASE_MEMBERS.settle(case_id, "iocs", member)
         return f"Error adding IOC: {e!s}"
 
 
-@mcp.tool()
+@_iris_tool()
 def add_ioc(
     case_id: int,
     value: str,
-    ioc_type: str,
+    ioc_type: str | None = None,
     description: str = "",
     ioc_tlp: str | int | None = None,
     ioc_tags: list[str] | str | None = None,
     custom_attributes: dict[str, Any] | None = None,
+    allow_duplicate: bool = False,
 ) -> str:
     """
     Add an IOC to a case.
+
+    When `ioc_type` is omitted it is detected from the value (see `detect_ioc_types`); a dotted name
+    ending in a file extension (`evil.exe`, `invoice.zip`) is refused as ambiguous, so pass `ioc_type` for it.
+    Type and TLP names are matched against `list_types` locally; unknown names are rejected with suggestions.
+    A value already in the case with the same type (ignoring case and surrounding spaces) is not added
+    again; its ID is returned instead, unless `allow_duplicate` is set. While another call is adding the
+    same value, an error is returned; retry once it finished.
     """
-    return _add_ioc(case_id, value, ioc_type, description, ioc_tlp, ioc_tags, custom_attributes)
+    return _add_ioc(case_id, value, ioc_type, description, ioc_tlp, ioc_tags, custom_attributes, allow_duplicate)
 
 
-def _list_customers() -> str:
+def _detect_ioc_types(values: list[str] | str, output: OutputFormat = "text") -> str | dict[str, Any]:
+    try:
+        raw = values.splitlines() if isinstance(values, str) else values
+        unique = list(dict.fromkeys(v.strip() for v in raw if isinstance(v, str) and v.strip()))
+        detected = dict(zip(unique, _IOC_CLASSIFIER.classify_many(unique), strict=True))
+        unrecognized = [value for value, ioc_type in detected.items() if ioc_type is None]
+        if output == "json":
+            return {"types": detected, "unrecognized": unrecognized}
+        if not detected:
+            return "No values provided."
+        lines = [f"- {value}: {ioc_type or 'unrecognized'}" for value, ioc_type in detected.items()]
+        return _render(f"Detected IOC types for {len(detected)} values ({len(unrecognized)} unrecognized):", lines).rstrip("\n")
+    except Exception as e:
+        return f"Error detecting IOC types: {e!s}"
+
+
+@_iris_tool()
+def detect_ioc_types(values: list[str] | str, output: OutputFormat = "text") -> str | dict[str, Any]:
+    """
+    Detect the IOC type (as named in `list_ioc_types`) of raw indicator values.
+
+    `values` is a list or a newline separated string. Recognizes hashes, `filename|hash`
+    pairs, IPs/CIDRs (`ip-dst`), `ip|port`, domains, URLs, emails, registry keys, paths,
+    MAC addresses, CVEs, AS numbers, ssdeep and TLSH. Dotted names such as `evil.exe` are
+    taken as domains, so check the result for file names; `add_ioc` and `add_iocs_bulk` refuse
+    to add detected domains that end in a common file extension without an explicit type.
+    """
+    return _detect_ioc_types(values, output)
+
+
+# -------------------------------
+# Cross-case IOC search
+# -------------------------------
+
+_CASE_NAME_ID = re.compile(r"#(\d+)\b")
+
+
+def _ioc_hit(row: Any, case_id: Any = None) -> dict[str, Any]:
+    """Normalize an IOC row (case listing or global search result) into an index posting."""
+    get = _row_reader("ioc_hits", row)
+    case_name = get("case_name")
+    if case_id is None:
+        case_id = get("case_id", "cid")
+        if case_id is None and isinstance(case_name, str) and (match := _CASE_NAME_ID.match(case_name)):
+            case_id = int(match.group(1))
+    return {
+        "case_id": case_id,
+        "case_name": case_name,
+        "ioc_id": get("ioc_id", "id"),
+        "value": get("ioc_value", "value", "ioc", "indicator"),
+        "type": get("type_name", "ioc_type", "ioc_type_name", "ioc_type_id"),
+    }
+
+
+class _IocIndex:
+    """In-memory inverted index: normalized IOC value -> the cases/IOCs it appears in.
+
+    Fed by every full IOC listing of a case (which replaces that case's postings), by IOCs
+    added through this server and by global search results. A value searched in Iris less
+    than ``ttl`` seconds ago is answered from memory, including "not found"; IOCs added
+    since are merged in from their case postings.
+    """
+
+    def __init__(self, ttl: float = 600.0, max_values: int = 1_000_000) -> None:
+        self.ttl = ttl
+        self.max_values = max_values
+        self.hits = 0
+        self.misses = 0
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._postings: dict[str, dict[tuple[Any, Any], dict[str, Any]]] = {}
+        self._by_case: dict[Any, set[str]] = {}
+        self._listed_cases: set[Any] = set()
+        self._searched: dict[str, tuple[float, frozenset[str]]] = {}
+
+    @staticmethod
+    def normalize(value: Any) -> str:
+        return str(value).strip().casefold()
+
+    def _post(self, hit: dict[str, Any]) -> None:
+        if hit["value"] is None:
+            return
+        key = self.normalize(hit["value"])
+        postings = self._postings.get(key)
+        if postings is None:
+            if len(self._postings) >= self.max_values:
+                self.dropped += 1
+                return
+            postings = self._postings[key] = {}
+        postings[(hit["case_id"], hit["ioc_id"] if hit["ioc_id"] is not None else key)] = hit
+        if hit["case_id"] is not None:
+            self._by_case.setdefault(hit["case_id"], set()).add(key)
+
+    def index_case(self, case_id: int, rows: list[Any]) -> list[Any]:
+        """Replace the postings of ``case_id`` with a full IOC listing; returns ``rows``."""
+        if self.max_values <= 0:
+            return rows
+        hits = [_ioc_hit(row, case_id) for row in rows]
+        with self._lock:
+            for key in self._by_case.pop(case_id, ()):
+                postings = self._postings.get(key, {})
+                for posting_key in [k for k in postings if k[0] == case_id]:
+                    del postings[posting_key]
+                if not postings:
+                    self._postings.pop(key, None)
+            self._by_case[case_id] = set()
+            self._listed_cases.add(case_id)
+            for hit in hits:
+                self._post(hit)
+        return rows
+
+    def add(self, case_id: int, ioc_id: Any, value: str, ioc_type: Any) -> None:
+        if self.max_values > 0:
+            with self._lock:
+                self._post({"case_id": case_id, "case_name": None, "ioc_id": ioc_id, "value": value, "type": ioc_type})
+
+    def record_search(self, term: str, rows: list[Any]) -> list[dict[str, Any]]:
+        """Store a global search result for ``term`` and return its hits."""
+        hits = [_ioc_hit(row) for row in rows]
+        if self.max_values > 0:
+            with self._lock:
+                for hit in hits:
+                    self._post(hit)
+                keys = frozenset(self.normalize(h["value"]) for h in hits if h["value"] is not None)
+                self._searched[self.normalize(term)] = (time.monotonic(), keys)
+        return hits
+
+    def _matching_keys(self, term: str) -> Iterable[str]:
+        key = self.normalize(term)
+        if "%" not in key:
+            return (key,)
+        # Iris-style wildcard: % matches any run of characters.
+        pattern = re.compile(".*".join(map(re.escape, key.split("%"))), re.DOTALL)
+        return [k for k in self._postings if pattern.fullmatch(k)]
+
+    def lookup(self, term: str, *, require_fresh: bool = False) -> list[dict[str, Any]] | None:
+        """Hits for ``term`` from memory; with ``require_fresh`` None unless it was searched within the TTL."""
+        key = self.normalize(term)
+        with self._lock:
+            searched = self._searched.get(key)
+            if require_fresh:
+                if searched is None or time.monotonic() - searched[0] > self.ttl:
+                    self.misses += 1
+                    return None
+                self.hits += 1
+            keys = {*self._matching_keys(term), *(searched[1] if searched else ())}
+            return [hit for k in sorted(keys) for hit in self._postings.get(k, {}).values()]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._postings.clear()
+            self._by_case.clear()
+            self._listed_cases.clear()
+            self._searched.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "values": len(self._postings),
+                "cases": len(self._listed_cases),
+                "searched_terms": len(self._searched),
+                "hits": self.hits,
+                "misses": self.misses,
+                "dropped": self.dropped,
+                "ttl_seconds": self.ttl,
+            }
+
+
+_IOC_INDEX = _IocIndex(ttl=_env_float("IRIS_IOC_INDEX_TTL", 600.0), max_values=_env_int("IRIS_IOC_INDEX_MAX_VALUES", 1_000_000))
+
+_IOC_SEARCH_SHOWN_HITS = 10
+
+
+def _search_terms(values: list[str] | str) -> list[str]:
+    raw = values.replace(",", "\n").splitlines() if isinstance(values, str) else values
+    return list(dict.fromkeys(v.strip() for v in raw if v and v.strip()))
+
+
+def _ioc_search_line(term: str, hits: list[dict[str, Any]], error: str | None) -> str:
+    if error is not None:
+        return f"- {term}: error: {error}"
+    if not hits:
+        return f"- {term}: not found"
+    shown = "; ".join(
+        f"case {h['case_id']}{f' ({h["case_name"]})' if h['case_name'] else ''} IOC {h['ioc_id']} [{h['type']}]" for h in hits[:_IOC_SEARCH_SHOWN_HITS]
+    )
+    more = f" (+{len(hits) - _IOC_SEARCH_SHOWN_HITS} more)" if len(hits) > _IOC_SEARCH_SHOWN_HITS else ""
+    return f"- {term}: {len(hits)} hits — {shown}{more}"
+
+
+def _search_ioc_global(
+    values: list[str] | str,
+    source: Literal["auto", "index", "remote"] = "auto",
+    concurrency: int = 4,
+    output: OutputFormat = "text",
+) -> str | dict[str, Any]:
+    try:
+        terms = _search_terms(values)
+        if not terms:
+            return "No values provided."
+        results: dict[str, list[dict[str, Any]]] = {}
+        errors: dict[str, str] = {}
+        remote: list[str] = []
+        for term in terms:
+            hits = None if source == "remote" else _IOC_INDEX.lookup(term, require_fresh=source == "auto")
+            if hits is None:
+                remote.append(term)
+            else:
+                results[term] = hits
+        if remote:
+            session = get_iris_client()
+
+            def search(term: str) -> list[dict[str, Any]]:
+                data = _extract_data(global_search_ioc(session, term), f"Searching IOC '{term}'")
+                return _IOC_INDEX.record_search(term, _ensure_list(data))
+
+            for term, outcome in _fan_out(search, remote, min(max(1, concurrency), 16)):
+                if isinstance(outcome, Exception):
+                    errors[term] = str(outcome)
+                else:
+                    results[term] = outcome
+        ordered = {term: results[term] for term in terms if term in results}
+        from_index = len(terms) - len(remote)
+        if output == "json":
+            return {"results": ordered, "errors": errors, "from_index": from_index, "from_iris": len(remote), "indexed_cases": _IOC_INDEX.stats()["cases"]}
+
+        found = sum(1 for hits in ordered.values() if hits)
+        lines = [f"IOC search: {found} of {len(terms)} values found ({from_index} answered from the local index, {len(remote)} searched in Iris)"]
+        if source == "index":
+            lines.append(f"Index covers {_IOC_INDEX.stats()['cases']} cases; values missing there may still exist in other cases.")
+        lines.extend(_ioc_search_line(term, ordered.get(term, []), errors.get(term)) for term in terms)
+        return "\n".join(lines)
+    except Exception as e:
+        return f"Error searching IOCs: {e!s}"
+
+
+@_iris_tool(limit=2)
+def search_ioc_global(
+    values: list[str] | str,
+    source: Literal["auto", "index", "remote"] = "auto",
+    concurrency: int = 4,
+    output: OutputFormat = "text",
+) -> str | dict[str, Any]:
+    """
+    Find which cases contain the given IOC values ("have we seen this hash before?").
+
+    `values` is one value, a comma/newline separated string or a list; `%` is a wildcard.
+    `source="auto"` answers values searched in the last few minutes from the local index and
+    searches the rest in Iris; `"index"` never calls Iris (only cases whose IOCs were listed
+    through this server are covered); `"remote"` always searches Iris.
+    """
+    return _search_ioc_global(values, source, concurrency, output)
+
+
+# -------------------------------
+# Case membership index
+# -------------------------------
+
+_ADDING = "adding"  # placeholder ID of a value whose write is in flight
+
+# Collection kind -> (index key, ID) of a listed row.
+_MEMBER_FIELDS: dict[str, Callable[[Any], tuple[tuple[str, str] | None, Any]]] = {
+    "iocs": lambda row: (None if (r := IocRecord.from_payload(row)).value is None else _CaseMembers.key(r.value, r.type), r.id),
+    "assets": lambda row: (None if (a := AssetRecord.from_payload(row)).name is None else _CaseMembers.key(a.name), a.id),
+}
+
+
+class _CaseMembers:
+    """Per-case index of IOC (value, type) pairs and asset names -> ID, for duplicate suppression.
+
+    Built lazily from one ``list_iocs``/``list_assets`` fetch, replaced by every full
+    listing that passes through this server and updated by every add. ``claim`` checks
+    values and reserves the new ones in one step, so concurrent adds of the same value
+    write it once. Reservations are kept apart from the listed members: rebuilds never
+    copy them, and one that is never settled lapses after ``reservation_ttl`` seconds.
+    Entries older than ``ttl`` are rebuilt, which picks up deletions made outside this server.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_cases: int = 256, reservation_ttl: float = 120.0) -> None:
+        self.ttl = ttl
+        self.max_cases = max_cases
+        self.reservation_ttl = reservation_ttl
+        self.builds = 0
+        self.duplicates = 0
+        self._lock = threading.Lock()
+        self._members: OrderedDict[tuple[int, str], tuple[float, dict[tuple[str, str], Any]]] = OrderedDict()
+        self._pending: dict[tuple[int, str], dict[tuple[str, str], float]] = {}
+
+    @staticmethod
+    def normalize(value: Any) -> str:
+        return str(value).strip().casefold()
+
+    @classmethod
+    def key(cls, value: Any, member_type: Any = None) -> tuple[str, str]:
+        """Normalized value and canonical IOC type name ("" for assets and untyped rows)."""
+        if isinstance(member_type, dict):
+            member_type = _get_field(member_type, "type_name", "name")
+        if member_type is None:
+            return cls.normalize(value), ""
+        entry = types_catalog.CATALOG_INDEX["iocs"].lookup(member_type) if isinstance(member_type, str) else None
+        return cls.normalize(value), cls.normalize(entry["type"] if entry is not None else member_type)
+
+    def load(self, case_id: int, kind: str, rows: list[Any]) -> list[Any]:
+        """Replace the members of ``(case_id, kind)`` with a full listing; returns ``rows``."""
+        members: dict[tuple[str, str], Any] = {}
+        for row in rows:
+            key, member_id = _MEMBER_FIELDS[kind](row)
+            if key is not None:
+                members.setdefault(key, member_id)
+        with self._lock:
+            self._members.pop((case_id, kind), None)
+            self._members[(case_id, kind)] = (time.monotonic(), members)
+            while len(self._members) > self.max_cases:
+                self._members.popitem(last=False)
+        return rows
+
+    def claim(
+        self, case_id: int, kind: str, items: Iterable[tuple[str, Any]], fetch: Callable[[], list[Any]], type_ids: dict[str, int] | None = None
+    ) -> dict[tuple[str, Any], Any]:
+        """Return ``{(value, type): existing ID or _ADDING}`` for items already in the case and reserve the others.
+
+        Items carry type names; ``type_ids`` (the server's lowercase name -> ID table) also
+        matches listing rows that only report the type's ID. Each reserved item must be
+        passed to ``settle`` once its write finished or was abandoned.
+        """
+        collection = (case_id, kind)
+        with self._lock:
+            entry = self._members.get(collection)
+            fresh = entry is not None and time.monotonic() - entry[0] <= self.ttl
+        if not fresh:
+            self.load(case_id, kind, fetch())
+            with self._lock:
+                self.builds += 1
+        existing: dict[tuple[str, Any], Any] = {}
+        now = time.monotonic()
+        with self._lock:
+            members = self._members[collection][1] if collection in self._members else {}
+            pending = self._pending.setdefault(collection, {})
+            for lapsed in [key for key, since in pending.items() if now - since > self.reservation_ttl]:
+                del pending[lapsed]
+            for item in items:
+                key = self.key(*item)
+                candidates = [key]
+                if type_ids and key[1] in type_ids:
+                    candidates.append((key[0], str(type_ids[key[1]])))
+                # A listing row without a type matches the value under any type.
+                candidates.append((key[0], ""))
+                found = next((members[c] for c in candidates if c in members), None)
+                if found is None and key in pending:
+                    found = _ADDING
+                if found is None:
+                    pending[key] = now
+                else:
+                    existing[item] = found
+            if not pending:
+                del self._pending[collection]
+            self.duplicates += len(existing)
+        return existing
+
+    def settle(self, case_id: int, kind: str, item: tuple[str, Any], member_id: Any = None) -> None:
+        """Release the reservation of ``item`` and record its ID (``None`` when the write failed).
+
+        A value already known under an ID keeps that ID.
+        """
+        key = self.key(*item)
+        collection = (case_id, kind)
+        with self._lock:
+            pending = self._pending.get(collection)
+            if pending is not None:
+                pending.pop(key, None)
+                if not pending:
+                    del self._pending[collection]
+            entry = self._members.get(collection)
+            if member_id is not None and entry is not None:
+                entry[1].setdefault(key, member_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._members.clear()
+            self._pending.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "collections": len(self._members),
+                "members": sum(len(m) for _, m in self._members.values()),
+                "reserved": sum(len(p) for p in self._pending.values()),
+                "builds": self.builds,
+                "duplicates_suppressed": self.duplicates,
+                "ttl_seconds": self.ttl,
+            }
+
+
+_CASE_MEMBERS = _CaseMembers(
+    ttl=_env_float("IRIS_MEMBERSHIP_TTL", 300.0),
+    max_cases=_env_int("IRIS_MEMBERSHIP_MAX_CASES", 256),
+    reservation_ttl=_env_float("IRIS_MEMBERSHIP_RESERVATION_TTL", 120.0),
+)
+
+
+def _ioc_type_name(session: ClientSession, ioc_type: Any) -> Any:
+    """The server's name for an IOC type ID (as returned by ``_resolve_catalog_name``); names pass through."""
+    if isinstance(ioc_type, int):
+        names = {ref_id: name for name, ref_id in _server_reference(session, "iocs").items()}
+        return names.get(ioc_type, ioc_type)
+    return ioc_type
+
+
+def _claim_member(session: ClientSession, case_id: int, kind: str, item: tuple[str, Any]) -> tuple[Any, bool]:
+    """Return ``(existing ID or _ADDING, reserved)`` for one ``(value, type name)`` about to be added to a case."""
+    try:
+        fetch = _collection_fetchers(Case(session), case_id)[kind]
+        type_ids = _server_reference(session, "iocs") if kind == "iocs" else None
+        existing = _CASE_MEMBERS.claim(case_id, kind, [item], fetch, type_ids).get(item)
+    except Exception as e:
+        # Never block a write because the duplicate check is unavailable.
+        log.debug("Duplicate check for %s in case %s skipped: %s", kind, case_id, e)
+        return None, False
+    return existing, existing is None
+
+
+def _duplicate_message(label: str, case_id: int, value: str, existing: Any) -> str:
+    """The reply for a value already in the case; raises ValueError while another call is still adding it."""
+    if existing == _ADDING:
+        raise ValueError(f"'{value}' is being added to case {case_id} by another call; retry once it finished, or pass allow_duplicate=True")
+    return f"{label} already present in case {case_id}. ID: {existing} (not added again; pass allow_duplicate=True to add it anyway)"
+
+
+# -------------------------------
+# Bulk IOC ingestion
+# -------------------------------
+
+_IOC_ROW_FIELDS = ("value", "ioc_type", "description", "ioc_tlp", "ioc_tags")
+
+
+def _parse_ioc_rows(indicators: list[str | dict[str, Any]] | str) -> Iterator[dict[str, Any]]:
+    """Yield one dict per indicator from a list, a newline blob or CSV text.
+
+    CSV columns follow ``value,ioc_type,description,ioc_tlp,ioc_tags``; trailing columns
+    are optional and a header row naming these columns is skipped.
+    """
+    if isinstance(indicators, str):
+        lines = (line for line in indicators.splitlines() if line.strip() and not line.lstrip().startswith("#"))
+        for cells in csv.reader(lines, skipinitialspace=True):
+            if [c.strip().lower() for c in cells[:2]] in (["value"], ["value", "ioc_type"], ["value", "type"]):
+                continue
+            yield {k: v.strip() for k, v in zip(_IOC_ROW_FIELDS, cells, strict=False) if v.strip()}
+        return
+    for item in indicators:
+        if isinstance(item, dict):
+            row = dict(item)
+            if "value" not in row:
+                row["value"] = _get_field(item, "ioc_value", "indicator", "ioc")
+            if "ioc_type" not in row and _get_field(item, "type") is not None:
+                row["ioc_type"] = _get_field(item, "type")
+            yield row
+        elif str(item).strip():
+            yield {"value": str(item).strip()}
+
+
+def _reference_ids(session: ClientSession, uri: str, name_key: str, id_key: str) -> dict[str, int]:
+    """Fetch (or reuse) a manage/*/list reference table as lowercase name -> ID."""
+    table: dict[str, int] = {}
+    for item in _REFERENCES.rows(session, uri):
+        name = _get_field(item, name_key)
+        ref_id = _get_field(item, id_key)
+        if name is not None and ref_id is not None:
+            table[str(name).lower()] = int(ref_id)
+    return table
+
+
+def _bulk_rows(
+    indicators: list[str | dict[str, Any]] | str,
+    ioc_type: str | None,
+    type_ids: dict[str, int],
+    results: list[tuple[int, str, str, str]],
+    *,
+    skip_existing: bool,
+) -> list[tuple[int, dict[str, Any]]]:
+    """Parse and type the bulk rows; empty, untyped and (with ``skip_existing``) repeated rows go to ``results``."""
+    seen: set[tuple[str, str]] = set()
+    todo: list[tuple[int, dict[str, Any]]] = []
+    for idx, row in enumerate(_parse_ioc_rows(indicators), start=1):
+        value = str(row.get("value") or "").strip()
+        if not value:
+            results.append((idx, value, str(row.get("ioc_type") or ioc_type), "error: empty value"))
+            continue
+        row_type, problem = _bulk_ioc_type(value, row.get("ioc_type") or ioc_type, type_ids)
+        if problem:
+            results.append((idx, value, str(row_type), f"error: {problem}"))
+            continue
+        key = _CaseMembers.key(value, row_type)
+        if skip_existing and key in seen:
+            results.append((idx, value, str(row_type), "skipped: duplicate in batch"))
+            continue
+        seen.add(key)
+        todo.append((idx, {**row, "value": value, "ioc_type": row_type}))
+    return todo
+
+
+def _skip_existing_iocs(
+    case_obj: Any, case_id: int, todo: list[tuple[int, dict[str, Any]]], results: list[tuple[int, str, str, str]], type_ids: dict[str, int]
+) -> list[tuple[int, dict[str, Any]]]:
+    """Record rows already in the case as skipped (or as errors while another call adds them); reserve and return the others."""
+    items = [(row["value"], row["ioc_type"]) for _, row in todo]
+    existing = _CASE_MEMBERS.claim(case_id, "iocs", items, _collection_fetchers(case_obj, case_id)["iocs"], type_ids)
+    for (idx, row), item in zip(todo, items, strict=True):
+        if item in existing:
+            member_id = existing[item]
+            status = "error: being added by another call" if member_id == _ADDING else f"skipped: already present (ID {member_id})"
+            results.append((idx, row["value"], str(row["ioc_type"]), status))
+    return [(idx, row) for (idx, row), item in zip(todo, items, strict=True) if item not in existing]
+
+
+def _drop_invalid_iocs(todo: list[tuple[int, dict[str, Any]]], results: list[tuple[int, str, str, str]]) -> list[tuple[int, dict[str, Any]]]:
+    """Record rows whose value fails validation as errors and return the remaining rows."""
+    problems = _IOC_VALIDATOR.check_batch((row["ioc_type"], row["value"]) for _, row in todo)
+    results.extend((idx, row["value"], str(row["ioc_type"]), f"error: {problem}") for (idx, row), problem in zip(todo, problems, strict=True) if problem)
+    return [entry for entry, problem in zip(todo, problems, strict=True) if not problem]
+
+
+def _bulk_ioc_type(value: str, row_type: Any, type_ids: dict[str, int]) -> tuple[Any, str | None]:
+    """Return ``(type, problem)`` for a bulk row: the canonical catalog name, the type detected
+    from ``value`` when none is given, or a server-only name kept as given."""
+    if not row_type:
+        row_type = _IOC_CLASSIFIER.classify(value)
+        if _ambiguous_domain(value, row_type):
+            return "?", "could be a file name or a domain; set ioc_type"
+        return ("?", "could not detect ioc_type") if row_type is None else (row_type, None)
+    if not isinstance(row_type, str):
+        # Name numeric types like the rest, so duplicate checks match listings that name them.
+        names = {ref_id: name for name, ref_id in type_ids.items()}
+        return names.get(row_type, row_type), None
+    ioc_types = types_catalog.CATALOG_INDEX["iocs"]
+    entry = ioc_types.lookup(row_type)
+    if entry is not None:
+        return entry["type"], None
+    if type_ids and row_type.lower() in type_ids:
+        return row_type, None
+    hint = f" (did you mean: {', '.join(suggestions)}?)" if (suggestions := ioc_types.suggest(row_type)) else ""
+    return row_type, f"unknown IOC type '{row_type}'{hint}"
+
+
+def _add_iocs_bulk(
+    case_id: int,
+    indicators: list[str | dict[str, Any]] | str,
+    ioc_type: str | None = None,
+    description: str = "",
+    ioc_tlp: str | int | None = None,
+    ioc_tags: list[str] | str | None = None,
+    skip_existing: bool = True,
+    concurrency: int = 4,
+) -> str:
     try:
         session = get_iris_client()
-        customers = Customer(session).list_customers()
-        data = _extract_data(customers, "Listing customers")
-        items = _ensure_list(data)
-        if not items:
-            return "No customers found."
+        case_obj = _prepare_case(session, case_id)
+        concurrency = min(max(1, concurrency), 16)
 
-        result = "Customers:\n"
-        for customer in items:
-            cid = _get_field(customer, "customer_id", "id")
-            name = _get_field(customer, "customer_name", "name")
-            sector = _get_field(customer, "customer_sector", "sector")
-            result += f"- ID: {cid}, Name: {name}, Sector: {sector}\n"
-        return result
+        # Resolve type/TLP names once per batch instead of once per IOC inside the client.
+        try:
+            type_ids = _reference_ids(session, "manage/ioc-types/list", "type_name", "type_id")
+            tlp_ids = _reference_ids(session, "manage/tlp/list", "tlp_name", "tlp_id")
+        except Exception:
+            type_ids, tlp_ids = {}, {}
+
+        results: list[tuple[int, str, str, str]] = []
+        todo = _bulk_rows(indicators, ioc_type, type_ids, results, skip_existing=skip_existing)
+
+        # Reject malformed values locally, before any of them goes over the network.
+        todo = _drop_invalid_iocs(todo, results)
+        note = ""
+        if skip_existing and todo:
+            try:
+                todo = _skip_existing_iocs(case_obj, case_id, todo, results, type_ids)
+            except Exception as e:
+                skip_existing = False
+                note = f" (duplicate check unavailable: {e!s})"
+
+        def submit(entry: tuple[int, dict[str, Any]]) -> Any:
+            row = entry[1]
+            row_type = row["ioc_type"]
+            tlp = row.get("ioc_tlp", ioc_tlp)
+            return _submit_ioc(
+                case_obj,
+                case_id,
+                row["value"],
+                type_ids.get(row_type.lower(), row_type) if isinstance(row_type, str) else row_type,
+                row.get("description") or description,
+                tlp_ids.get(tlp.lower(), tlp) if isinstance(tlp, str) else tlp,
+                row.get("ioc_tags", ioc_tags),
+                row.get("custom_attributes"),
+            )
+
+        # Rows reserved by the duplicate check until their outcome is known; released on cancellation too.
+        unsettled = dict(todo) if skip_existing else {}
+        try:
+            for (idx, row), outcome in _fan_out(submit, todo, concurrency):
+                if unsettled.pop(idx, None) is not None:
+                    _CASE_MEMBERS.settle(case_id, "iocs", (row["value"], row["ioc_type"]), None if isinstance(outcome, Exception) else outcome)
+                if not isinstance(outcome, Exception):
+                    _IOC_INDEX.add(case_id, outcome, row["value"], row["ioc_type"])
+                status = f"error: {outcome!s}" if isinstance(outcome, Exception) else f"added (ID {outcome})"
+                results.append((idx, row["value"], str(row["ioc_type"]), status))
+        finally:
+            for row in unsettled.values():
+                _CASE_MEMBERS.settle(case_id, "iocs", (row["value"], row["ioc_type"]))
+
+        if not results:
+            return "No indicators provided."
+        results.sort()
+        added = sum(1 for r in results if r[3].startswith("added"))
+        skipped = sum(1 for r in results if r[3].startswith("skipped"))
+        failed = len(results) - added - skipped
+        if added:
+            _COLLECTIONS.invalidate("iocs", case_id)
+        lines = [f"Bulk IOC import for case {case_id}: {added} added, {skipped} skipped, {failed} failed ({len(results)} rows){note}"]
+        lines.extend(f"{idx}. {value} [{rtype}] {status}" for idx, value, rtype, status in results)
+        return "\n".join(lines)
+    except Exception as e:
+        return f"Error adding IOCs in bulk: {e!s}"
+
+
+@_iris_tool(limit=2)
+def add_iocs_bulk(
+    case_id: int,
+    indicators: list[str | dict[str, Any]] | str,
+    ioc_type: str | None = None,
+    description: str = "",
+    ioc_tlp: str | int | None = None,
+    ioc_tags: list[str] | str | None = None,
+    skip_existing: bool = True,
+    concurrency: int = 4,
+) -> str:
+    """
+    Add many IOCs to a case in one call.
+
+    `indicators` is a list of values (or dicts with value/ioc_type/description/ioc_tlp/ioc_tags),
+    or a text blob with one indicator per line / CSV rows `value,ioc_type,description,ioc_tlp,ioc_tags`.
+    `ioc_type`, `description`, `ioc_tlp` and `ioc_tags` are defaults for rows that omit them;
+    rows without any `ioc_type` get the type detected from their value. Detected domains ending in a
+    file extension (`evil.exe`) are reported as errors; give those rows an explicit `ioc_type`.
+    Values already in the case with the same type (and duplicates within the batch) are skipped with the
+    existing ID, and rows another call is still adding are reported as errors; pass `skip_existing=False`
+    to add them anyway.
+    """
+    return _add_iocs_bulk(case_id, indicators, ioc_type, description, ioc_tlp, ioc_tags, skip_existing, concurrency)
+
+
+def _list_customers(output: OutputFormat = "text") -> str | dict[str, Any]:
+    try:
+        records = [CustomerRecord.from_payload(customer) for customer in _CUSTOMER_DIRECTORY.items()]
+        if output == "json":
+            return {"items": [r.to_dict() for r in records], "total": len(records)}
+        if not records:
+            return "No customers found."
+        return _render("Customers:", map(_customer_line, records))
     except Exception as e:
         return f"Error listing customers: {e!s}"
 
 
-@mcp.tool()
-def list_customers() -> str:
+@_iris_tool()
+def list_customers(output: OutputFormat = "text") -> str | dict[str, Any]:
     """
-    List all customers.
+    List all customers (`output="json"` returns `{"items", "total"}`).
     """
-    return _list_customers()
+    return _list_customers(output)
 
 
-def _get_customer_by_id(customer_id: int) -> str:
+def _get_customer_by_id(customer_id: int, output: OutputFormat = "text") -> str | dict[str, Any]:
     try:
         session = get_iris_client()
-        customer = Customer(session).get_customer_by_id(customer_id=customer_id)
-        data = _extract_data(customer, f"Getting customer {customer_id}")
+        data = _CUSTOMER_DIRECTORY.get(customer_id, session)
+        if data is None:
+            customer = Customer(session).get_customer_by_id(customer_id=customer_id)
+            data = _extract_data(customer, f"Getting customer {customer_id}")
         if not data:
             return f"Customer with ID {customer_id} not found."
 
-        name = _get_field(data, "customer_name", "name")
-        sector = _get_field(data, "customer_sector", "sector")
-        description = _get_field(data, "customer_description", "description")
-        return f"Customer Details:\nID: {customer_id}\nName: {name}\nSector: {sector}\nDescription: {description}"
+        record = CustomerRecord.from_payload(data)
+        if record.id is None:
+            record = replace(record, id=customer_id)
+        if output == "json":
+            return record.to_dict()
+        return f"Customer Details:\nID: {customer_id}\nName: {record.name}\nSector: {record.sector}\nDescription: {record.description}"
     except Exception as e:
         return f"Error getting customer {customer_id}: {e!s}"
 
 
-@mcp.tool()
-def get_customer_by_id(customer_id: int) -> str:
+@_iris_tool()
+def get_customer_by_id(customer_id: int, output: OutputFormat = "text") -> str | dict[str, Any]:
     """
-    Get a customer by ID.
+    Get a customer by ID (`output="json"` returns the normalized record).
     """
-    return _get_customer_by_id(customer_id)
+    return _get_customer_by_id(customer_id, output)
 
 
 def _lookup_customer(customer_name: str) -> str:
     try:
-        session = get_iris_client()
-        customer = Customer(session).lookup_customer(customer_name=customer_name)
-        data = _extract_data(customer, f"Looking up customer {customer_name}")
+        data = _CUSTOMER_DIRECTORY.find(customer_name)
         if not data:
             return f"Customer '{customer_name}' not found."
 
@@ -1653,7 +5420,7 @@ def _lookup_customer(customer_name: str) -> str:
         return f"Error looking up customer '{customer_name}': {e!s}"
 
 
-@mcp.tool()
+@_iris_tool()
 def lookup_customer(customer_name: str) -> str:
     """
     Lookup a customer ID by name.
@@ -1661,10 +5428,435 @@ def lookup_customer(customer_name: str) -> str:
     return _lookup_customer(customer_name)
 
 
+# -------------------------------
+# Change tracking
+# -------------------------------
+
+_CHANGE_KINDS: dict[str, tuple[Callable[[Any], _Record], Callable[[Any], str], str]] = {
+    "events": (EventRecord.from_payload, _event_line, "Events"),
+    "iocs": (IocRecord.from_payload, _ioc_line, "IOCs"),
+    "assets": (AssetRecord.from_payload, _asset_line, "Assets"),
+    "tasks": (TaskRecord.from_payload, _task_line, "Tasks"),
+}
+
+
+def _row_digest(row: Any) -> bytes:
+    return hashlib.blake2b(json.dumps(row, sort_keys=True, default=str).encode(), digest_size=16).digest()
+
+
+def _epoch_seconds(value: Any) -> float | None:
+    """Parse a timestamp with ``_parse_datetime``; naive values are taken as UTC."""
+    parsed = _parse_datetime(value)
+    if parsed is None:
+        return None
+    return (parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)).timestamp()
+
+
+@dataclass
+class _TrackedCollection:
+    """Row digests of the last fetch of one case collection, plus the changes seen so far."""
+
+    state: str | None = None
+    last_update: Any = None
+    baseline: int = 0
+    floor: int = 0
+    digests: dict[Any, bytes] = field(default_factory=dict)
+    log: deque[tuple[int, str, Any, Any]] = field(default_factory=deque)
+    checks: deque[tuple[float, int]] = field(default_factory=deque)
+
+
+class _ChangeTracker:
+    """Per-case change log of events, IOCs, assets and tasks, built from hashed snapshots.
+
+    Each check asks Iris for the collection's ``object_state``; only when it moved is
+    the list fetched and every row hashed. Rows whose digest changed are appended to
+    the log under a process-wide sequence number, so ``changes`` after a sequence
+    number reads only the log entries since then. At most ``max_log`` entries are kept
+    per collection; older tokens then report that the history is no longer available.
+    Syncs of one collection run one at a time, so a slower, older fetch never overwrites
+    the digests of a newer one.
+    """
+
+    def __init__(self, max_collections: int = 256, max_log: int = 10_000) -> None:
+        self.max_collections = max_collections
+        self.max_log = max_log
+        self.epoch = secrets.token_hex(4)
+        self.seq = 0
+        self.fetches = 0
+        self.unchanged = 0
+        self._lock = threading.Lock()
+        self._collections: OrderedDict[tuple[int, str], _TrackedCollection] = OrderedDict()
+        self._syncing = _KeyedLocks()
+
+    def _tracked(self, case_id: int, kind: str) -> _TrackedCollection:
+        key = (case_id, kind)
+        coll = self._collections.get(key)
+        if coll is None:
+            coll = self._collections[key] = _TrackedCollection(checks=deque(maxlen=self.max_log))
+            while len(self._collections) > self.max_collections:
+                self._collections.popitem(last=False)
+        self._collections.move_to_end(key)
+        return coll
+
+    def _checked(self, coll: _TrackedCollection) -> int:
+        self.seq += 1
+        coll.checks.append((time.time(), self.seq))
+        return self.seq
+
+    def sync(self, session: Any, case_id: int, kind: str, fetch: Callable[[], list[Any]]) -> None:
+        """Bring the collection's digests up to date, logging added, modified and deleted rows."""
+        with self._syncing.hold((case_id, kind)):
+            self._sync(session, case_id, kind, fetch)
+
+    def _sync(self, session: Any, case_id: int, kind: str, fetch: Callable[[], list[Any]]) -> None:
+        remote = _CaseMirror._remote_state(session, case_id, kind)
+        with self._lock:
+            coll = self._tracked(case_id, kind)
+            if remote is not None and coll.baseline and coll.state == remote[0]:
+                self.unchanged += 1
+                self._checked(coll)
+                return
+        to_record = _CHANGE_KINDS[kind][0]
+        rows: dict[Any, tuple[bytes, Any]] = {}
+        for row in fetch():
+            digest = _row_digest(row)
+            rec_id = getattr(to_record(row), "id", None)
+            rows[digest if rec_id is None else rec_id] = (digest, row)
+        with self._lock:
+            self.fetches += 1
+            coll = self._tracked(case_id, kind)
+            seq = self._checked(coll)
+            if not coll.baseline:
+                coll.baseline = coll.floor = seq
+            else:
+                changes = [
+                    ("added" if old is None else "modified", rec_id, row)
+                    for rec_id, (digest, row) in rows.items()
+                    if (old := coll.digests.get(rec_id)) != digest
+                ]
+                changes += [("deleted", rec_id, None) for rec_id in coll.digests.keys() - rows.keys()]
+                for op, rec_id, row in changes:
+                    if len(coll.log) >= self.max_log:
+                        coll.floor = coll.log.popleft()[0]
+                    coll.log.append((seq, op, rec_id, row))
+            coll.digests = {rec_id: digest for rec_id, (digest, _) in rows.items()}
+            if remote is not None:
+                coll.state, coll.last_update = remote
+
+    def seq_at(self, case_id: int, kind: str, when: float) -> int | None:
+        """Sequence number of the last check at or before ``when`` (epoch seconds), if any."""
+        with self._lock:
+            coll = self._collections.get((case_id, kind))
+            if coll is None:
+                return None
+            pos = bisect.bisect_right(coll.checks, when, key=operator.itemgetter(0))
+            return coll.checks[pos - 1][1] if pos else None
+
+    def last_update(self, case_id: int, kind: str) -> Any:
+        with self._lock:
+            coll = self._collections.get((case_id, kind))
+            return None if coll is None else coll.last_update
+
+    def changes(self, case_id: int, kind: str, after: int) -> dict[str, list[Any]] | None:
+        """Net changes logged after sequence ``after``; None when that point predates the history."""
+        with self._lock:
+            coll = self._collections.get((case_id, kind))
+            if coll is None or after < max(coll.baseline, coll.floor):
+                return None
+            pos = bisect.bisect_right(coll.log, after, key=operator.itemgetter(0))
+            entries = list(itertools.islice(coll.log, pos, None))
+        net: dict[Any, tuple[str, str, Any]] = {}
+        for _, op, rec_id, row in entries:
+            first = net[rec_id][0] if rec_id in net else op
+            net[rec_id] = (first, op, row)
+        result: dict[str, list[Any]] = {"added": [], "modified": [], "deleted": []}
+        for rec_id, (first, last, row) in net.items():
+            if last == "deleted":
+                if first != "added":
+                    result["deleted"].append(rec_id)
+            else:
+                result["added" if first == "added" else "modified"].append(row)
+        return result
+
+    def token(self) -> str:
+        with self._lock:
+            return _encode_cursor(self.epoch, self.seq)
+
+    def parse_token(self, token: str) -> int | None:
+        try:
+            epoch, seq = _decode_cursor(token)
+        except ValueError:
+            return None
+        return seq if epoch == self.epoch else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._collections.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "collections": len(self._collections),
+                "log_entries": sum(len(c.log) for c in self._collections.values()),
+                "fetches": self.fetches,
+                "unchanged": self.unchanged,
+            }
+
+
+_CHANGES = _ChangeTracker(
+    max_collections=_env_int("IRIS_CHANGE_TRACKER_COLLECTIONS", 256),
+    max_log=_env_int("IRIS_CHANGE_LOG_ENTRIES", 10_000),
+)
+
+
+def _changes_since(case_id: int, since: str | None = None, kinds: list[str] | None = None, output: OutputFormat = "text") -> str | dict[str, Any]:
+    try:
+        kinds = list(kinds or _CHANGE_KINDS)
+        if unknown := [k for k in kinds if k not in _CHANGE_KINDS]:
+            return f"Error getting changes: unknown kind(s) {', '.join(unknown)}; use {', '.join(_CHANGE_KINDS)}."
+        after = _CHANGES.parse_token(since) if since else None
+        when = None if not since or after is not None else _epoch_seconds(since)
+        if since and after is None and when is None:
+            return f"Error getting changes: '{since}' is neither a token from this server run nor a timestamp."
+
+        session = get_iris_client()
+        fetchers = _collection_fetchers(_prepare_case(session, case_id), case_id)
+        synced = dict(_fan_out(lambda kind: _CHANGES.sync(session, case_id, kind, fetchers[kind]), kinds, concurrency=len(kinds)))
+        changes: dict[str, dict[str, list[Any]]] = {}
+        untracked: list[str] = []
+        errors = {kind: str(result) for kind, result in synced.items() if isinstance(result, Exception)}
+        for kind in kinds:
+            if kind in errors or not since:
+                continue
+            start = after
+            if when is not None:
+                updated = _epoch_seconds(_CHANGES.last_update(case_id, kind))
+                if updated is not None and updated <= when:
+                    continue  # Iris reports no change to this collection since then
+                start = _CHANGES.seq_at(case_id, kind, when)
+            found = None if start is None else _CHANGES.changes(case_id, kind, start)
+            if found is None:
+                untracked.append(kind)
+            elif any(found.values()):
+                changes[kind] = found
+        token = _CHANGES.token()
+        if output == "json":
+            return {
+                "token": token,
+                "changes": {
+                    kind: {
+                        "added": [_CHANGE_KINDS[kind][0](r).to_dict() for r in found["added"]],
+                        "modified": [_CHANGE_KINDS[kind][0](r).to_dict() for r in found["modified"]],
+                        "deleted": found["deleted"],
+                    }
+                    for kind, found in changes.items()
+                },
+                "untracked": untracked,
+                "errors": errors,
+            }
+        return _bounded(_render_changes(case_id, since, changes, untracked=untracked, errors=errors, token=token))
+    except Exception as e:
+        return f"Error getting changes: {e!s}"
+
+
+def _render_changes(
+    case_id: int, since: str | None, changes: dict[str, dict[str, list[Any]]], *, untracked: list[str], errors: dict[str, str], token: str
+) -> str:
+    lines = [f"Changes in case {case_id} since {since}:" if since else f"Now tracking changes in case {case_id}."]
+    if since and not changes:
+        lines.append("No changes.")
+    for kind, found in changes.items():
+        to_record, line, label = _CHANGE_KINDS[kind]
+        lines.append(f"{label}: {len(found['added'])} added, {len(found['modified'])} modified, {len(found['deleted'])} deleted")
+        lines += [f"+ {line(to_record(row))[2:]}" for row in found["added"]]
+        lines += [f"~ {line(to_record(row))[2:]}" for row in found["modified"]]
+        lines += [f"- ID: {rec_id} (deleted)" for rec_id in found["deleted"]]
+    if untracked:
+        lines.append(f"No history before this call for: {', '.join(untracked)} (changes are tracked from now on).")
+    lines += [f"Unavailable: {kind}: {message}" for kind, message in errors.items()]
+    lines.append(f"Next token: {token} (pass it as `since` for later changes)")
+    return "\n".join(lines)
+
+
+@_iris_tool()
+def changes_since(case_id: int, since: str | None = None, kinds: list[str] | None = None, output: OutputFormat = "text") -> str | dict[str, Any]:
+    """
+    Return the events, IOCs, assets and tasks added, modified or deleted in a case since `since`.
+
+    `since` is the token returned by the previous call, or a timestamp (ISO 8601 or epoch). Without
+    it the current state is recorded and a token returned. Collections whose Iris `object_state`
+    did not move are not refetched. Restrict with `kinds` (events, iocs, assets, tasks).
+    With `output="json"` returns `{"token", "changes": {kind: {"added", "modified", "deleted"}}, "untracked", "errors"}`.
+    """
+    return _changes_since(case_id, since, kinds, output)
+
+
+# -------------------------------
+# Startup measurement
+# -------------------------------
+
+_STARTUP_PROBE = """
+import asyncio, json, sys, time
+start = time.perf_counter()
+import iris_mcp
+imported = time.perf_counter()
+tools = [tool.to_mcp_tool() for tool in asyncio.run(iris_mcp.mcp.get_tools()).values()]
+listed = time.perf_counter()
+loaded = [name for name in iris_mcp._DEFERRED_MODULES if type(sys.modules.get(name)).__name__ not in ("NoneType", "_LazyModule")]
+print(json.dumps({"import_s": imported - start, "first_listing_s": listed - start, "tools": len(tools), "loaded": loaded}))
+"""
+_IMPORTTIME_INDENT = 2  # -X importtime indents each nesting level by two spaces
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+def _import_breakdown(importtime: str, root: str = "iris_mcp") -> dict[str, float]:
+    """Cumulative milliseconds per top-level package imported directly by ``root`` (from ``-X importtime``)."""
+    children: dict[str, float] = {}
+    for line in importtime.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = int(match[1]), int(match[2]), len(match[3]), match[4]
+        if indent == 0:
+            if name == root:
+                children[f"{root} (own code)"] = self_us / 1000
+                return dict(sorted(children.items(), key=lambda item: -item[1]))
+            children.clear()
+        elif indent == _IMPORTTIME_INDENT:
+            package = name.partition(".")[0]
+            children[package] = children.get(package, 0.0) + cumulative_us / 1000
+    return {}
+
+
+def _measure_startup() -> dict[str, Any]:
+    """Start a fresh interpreter, import the server and list its tools, as an MCP client would."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [os.path.dirname(os.path.abspath(__file__)), os.environ.get("PYTHONPATH")]))}
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", _STARTUP_PROBE], capture_output=True, text=True, env=env, check=True, timeout=120)
+    result: dict[str, Any] = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["imports_ms"] = _import_breakdown(proc.stderr)
+    return result
+
+
+def _startup_report(result: dict[str, Any], top: int = 12) -> str:
+    lines = [f"- {name}: {ms:.1f} ms" for name, ms in list(result["imports_ms"].items())[:top]]
+    deferred = [name for name in _DEFERRED_MODULES if name not in result["loaded"]]
+    header = f"Cold start: import {result['import_s'] * 1000:.0f} ms, first tool listing {result['first_listing_s'] * 1000:.0f} ms ({result['tools']} tools)"
+    return _render(f"{header}\nImports by package (cumulative):", lines, f"Deferred until first use: {', '.join(deferred) or 'none'}")
+
+
+# -------------------------------
+# Prewarm and readiness
+# -------------------------------
+
+# Reference tables read through _REFERENCES: the catalog tables behind the add_* tools
+# and add_iocs_bulk, plus the event categories used by import_timeline.
+_PREWARM_TABLES = {kind: uri for kind, (uri, _, _) in _CATALOG_REFERENCES.items()} | {"event_categories": "manage/event-categories/list"}
+
+
+def _warm_catalogs() -> None:
+    # Import the client modules and build the catalog indexes, validator and classifier tables.
+    for deferred in (AdminHelper, Alert, Case, Customer, ClientSession, global_search_ioc):
+        if isinstance(deferred, _Deferred):
+            deferred.resolve()
+    _ = types_catalog.CATALOG_INDEX, _IOC_VALIDATOR._rules, _IOC_CLASSIFIER._known, _IOC_CLASSIFIER._digests
+
+
+class _Prewarmer:
+    """Background warm-up started by ``--prewarm`` while the MCP handshake is in progress.
+
+    Builds the catalogs, opens the pooled session to ``IRIS_HOST`` (TLS handshake and API
+    key check), then fetches customers and the reference tables in parallel. Every step is
+    recorded so ``server_status`` can report readiness; failures only leave the cache cold.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.steps: dict[str, dict[str, Any]] = {}
+
+    def _step(self, name: str, fn: Callable[[], Any]) -> Any:
+        """Run one warm-up step and record its outcome; returns the step's result (None on failure)."""
+        with self._lock:
+            self.steps[name] = {"status": "running"}
+        start = time.perf_counter()
+        result = None
+        try:
+            result = fn()
+            outcome: dict[str, Any] = {"status": "ok"}
+        except Exception as e:
+            outcome = {"status": "error", "error": str(e)}
+        outcome["seconds"] = round(time.perf_counter() - start, 3)
+        with self._lock:
+            self.steps[name] = outcome
+        return result
+
+    def run(self) -> None:
+        try:
+            self._step("catalogs", _warm_catalogs)
+            session = self._step("connection", get_iris_client)
+            if session is None:
+                return
+            fetches: list[tuple[str, Callable[[], Any]]] = [("customers", functools.partial(_CUSTOMER_DIRECTORY.items, session))]
+            fetches += [(name, functools.partial(_REFERENCES.rows, session, uri)) for name, uri in _PREWARM_TABLES.items()]
+            for _ in _fan_out(lambda step: self._step(*step), fetches, concurrency=len(fetches)):
+                pass
+        finally:
+            self.finished_at = time.monotonic()
+            self._done.set()
+
+    def start(self) -> None:
+        with self._lock:
+            if self.started_at is not None:
+                return
+            self.started_at = time.monotonic()
+        threading.Thread(target=self.run, name="iris-prewarm", daemon=True).start()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._done.wait(timeout)
+
+    def status(self) -> dict[str, Any]:
+        with self._lock:
+            steps = {name: dict(step) for name, step in self.steps.items()}
+        if self.started_at is None:
+            state = "disabled"
+        elif not self._done.is_set():
+            state = "warming"
+        else:
+            state = "ready" if all(step["status"] == "ok" for step in steps.values()) else "degraded"
+        elapsed = None if self.started_at is None else round((self.finished_at or time.monotonic()) - self.started_at, 3)
+        return {"state": state, "seconds": elapsed, "steps": steps}
+
+
+_PREWARM = _Prewarmer()
+_STARTED_AT = time.monotonic()
+
+
+@mcp.tool()
+def server_status() -> dict[str, Any]:
+    """Report whether the server is warmed up (`--prewarm`) and Iris reachable (circuit breaker), plus uptime and pooled sessions."""
+    prewarm = _PREWARM.status()
+    backend = _IRIS_GUARD.stats()
+    return {
+        "ready": prewarm["state"] in ("ready", "disabled") and backend["breaker"]["state"] != "open",
+        "backend": backend,
+        "uptime_seconds": round(time.monotonic() - _STARTED_AT, 1),
+        "iris_host": os.environ.get("IRIS_HOST"),
+        "prewarm": prewarm,
+        "sessions": _SESSION_POOL.stats(),
+    }
+
+
 def run() -> None:
     """Entry point for the iris-mcp console script."""
+    if "--measure-startup" in sys.argv:
+        print(_startup_report(_measure_startup()))
+        return
+    if "--prewarm" in sys.argv or os.environ.get("IRIS_PREWARM", "").lower() in ("1", "true", "yes"):
+        _PREWARM.start()
     # Run over HTTP if --http is passed (e.g. for Gemini or inspection)
-    if "--http" in sys.argv:
+    if _serving_http():
         mcp.run(transport="http", host="127.0.0.1", port=9000)
     else:
         # Default to stdio for generic MCP clients (Claude, etc.)
@@ -1,18 +1,57 @@
+import asyncio
+import json
 import os
-from unittest.mock import patch
+import re
+import sqlite3
+import sys
+import threading
+import time
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+import iris_mcp
+from benchmarks.stub_iris import StubIris
 from iris_mcp import (
+    _IOC_CLASSIFIER,
+    _IOC_VALIDATOR,
+    CaseRecord,
+    IocRecord,
+    ToolCancelledError,
+    _add_asset,
+    _add_ioc,
+    _add_iocs_bulk,
     _add_note,
+    _CaseMirror,
+    _changes_since,
     _create_case,
     _create_customer,
+    _create_note_directory,
+    _CustomerDirectory,
+    _delete_note,
+    _detect_ioc_types,
     _get_case,
+    _get_case_overview,
+    _get_note,
+    _import_timeline,
+    _list_assets,
     _list_cases,
     _list_events,
     _list_evidence,
     _list_iocs,
+    _list_note_comments,
+    _list_notes,
     _list_tasks,
+    _lookup_customer,
+    _Metrics,
+    _parse_datetime,
+    _read_more,
+    _search_ioc_global,
+    _search_notes,
+    _search_notes_fulltext,
+    _SessionPool,
+    _ToolExecutor,
+    _try_case_methods,
     _update_event,
     list_alert_resolution_statuses,
     list_alert_statuses,
@@ -27,6 +66,7 @@ from iris_mcp import (
     list_tlp_levels,
     list_types,
 )
+from types_catalog import CATALOG, CATALOG_INDEX, IOC_VALIDATIONS
 
 # ... (Sample payloads remain the same) ...
 TIMELINE_PAYLOAD = {
@@ -107,6 +147,22 @@ NOTE_DIRS_PAYLOAD = [
 ]
 
 
+@pytest.fixture(autouse=True)
+def reset_pool():
+    yield
+    iris_mcp._SESSION_POOL.close()
+    iris_mcp._CUSTOMER_DIRECTORY.invalidate()
+    iris_mcp._REFERENCES.clear()
+    iris_mcp._COLLECTIONS.clear()
+    iris_mcp._NOTE_DIRECTORIES.invalidate()
+    iris_mcp._METHOD_PLANS.clear()
+    iris_mcp._IOC_INDEX.clear()
+    iris_mcp._NOTE_INDEX.invalidate()
+    iris_mcp._RESPONSES.clear()
+    iris_mcp._CHANGES.clear()
+    iris_mcp._CASE_MEMBERS.clear()
+
+
 @pytest.fixture
 def mock_env():
     with patch.dict(os.environ, {"IRIS_API_KEY": "test", "IRIS_HOST": "http://localhost"}):
@@ -156,6 +212,8 @@ def test_get_case(mock_env, mock_client_classes):
     result = _get_case(1)
     assert "Test Case" in result
     assert "Desc" in result
+    assert "Customer: Cust\n" in result
+    assert _get_case(1, output="json")["open_date"] == "2023-01-01"
 
 
 def test_create_case(mock_env, mock_client_classes):
@@ -184,6 +242,83 @@ def test_add_note(mock_env, mock_client_classes):
     assert "ID: 5" in result
 
 
+def test_search_notes_fulltext_ranks_and_tracks_changes(mock_env, mock_client_classes):
+    _, MockCase, _, _ = mock_client_classes
+    mock_case = MockCase.return_value
+    mock_case.list_notes_directories.return_value.is_error.return_value = False
+    mock_case.list_notes_directories.return_value.get_data.return_value = NOTE_DIRS_PAYLOAD
+    contents = {
+        69: "BlackDawn ransomware encrypted FS-FIN01 shares.",
+        70: "08:14 phishing ISO opened; ransomware staged later.",
+        71: "Memory image and EVTX collected.",
+    }
+
+    def get_note(note_id, cid):
+        resp = MagicMock()
+        resp.is_error.return_value = False
+        resp.get_data.return_value = {"note_id": note_id, "note_content": contents[note_id], "directory_id": 32}
+        return resp
+
+    mock_case.get_note.side_effect = get_note
+    mock_case.add_note.return_value.is_error.return_value = False
+    mock_case.add_note.return_value.get_data.return_value = {"note_id": 72}
+    mock_case.delete_note.return_value.is_error.return_value = False
+
+    result = _search_notes_fulltext(1, "ransom")
+    assert result.index("ID: 69") < result.index("ID: 70")
+    assert "**ransomware**" in result
+    assert "ID: 71" not in result
+    assert mock_case.get_note.call_count == len(contents)
+
+    _add_note(1, "Ransom note dropped on LAP-CFO01", "Ransom note", 32)
+    _delete_note(69, 1)
+    result = _search_notes_fulltext(1, "ransom")
+    assert "ID: 72, Title: Ransom note" in result
+    assert "ID: 69" not in result
+    assert mock_case.get_note.call_count == len(contents)
+    assert "Error searching notes" in _search_notes_fulltext(1, "***")
+    hits = _search_notes_fulltext(1, "ransom", output="json")
+    assert hits["total"] == 2
+    assert hits["items"][0] == {"id": 72, "title": "Ransom note", "directory_id": 32, "snippet": "**Ransom** note dropped on LAP-CFO01"}
+
+
+def test_note_index_refetches_notes_edited_elsewhere():
+    case_obj = MagicMock()
+    listing = [{"id": 32, "notes": [{"id": 69, "title": "Summary", "note_lastupdate": "t1"}, {"id": 70, "title": "Timeline"}]}]
+    case_obj.list_notes_directories.return_value = _api_response(listing)
+    contents = {69: "alpha", 70: "bravo"}
+    case_obj.get_note.side_effect = lambda note_id, cid: _api_response({"note_id": note_id, "note_content": contents[note_id]})
+    index = iris_mcp._NoteIndex(ttl=0, refetch_ttl=3600)
+    index.ensure(case_obj, 1)
+
+    contents.update({69: "charlie", 70: "delta"})  # both edited in the Iris UI, titles unchanged
+    listing[0]["notes"][0]["note_lastupdate"] = "t2"
+    index.ensure(case_obj, 1)
+    assert [row[0] for row in index.search(1, "charlie", 5)] == [69]
+    assert index.search(1, "delta", 5) == []  # no timestamp listed: waits for the periodic refetch
+
+    index.refetch_ttl = 0
+    index.ensure(case_obj, 1)
+    assert [row[0] for row in index.search(1, "delta", 5)] == [70]
+    assert len(index._case_locks) == 0
+
+    # Content stored from our own write is not refetched by the next listing.
+    index.refetch_ttl = 3600
+    fetched = case_obj.get_note.call_count
+    index.upsert(1, 69, "Summary", "echo", 32)
+    listing[0]["notes"][0]["note_lastupdate"] = "t3"  # bumped by that write
+    index.ensure(case_obj, 1)
+    index.ensure(case_obj, 1)
+    assert case_obj.get_note.call_count == fetched
+    assert [row[0] for row in index.search(1, "echo", 5)] == [69]
+
+    index.max_cases = 1
+    index.ensure(case_obj, 2)
+    assert not index.indexed(1)
+    assert index.search(1, "echo", 5) == []
+    assert index.stats()["cases"] == 1
+
+
 def test_list_events(mock_env, mock_client_classes):
     _, MockCase, _, _ = mock_client_classes
     mock_case = MockCase.return_value
@@ -196,6 +331,68 @@ def test_list_events(mock_env, mock_client_classes):
     assert "Initial Access" in result
 
 
+def test_note_tools_return_json_records(mock_env, mock_client_classes):
+    _, MockCase, _, _ = mock_client_classes
+    mock_case = MockCase.return_value
+    mock_case.list_notes_directories.return_value = _api_response(
+        [{"id": 3, "name": "Triage", "notes": [{"id": 11, "title": "First look"}]}, {"id": 4, "name": "Empty", "note_count": 0}]
+    )
+    mock_case.get_note.return_value = _api_response({"note_id": 11, "note_title": "First look", "note_content": "body", "directory_id": 3})
+    mock_case.search_notes.return_value = _api_response([{"note_id": 11, "note_title": "First look", "directory_id": 3}])
+    mock_case.list_note_comments.return_value = _api_response([{"comment_id": 1, "user": {"user_login": "alice"}, "comment": "ok"}])
+
+    listed = _list_notes(1, output="json")
+    assert listed["total"] == 2
+    assert listed["items"][0] == {
+        "id": 3,
+        "name": "Triage",
+        "note_count": None,
+        "notes": [{"id": 11, "title": "First look", "directory_id": None, "content": None}],
+    }
+    assert listed["items"][1]["notes"] == []
+    assert _list_notes(1) == "Notes for Case 1:\n- Directory 3 (Triage)\n  • ID: 11, Title: First look\n- Directory 4 (Empty) — 0 notes"
+    assert _get_note(11, 1, output="json") == {"id": 11, "title": "First look", "directory_id": 3, "content": "body"}
+    assert _search_notes(1, "look", output="json")["items"] == [{"id": 11, "title": "First look", "directory_id": 3, "content": None}]
+    assert _list_note_comments(11, 1, output="json") == {"items": [{"id": 1, "author": "alice", "content": "ok"}], "total": 1}
+    assert _list_note_comments(11, 1) == "Comments for note 11:\n- ID: 1, Author: alice, Comment: ok"
+
+
+def test_large_responses_are_chunked_with_continuation_handles(mock_env, mock_client_classes):
+    _, MockCase, _, _ = mock_client_classes
+    budget, events = 4096, 200
+    content = "\n".join(f"línea {i}: {'é' * (i % 50)}" for i in range(3000))
+    MockCase.return_value.get_note.return_value = _api_response({"note_title": "Big", "note_content": content})
+
+    parts, result = [], _get_note(1, 1, max_bytes=budget)
+    while (match := re.search(r'\n\[Truncated at byte \d+ of \d+\. Call read_more\(handle="([^"]+)"\)', result)) is not None:
+        body = result[: match.start()]
+        assert len(body.encode()) <= budget
+        parts.append(body)
+        result = _read_more(match.group(1), max_bytes=budget)
+    parts.append(result)
+    assert len(parts) > 1
+    assert "".join(parts).endswith(content)
+    assert MockCase.return_value.get_note.call_count == 1
+    assert _get_note(1, 1, max_bytes=0).endswith(content)
+    assert _read_more("bm9wZTo0").startswith("Error reading more: the handle expired")
+
+    tiny = iris_mcp._bounded("é€😀", max_bytes=1)  # clamped to whole UTF-8 characters
+    assert tiny.startswith("é\n[Truncated at byte 2 of 9.")
+    handle = re.search(r'read_more\(handle="([^"]+)"\)', tiny).group(1)
+    assert _read_more(handle, max_bytes=2).startswith("€\n[Truncated at byte 5 of 9.")
+
+    MockCase.return_value.list_events.return_value = _api_response(
+        [{"event_id": i, "event_title": f"event {i}", "event_date": f"2025-01-01T00:00:{i % 60:02d}"} for i in range(events)]
+    )
+    first = _list_events(1, output="json", max_bytes=budget // 2)
+    assert 0 < len(first["items"]) < first["total"] == events
+    assert len(json.dumps(first)) <= budget // 2
+    rest = _list_events(1, cursor=first["next_cursor"], output="json", max_bytes=0)
+    assert first["items"][-1] != rest["items"][0]
+    assert len(first["items"]) + len(rest["items"]) == events
+    assert MockCase.return_value.list_events.call_count == 1
+
+
 def test_list_evidence(mock_env, mock_client_classes):
     _, MockCase, _, _ = mock_client_classes
     mock_case = MockCase.return_value
@@ -220,6 +417,87 @@ def test_list_iocs(mock_env, mock_client_classes):
     assert "domain" in result
 
 
+def test_list_iocs_json_output(mock_env, mock_client_classes):
+    _, MockCase, _, _ = mock_client_classes
+    mock_case = MockCase.return_value
+    mock_case.list_iocs.return_value.is_error.return_value = False
+    mock_case.list_iocs.return_value.get_data.return_value = IOCS_PAYLOAD
+
+    result = _list_iocs(1, limit=1, output="json")
+    assert result["total"] == len(IOCS_PAYLOAD["ioc"])
+    assert result["offset"] == 0
+    assert result["next_cursor"]
+    assert result["items"] == [
+        {"id": 59, "value": "darkvault-support[.]com", "type": "domain", "tlp": "amber", "tags": None, "description": "C2 domain contacted..."}
+    ]
+
+
+def test_records_normalize_payloads_and_render_text():
+    case = CaseRecord.from_payload({"id": 7, "name": "X", "case_customer": 3, "status_id": 2}, {3: "ACME"})
+    assert case.customer_label == "ACME (ID 3)"
+    assert case.to_dict() == {"id": 7, "name": "X", "customer_id": 3, "customer_name": "ACME", "status": 2, "description": None, "open_date": None}
+
+    assert IocRecord.from_payload({"unexpected": 1}).is_empty()
+    # Unknown shapes are rendered verbatim rather than as a row of Nones.
+    assert iris_mcp._ioc_line(IocRecord.from_payload({"unexpected": 1})) == "- {'unexpected': 1}"
+
+
+def test_get_case_overview_combines_sources(mock_env, mock_client_classes):
+    _, MockCase, _, _ = mock_client_classes
+    mock_case = MockCase.return_value
+    payloads = {
+        "get_case": {"case_id": 1, "case_name": "Test Case", "case_customer": "Cust", "case_status_id": 0},
+        "get_summary": {"case_description": "Ransomware on FS-FIN01"},
+        "list_assets": [],
+        "list_iocs": IOCS_PAYLOAD,
+        "list_events": TIMELINE_PAYLOAD,
+        "list_evidences": EVIDENCES_PAYLOAD,
+        "list_notes_directories": NOTE_DIRS_PAYLOAD,
+    }
+    for method, payload in payloads.items():
+        getattr(mock_case, method).return_value.is_error.return_value = False
+        getattr(mock_case, method).return_value.get_data.return_value = payload
+    mock_case.list_tasks.return_value.is_error.return_value = True
+    mock_case.list_tasks.return_value.get_msg.return_value = "forbidden"
+
+    result = _get_case_overview(1, recent=1)
+    assert "Summary:\nRansomware on FS-FIN01" in result
+    assert "Counts: events 2, IOCs 2, assets 0, evidence 2, tasks ?, notes 3" in result
+    assert "Beaconing to darkvault-support[.]com" in result
+    assert "Phishing delivery" not in result
+    assert "- ID: 71, Title: Evidence collected" in result
+    assert "- tasks: Listing tasks for case 1 failed: forbidden" in result
+
+    overview = _get_case_overview(1, output="json")
+    assert overview["counts"]["iocs"] == len(IOCS_PAYLOAD["ioc"])
+    assert [e["id"] for e in overview["recent"]["evidences"]] == [22, 18]
+
+
+def test_search_ioc_global_uses_local_index(mock_env, mock_client_classes):
+    _, MockCase, _, _ = mock_client_classes
+    mock_case = MockCase.return_value
+    mock_case.list_iocs.return_value.is_error.return_value = False
+    mock_case.list_iocs.return_value.get_data.return_value = IOCS_PAYLOAD
+    mock_case.add_ioc.return_value.is_error.return_value = False
+    mock_case.add_ioc.return_value.get_data.return_value = {"ioc_id": 61}
+
+    with patch("iris_mcp.global_search_ioc") as search:
+        search.return_value.is_error.return_value = False
+        search.return_value.get_data.return_value = []
+
+        _list_iocs(1)
+        result = _search_ioc_global("DARKVAULT-support[.]com", source="index")
+        assert "case 1 IOC 59 [domain]" in result
+        assert "%/api/v1/%: 1 hits" in _search_ioc_global(["%/api/v1/%"], source="index")
+
+        assert "198.51.100.7: not found" in _search_ioc_global("198.51.100.7")
+        _add_ioc(2, "198.51.100.7", "ip-dst")
+        result = _search_ioc_global("198.51.100.7, darkvault-support[.]com", output="json")
+        assert search.call_count == 2  # the miss above, then darkvault; the added IP is answered locally
+        assert result["from_index"] == 1
+        assert result["results"]["198.51.100.7"] == [{"case_id": 2, "case_name": None, "ioc_id": 61, "value": "198.51.100.7", "type": "ip-dst"}]
+
+
 def test_list_tasks(mock_env, mock_client_classes):
     _, MockCase, _, _ = mock_client_classes
     mock_case = MockCase.return_value
@@ -273,3 +551,947 @@ def test_catalogs():
     assert isinstance(list_tlp_levels(), list)
 
     assert any(entry.get("type") == "md5" for entry in list_types("iocs"))
+
+
+def test_session_pool_reuses_client(mock_env, mock_client_classes):
+    MockSession, _, _, _ = mock_client_classes
+
+    first = iris_mcp.get_iris_client()
+    second = iris_mcp.get_iris_client()
+    assert first is second
+    MockSession.assert_called_once_with(apikey="test", host="http://localhost", ssl_verify=True)
+
+
+def test_session_pool_disabled_creates_per_call(mock_client_classes):
+    MockSession, _, _, _ = mock_client_classes
+    pool = _SessionPool(pool_size=0)
+
+    sessions = [pool.acquire("http://localhost", "k", True) for _ in range(3)]
+    assert MockSession.call_count == len(sessions)
+    # Unpooled requests still go through the guard.
+    assert sys.modules["dfir_iris_client.session"].requests is pool._transport
+    assert pool._transport._http is None
+    pool.close()
+
+
+def test_session_pool_evicts_idle_and_unhealthy(mock_client_classes):
+    MockSession, _, _, _ = mock_client_classes
+    MockSession.side_effect = lambda **_kw: MagicMock()
+    pool = _SessionPool(pool_size=2, idle_timeout=60, health_interval=10)
+
+    with patch("iris_mcp.time.monotonic", return_value=100.0):
+        first = pool.acquire("http://localhost", "k", True)
+    first.pi_get.return_value.is_error.return_value = False
+    with patch("iris_mcp.time.monotonic", return_value=120.0):
+        assert pool.acquire("http://localhost", "k", True) is first
+    first.pi_get.assert_called_once_with("api/ping", cid=1)
+
+    first.pi_get.return_value.is_error.return_value = True
+    with patch("iris_mcp.time.monotonic", return_value=140.0):
+        second = pool.acquire("http://localhost", "k", True)
+    assert second is not first
+
+    with patch("iris_mcp.time.monotonic", return_value=500.0):
+        assert pool.acquire("http://localhost", "k", True) is not second
+    assert pool.stats()["sessions"] == 1
+    pool.close()
+
+
+def test_iris_tools_run_async(mock_env, mock_client_classes):
+    _, MockCase, _, _ = mock_client_classes
+    mock_case = MockCase.return_value
+    mock_case.get_case.return_value.is_error.return_value = False
+    mock_case.get_case.return_value.get_data.return_value = {"case_id": 1, "case_name": "Async Case"}
+
+    result = asyncio.run(iris_mcp.get_case(1))
+    assert "Async Case" in result
+
+
+def test_iris_tool_passes_name_argument_to_tool():
+    @iris_mcp._iris_tool()
+    def rename(name, fn="", cancelled=""):
+        return f"{name}/{fn}/{cancelled}"
+
+    assert asyncio.run(rename(name="n", fn="f", cancelled="c")) == "n/f/c"
+
+
+def test_tool_executor_respects_per_tool_limit():
+    executor = _ToolExecutor(workers=8, default_limit=8, limits={"slow": 2})
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def work():
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+
+    async def main():
+        await asyncio.gather(*(executor.run("slow", work) for _ in range(6)))
+
+    asyncio.run(main())
+    executor.shutdown()
+    assert active["peak"] == executor.limits["slow"]
+
+
+def test_tool_executor_passes_through_colliding_kwargs():
+    executor = _ToolExecutor(workers=1)
+
+    def work(name, fn, cancelled):
+        return (name, fn, cancelled)
+
+    assert asyncio.run(executor.run("work", work, name="n", fn="f", cancelled="c")) == ("n", "f", "c")
+    executor.shutdown()
+
+
+def test_tool_executor_cancellation_stops_worker():
+    executor = _ToolExecutor(workers=1)
+    started = threading.Event()
+    outcome = {}
+
+    def work():
+        started.set()
+        time.sleep(0.05)
+        try:
+            iris_mcp._check_cancelled()
+            outcome["result"] = "finished"
+        except ToolCancelledError:
+            outcome["result"] = "cancelled"
+
+    async def main():
+        task = asyncio.create_task(executor.run("work", work))
+        await asyncio.to_thread(started.wait)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    executor.shutdown()
+    time.sleep(0.1)
+    assert outcome["result"] == "cancelled"
+
+
+def _mock_customers(MockCustomer, customers):
+    mock_customer = MockCustomer.return_value
+    mock_customer.list_customers.return_value.is_error.return_value = False
+    mock_customer.list_customers.return_value.get_data.return_value = customers
+    return mock_customer
+
+
+def test_customer_directory_cached_across_calls(mock_env, mock_client_classes):
+    _, MockCase, MockCustomer, MockAdmin = mock_client_classes
+    mock_customer = _mock_customers(MockCustomer, [{"customer_id": 3, "customer_name": "Initech"}])
+    mock_case = MockCase.return_value
+    mock_case.list_cases.return_value.is_error.return_value = False
+    mock_case.list_cases.return_value.get_data.return_value = [{"case_id": 1, "case_name": "C", "case_customer": 3}]
+
+    assert "Initech (ID 3)" in _list_cases()
+    assert "Initech (ID 3)" in _list_cases()
+    assert "ID: 3" in _lookup_customer("initech")
+    mock_customer.list_customers.assert_called_once()
+
+    MockAdmin.return_value.add_customer.return_value.is_error.return_value = False
+    MockAdmin.return_value.add_customer.return_value.get_data.return_value = {"customer_id": 4}
+    _create_customer("Hooli")
+    _list_cases()
+    assert mock_customer.list_customers.call_count == 2  # initial load, reload after create
+
+
+def test_customer_directory_refreshes_stale_copy_in_background(mock_env, mock_client_classes):
+    _, _, MockCustomer, _ = mock_client_classes
+    mock_customer = _mock_customers(MockCustomer, [{"customer_id": 1, "customer_name": "Old"}])
+    directory = _CustomerDirectory(ttl=0)
+
+    assert directory.names() == {1: "Old"}
+    mock_customer.list_customers.return_value.get_data.return_value = [{"customer_id": 1, "customer_name": "New"}]
+    assert directory.names() == {1: "Old"}  # stale copy served while refreshing
+    for _ in range(50):
+        if directory.cached_names() == {1: "New"}:
+            break
+        time.sleep(0.01)
+    assert directory.cached_names() == {1: "New"}
+    stats = directory.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] >= 1
+
+
+def test_customer_directory_drops_fetch_overtaken_by_invalidate(mock_env, mock_client_classes):
+    _, _, MockCustomer, _ = mock_client_classes
+    mock_customer = _mock_customers(MockCustomer, [{"customer_id": 1, "customer_name": "Old"}])
+    directory = _CustomerDirectory()
+    stale = mock_customer.list_customers.return_value
+
+    def invalidated_mid_fetch():
+        directory.invalidate()  # e.g. create_customer finishing while the refresh is in flight
+        mock_customer.list_customers.side_effect = None
+        mock_customer.list_customers.return_value = _api_response([{"customer_id": 1, "customer_name": "New"}])
+        return stale
+
+    mock_customer.list_customers.side_effect = invalidated_mid_fetch
+    directory._background_refresh()
+    assert directory.cached_names() == {}
+    assert directory.names() == {1: "New"}
+
+
+@pytest.mark.parametrize(
+    ("payload", "names"),
+    [
+        ({"event_id": 1, "id": 2}, ("event_id", "id")),
+        ({"id": 2}, ("event_id", "id")),
+        ({"EventTitle": "fuzzy"}, ("event_title",)),
+        ({"other": 1}, ("missing", "absent")),
+        ({"a": None}, ("a", "b")),
+    ],
+)
+def test_compiled_field_plans_match_reflective_lookup(payload, names):
+    expected = iris_mcp._lookup_field(payload, *names)
+    for _ in range(2):  # second pass hits the cached plan
+        assert iris_mcp._get_field(payload, *names) == expected
+        assert iris_mcp._row_reader("test", payload)(*names) == expected
+
+
+def test_row_reader_resolves_once_per_shape():
+    rows = [{"ioc_id": i, "ioc_value": f"v{i}"} for i in range(3)]
+    with patch("iris_mcp._compile_getter", wraps=iris_mcp._compile_getter) as compile_getter:
+        values = [iris_mcp._row_reader("plan-test", row)("ioc_value", "value") for row in rows]
+    assert values == ["v0", "v1", "v2"]
+    compile_getter.assert_called_once()
+
+
+def _api_response(data):
+    resp = MagicMock()
+    resp.is_error.return_value = False
+    resp.get_data.return_value = data
+    return resp
+
+
+def test_add_iocs_bulk_reports_per_item(mock_env, mock_client_classes):
+    MockSession, MockCase, _, _ = mock_client_classes
+    references = {
+        "manage/ioc-types/list": [{"type_name": "domain", "type_id": 20}, {"type_name": "ip-dst", "type_id": 76}],
+        "manage/tlp/list": [{"tlp_name": "amber", "tlp_id": 2}],
+    }
+    MockSession.return_value.pi_get.side_effect = lambda uri, **_kw: _api_response(references[uri])
+    mock_case = MockCase.return_value
+    mock_case.list_iocs.return_value = _api_response(IOCS_PAYLOAD)
+    new_ids = iter(range(100, 200))
+    mock_case.add_ioc.side_effect = lambda **_kw: _api_response({"ioc_id": next(new_ids)})
+
+    blob = "value,ioc_type\nDarkVault-Support[.]com,domain\n10.0.0.1,ip-dst\n10.0.0.1,ip-dst\nevil.example,bogus\nno-type-given\n"
+    result = _add_iocs_bulk(5, blob, ioc_tlp="amber", skip_existing=True)
+
+    assert result.startswith("Bulk IOC import for case 5: 1 added, 2 skipped, 2 failed (5 rows)")
+    assert "1. DarkVault-Support[.]com [domain] skipped: already present (ID 59)" in result
+    assert "2. 10.0.0.1 [ip-dst] added (ID 100)" in result
+    assert "3. 10.0.0.1 [ip-dst] skipped: duplicate in batch" in result
+    assert "unknown IOC type 'bogus'" in result
+    assert "5. no-type-given [?] error: could not detect ioc_type" in result
+    mock_case.add_ioc.assert_called_once_with(value="10.0.0.1", ioc_type=76, description="", ioc_tlp=2, ioc_tags=None, custom_attributes=None, cid=5)
+
+
+def test_add_ioc_and_asset_suppress_duplicates_locally(mock_env, mock_client_classes):
+    _, MockCase, _, _ = mock_client_classes
+    mock_case = MockCase.return_value
+    mock_case.list_iocs.return_value = _api_response(IOCS_PAYLOAD)
+    mock_case.list_assets.return_value = _api_response([{"asset_id": 7, "asset_name": "WKS-01"}])
+    mock_case.add_asset.return_value = _api_response({"asset_id": 8})
+    new_ids = iter(range(100, 200))
+    mock_case.add_ioc.side_effect = lambda **_kw: _api_response({"ioc_id": next(new_ids)})
+    suppressed = iris_mcp._CASE_MEMBERS.stats()["duplicates_suppressed"]
+
+    assert _add_ioc(1, " darkvault-support[.]com ", "domain").startswith("IOC already present in case 1. ID: 59 (not added again")
+    assert _add_ioc(1, "new.example", "domain") == "IOC added successfully. ID: 100"
+    assert _add_ioc(1, "NEW.example", "domain").startswith("IOC already present in case 1. ID: 100")
+    assert _add_ioc(1, "new.example", "domain", allow_duplicate=True) == "IOC added successfully. ID: 101"
+
+    mock_case.add_ioc.side_effect = RuntimeError("boom")
+    assert _add_ioc(1, "retry.example", "domain") == "Error adding IOC: boom"
+    mock_case.add_ioc.side_effect = lambda **_kw: _api_response({"ioc_id": next(new_ids)})
+    assert _add_ioc(1, "retry.example", "domain") == "IOC added successfully. ID: 102"
+
+    result = _add_iocs_bulk(1, "new.example\nfresh.example\nFRESH.example")
+    assert result.startswith("Bulk IOC import for case 1: 1 added, 2 skipped, 0 failed (3 rows)")
+    assert "1. new.example [domain] skipped: already present (ID 100)" in result
+    assert "3. FRESH.example [domain] skipped: duplicate in batch" in result
+    assert _add_ioc(1, "fresh.example", "domain").startswith("IOC already present in case 1. ID: 103")
+    assert mock_case.list_iocs.call_count == 1
+
+    assert _add_asset(1, "wks-01", "Account").startswith("Asset already present in case 1. ID: 7")
+    assert _add_asset(1, "WKS-02", "Account") == "Asset added successfully. ID: 8"
+    mock_case.add_asset.assert_called_once()
+    assert iris_mcp._CASE_MEMBERS.stats()["duplicates_suppressed"] - suppressed == 5
+
+
+def test_duplicate_check_keys_on_type_and_reports_writes_in_flight(mock_env, mock_client_classes):
+    _, MockCase, _, _ = mock_client_classes
+    mock_case = MockCase.return_value
+    mock_case.list_iocs.return_value = _api_response([])
+    mock_case.add_ioc.return_value = _api_response({"ioc_id": 300})
+
+    assert _add_ioc(1, "evil.example", "domain") == "IOC added successfully. ID: 300"
+    assert _add_ioc(1, "evil.example", "hostname") == "IOC added successfully. ID: 300"
+    assert _add_ioc(1, "EVIL.example", "Domain").startswith("IOC already present in case 1. ID: 300")
+
+    fetch = MagicMock(return_value=[])
+    assert iris_mcp._CASE_MEMBERS.claim(1, "iocs", [("busy.example", "domain")], fetch) == {}
+    assert _add_ioc(1, "busy.example", "domain").startswith("Error adding IOC: 'busy.example' is being added to case 1 by another call")
+    result = _add_iocs_bulk(1, [{"value": "busy.example", "ioc_type": "domain"}])
+    assert "1. busy.example [domain] error: being added by another call" in result
+    assert mock_case.add_ioc.call_count == 2
+
+    iris_mcp._CASE_MEMBERS.load(1, "iocs", [])
+    assert "being added" in _add_ioc(1, "busy.example", "domain")
+    iris_mcp._CASE_MEMBERS.reservation_ttl = 0
+    try:
+        assert _add_ioc(1, "busy.example", "domain") == "IOC added successfully. ID: 300"
+    finally:
+        iris_mcp._CASE_MEMBERS.reservation_ttl = 120.0
+
+
+def test_duplicate_check_matches_numeric_ioc_types(mock_env, mock_client_classes):
+    MockSession, MockCase, _, _ = mock_client_classes
+    MockSession.return_value.pi_get.return_value = _api_response([{"type_name": "domain", "type_id": 20}, {"type_name": "hostname", "type_id": 69}])
+    mock_case = MockCase.return_value
+    mock_case.list_iocs.return_value = _api_response({"ioc": [*IOCS_PAYLOAD["ioc"], {"ioc_id": 61, "ioc_value": "id-only.example", "ioc_type_id": 20}]})
+    mock_case.add_ioc.return_value = _api_response({"ioc_id": 500})
+
+    assert _add_ioc(1, "darkvault-support[.]com", 20).startswith("IOC already present in case 1. ID: 59")
+    assert _add_ioc(1, "darkvault-support[.]com", "20").startswith("IOC already present in case 1. ID: 59")
+    assert _add_ioc(1, "id-only.example", "domain").startswith("IOC already present in case 1. ID: 61")
+    result = _add_iocs_bulk(1, [{"value": "darkvault-support[.]com", "ioc_type": 20}, {"value": "id-only.example", "ioc_type": 69}])
+    assert "1. darkvault-support[.]com [domain] skipped: already present (ID 59)" in result
+    assert "2. id-only.example [hostname] added (ID 500)" in result
+    mock_case.add_ioc.assert_called_once()
+
+
+def test_cancelled_bulk_import_releases_its_reservations(mock_env, mock_client_classes):
+    _, MockCase, _, _ = mock_client_classes
+    mock_case = MockCase.return_value
+    mock_case.list_iocs.return_value = _api_response([])
+    mock_case.add_ioc.return_value = _api_response({"ioc_id": 400})
+
+    def cancelled_after_first(fn, items, concurrency=4):
+        first = items[0]
+        yield first, fn(first)
+        raise ToolCancelledError("Tool call cancelled by the client")
+
+    with patch.object(iris_mcp, "_fan_out", cancelled_after_first):
+        result = _add_iocs_bulk(1, "one.example\ntwo.example\nthree.example")
+    assert result == "Error adding IOCs in bulk: Tool call cancelled by the client"
+    assert iris_mcp._CASE_MEMBERS.stats()["reserved"] == 0
+    assert _add_ioc(1, "one.example", "domain").startswith("IOC already present in case 1. ID: 400")
+    assert _add_ioc(1, "two.example", "domain") == "IOC added successfully. ID: 400"
+
+    mock_case.add_ioc.side_effect = RuntimeError("boom")
+    assert "1. three.example [domain] error: boom" in _add_iocs_bulk(1, ["three.example"])
+    mock_case.add_ioc.side_effect = None
+    assert _add_ioc(1, "three.example", "domain") == "IOC added successfully. ID: 400"
+
+
+def test_ioc_validator_matches_catalog_regexes():
+    samples = ["", "a" * 32, "A" * 32, "g" * 32, "a" * 31, "a" * 33, "x|" + "f" * 32, "|" + "f" * 32, "a|b|" + "0" * 40]
+    samples += ["x\n|" + "f" * 32, "t" + "a" * 35, "T" + "a" * 70, "f" * 64, "evil.exe|" + "F" * 64 + "\n", "x|" + "f" * 128]
+    for name, spec in IOC_VALIDATIONS.items():
+        if regex := spec.get("validation_regex"):
+            expected = [re.fullmatch(regex, v, re.IGNORECASE) is not None for v in samples]
+            assert _IOC_VALIDATOR.check_many(name, samples) == expected, name
+    problems = _IOC_VALIDATOR.check_batch([("md5", "a" * 32), ("MD5", "nope"), ("domain", "anything"), (76, "x")])
+    assert problems == [None, "invalid MD5 value (expected 32 hexadecimal characters)", None, None]
+
+
+def test_ioc_classifier_detects_catalog_types(mock_env, mock_client_classes):
+    samples = {
+        "D41D8CD98F00B204E9800998ECF8427E": "md5",
+        "0" * 64: "sha256",
+        "dropper.exe|" + "a" * 40: "filename|sha1",
+        "198.51.100.7": "ip-dst",
+        "2001:db8::/32": "ip-dst",
+        "198.51.100.7|443": "ip-dst|port",
+        "c2.evil.example": "domain",
+        "hxxp://c2.evil[.]example/gate": "url",
+        "not an indicator": None,
+        "https://c2.evil.example/gate.php?id=1": "url",
+        "phish@evil.example": "email",
+        "HKLM\\Software\\Microsoft\\Windows\\CurrentVersion\\Run": "regkey",
+        "CVE-2024-3400": "vulnerability",
+        "no-type-given": None,
+    }
+    detected = _IOC_CLASSIFIER.classify_many(list(samples))
+    assert dict(zip(samples, detected, strict=True)) == samples
+    for value, ioc_type in samples.items():
+        assert ioc_type is None or _IOC_VALIDATOR.check(ioc_type, value) is None
+
+    payload = _detect_ioc_types("198.51.100.7\n198.51.100.7\nhello", output="json")
+    assert payload == {"types": {"198.51.100.7": "ip-dst", "hello": None}, "unrecognized": ["hello"]}
+
+    _, MockCase, _, _ = mock_client_classes
+    MockCase.return_value.add_ioc.side_effect = lambda **_kw: _api_response({"ioc_id": 9})
+    assert _add_ioc(1, "c2.evil.example") == "IOC added successfully. ID: 9 (detected type: domain)"
+    assert MockCase.return_value.add_ioc.call_args.kwargs["ioc_type"] == "domain"
+    assert _add_ioc(1, "???").startswith("Error adding IOC: could not detect the IOC type")
+    assert "could be a file name or a domain" in _add_ioc(1, "evil.exe")
+    assert _add_ioc(1, "evil.exe", "filename") == "IOC added successfully. ID: 9"
+    assert "could be a file name or a domain" in _add_iocs_bulk(1, "invoice.zip")
+
+
+def test_catalog_index_resolves_names_and_suggests():
+    for kind, entries in CATALOG.items():
+        index = CATALOG_INDEX[kind]
+        assert len(index.by_name) == len(entries), kind
+    assets = CATALOG_INDEX["assets"]
+    assert assets.resolve("windows_computer", "asset type") == "Windows - Computer"
+    assert "Windows - Server" in assets.suggest("Windows Sever")
+    with pytest.raises(ValueError, match="Did you mean: To do"):
+        CATALOG_INDEX["task_statuses"].resolve("todo list", "task status")
+    with pytest.raises(TypeError):
+        assets.by_name["new"] = {}
+
+
+def test_add_asset_resolves_catalog_names_locally(mock_env, mock_client_classes):
+    _, MockCase, _, _ = mock_client_classes
+    mock_case = MockCase.return_value
+    mock_case.add_asset.return_value = _api_response({"asset_id": 3})
+
+    assert _add_asset(1, "WKS-01", "windows computer", "started") == "Asset added successfully. ID: 3"
+    kwargs = mock_case.add_asset.call_args.kwargs
+    assert (kwargs["asset_type"], kwargs["analysis_status"]) == ("Windows - Computer", "Started")
+
+    mock_case.add_asset.reset_mock()
+    result = _add_asset(1, "WKS-01", "Windows Sever")
+    assert result.startswith("Error adding asset: Unknown asset type 'Windows Sever'. Did you mean: Windows - Server")
+    mock_case.add_asset.assert_not_called()
+
+
+def test_single_adds_fall_back_to_server_reference_tables(mock_env, mock_client_classes):
+    MockSession, MockCase, _, _ = mock_client_classes
+    references = {
+        "manage/ioc-types/list": [{"type_name": "domain", "type_id": 20}, {"type_name": "beacon-config", "type_id": 301}],
+        "manage/asset-type/list": [{"asset_name": "OT - PLC", "asset_id": 40}],
+    }
+    MockSession.return_value.pi_get.side_effect = lambda uri, **_kw: _api_response(references.get(uri, []))
+    mock_case = MockCase.return_value
+    mock_case.list_iocs.return_value = _api_response([])
+    mock_case.add_ioc.return_value = _api_response({"ioc_id": 8})
+    mock_case.list_assets.return_value = _api_response([])
+    mock_case.add_asset.return_value = _api_response({"asset_id": 4})
+
+    assert _add_ioc(1, "cfg-blob", "Beacon-Config") == "IOC added successfully. ID: 8"
+    assert mock_case.add_ioc.call_args.kwargs["ioc_type"] == 301
+    assert _add_asset(1, "PLC-7", "ot - plc") == "Asset added successfully. ID: 4"
+    assert mock_case.add_asset.call_args.kwargs["asset_type"] == 40
+
+    assert _add_ioc(1, "cfg-blob-2", 301) == "IOC added successfully. ID: 8"
+    assert "Unknown IOC type ID 999" in _add_ioc(1, "cfg-blob-3", "999")
+    assert "Unknown IOC type 'beacon-cfg'" in _add_ioc(1, "cfg-blob-4", "beacon-cfg")
+    assert mock_case.add_ioc.call_count == 2
+
+
+def test_add_ioc_rejects_invalid_values_locally(mock_env, mock_client_classes):
+    MockSession, MockCase, _, _ = mock_client_classes
+    MockSession.return_value.pi_get.side_effect = lambda *_a, **_kw: _api_response([])
+    mock_case = MockCase.return_value
+    mock_case.add_ioc.side_effect = lambda **_kw: _api_response({"ioc_id": 7})
+
+    assert _add_ioc(1, "not-a-hash", "sha256") == "Error adding IOC: invalid sha256 value (expected 64 hexadecimal characters)"
+    mock_case.add_ioc.assert_not_called()
+
+    result = _add_iocs_bulk(1, f"{'0' * 32},md5\nxyz,md5\n{'0' * 39},sha1")
+    assert "1 added, 0 skipped, 2 failed" in result
+    assert "2. xyz [md5] error: invalid md5 value" in result
+    assert "3. " + "0" * 39 + " [sha1] error: invalid sha1 value" in result
+    assert mock_case.add_ioc.call_count == 1
+
+
+def test_add_iocs_bulk_accepts_list_and_surfaces_errors(mock_env, mock_client_classes):
+    _, MockCase, _, _ = mock_client_classes
+    mock_case = MockCase.return_value
+    failing = MagicMock()
+    failing.is_error.return_value = True
+    failing.get_msg.return_value = "Invalid IOC"
+    mock_case.add_ioc.side_effect = [_api_response({"ioc_id": 1}), failing]
+
+    result = _add_iocs_bulk(5, ["a.example", {"value": "b.example", "ioc_type": "domain"}], ioc_type="domain", concurrency=1)
+    assert "1 added, 0 skipped, 1 failed" in result
+    assert "2. b.example [domain] error: Adding IOC to case 5 failed: Invalid IOC" in result
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2025-12-02T08:14:00Z", "2025-12-02T08:14:00+00:00"),
+        ("2025-12-02 08:14:00", "2025-12-02T08:14:00"),
+        (1764663240, "2025-12-02T08:14:00+00:00"),
+        ("1764663240000000", "2025-12-02T08:14:00+00:00"),
+        ("1764663240", "2025-12-02T08:14:00+00:00"),
+        ("20240115", "2024-01-15T00:00:00"),
+        ("20240115103000", "2024-01-15T10:30:00"),
+        ("20241315", None),
+        ("12345", None),
+        ("not a date", None),
+    ],
+)
+def test_parse_datetime(value, expected):
+    parsed = _parse_datetime(value)
+    assert (parsed.isoformat() if parsed else None) == expected
+
+
+def test_import_timeline_inline_csv(mock_env, mock_client_classes):
+    MockSession, MockCase, _, _ = mock_client_classes
+    MockSession.return_value.pi_get.return_value = _api_response([{"name": "Initial Access", "id": 4}])
+    mock_case = MockCase.return_value
+    mock_case.add_event.return_value = _api_response({"event_id": 1})
+
+    content = (
+        "datetime,message,category,tags\n"
+        "2025-12-02T08:14:00,Phishing delivered,initial access,mail\n"
+        "garbage,Broken row,,\n"
+        "2025-12-02T08:20:00,Beacon,Unknown,\n"
+    )
+    result = _import_timeline(7, content=content)
+
+    assert result.startswith("Timeline import for case 7: 3 rows read, 1 added, 2 invalid, 0 failed")
+    assert "row 2: missing or unparseable date/time" in result
+    assert "row 3: unknown event category 'Unknown'" in result
+    first_call = mock_case.add_event.call_args_list[0].kwargs
+    assert {k: first_call[k] for k in ("title", "category", "tags", "cid")} == {"title": "Phishing delivered", "category": 4, "tags": ["mail"], "cid": 7}
+
+
+def test_import_timeline_jsonl_file_dry_run(tmp_path, mock_env, mock_client_classes):
+    _, MockCase, _, _ = mock_client_classes
+    path = tmp_path / "timeline.jsonl"
+    path.write_text('{"timestamp": 1764663240, "title": "a"}\nnot json\n{"timestamp": 1764663300, "title": "b"}\n')
+
+    result = _import_timeline(7, path=str(path), dry_run=True, start_row=2)
+    assert "(dry run): 2 rows read, 1 validated, 1 invalid" in result
+    assert "row 2: invalid JSON" in result
+    MockCase.return_value.add_event.assert_not_called()
+
+
+def test_import_timeline_path_is_confined(tmp_path, monkeypatch, mock_env, mock_client_classes):
+    root = tmp_path / "imports"
+    root.mkdir()
+    (root / "t.jsonl").write_text('{"timestamp": 1764663240, "title": "a"}\n')
+    (tmp_path / "secret.jsonl").write_text('{"timestamp": 1764663240, "title": "s"}\n')
+
+    monkeypatch.setattr(sys, "argv", ["iris-mcp", "--http"])
+    assert "requires IRIS_IMPORT_ROOT" in _import_timeline(7, path=str(root / "t.jsonl"), dry_run=True)
+
+    monkeypatch.setenv("IRIS_IMPORT_ROOT", str(root))
+    assert "1 rows read, 1 validated" in _import_timeline(7, path="t.jsonl", dry_run=True)
+    assert "must be inside IRIS_IMPORT_ROOT" in _import_timeline(7, path="../secret.jsonl", dry_run=True)
+    assert "must be inside IRIS_IMPORT_ROOT" in _import_timeline(7, path=str(tmp_path / "secret.jsonl"), dry_run=True)
+
+
+def test_list_iocs_pages_from_snapshot(mock_env, mock_client_classes):
+    _, MockCase, _, _ = mock_client_classes
+    mock_case = MockCase.return_value
+    mock_case.list_iocs.return_value.is_error.return_value = False
+    mock_case.list_iocs.return_value.get_data.return_value = [{"ioc_id": i, "ioc_value": f"10.0.0.{i}"} for i in (5, 3, 1, 4, 2)]
+
+    first = _list_iocs(1, limit=2)
+    assert "10.0.0.1," in first
+    assert "10.0.0.2," in first
+    assert "10.0.0.3," not in first
+    assert "Showing 1-2 of 5." in first
+    cursor = first.rsplit("Next cursor: ", 1)[1].strip()
+
+    second = _list_iocs(1, limit=2, cursor=cursor)
+    assert "Showing 3-4 of 5." in second
+    third = _list_iocs(1, limit=2, offset=4)
+    assert "10.0.0.5," in third
+    assert "End of list." in third
+    mock_case.list_iocs.assert_called_once()
+
+    mock_case.add_ioc.return_value.is_error.return_value = False
+    mock_case.add_ioc.return_value.get_data.return_value = {"ioc_id": 6}
+    _add_ioc(1, "10.0.0.6", "ip-dst")
+    mock_case.list_iocs.return_value.get_data.return_value = [{"ioc_id": i, "ioc_value": f"10.0.0.{i}"} for i in range(1, 7)]
+    assert "of 6." in _list_iocs(1, limit=2, offset=2)
+    # Cursors keep pointing at the snapshot they were issued for.
+    assert "Showing 3-4 of 5." in _list_iocs(1, limit=2, cursor=cursor)
+
+
+def test_list_assets_expired_cursor_refetches(mock_env, mock_client_classes):
+    _, MockCase, _, _ = mock_client_classes
+    mock_case = MockCase.return_value
+    mock_case.list_assets.return_value.is_error.return_value = False
+    mock_case.list_assets.return_value.get_data.return_value = [{"asset_id": i, "asset_name": f"host-{i}"} for i in range(1, 4)]
+
+    cursor = _list_assets(1, limit=1).rsplit("Next cursor: ", 1)[1].strip()
+    iris_mcp._COLLECTIONS.clear()
+    page = _list_assets(1, limit=1, cursor=cursor)
+    assert "host-2" in page
+    assert mock_case.list_assets.call_count == 2  # first fetch, refetch
+    assert "Invalid cursor" in _list_assets(1, cursor="@@")
+    snapshot_id = iris_mcp._decode_cursor(cursor)[0]
+    assert "negative offset" in _list_assets(1, cursor=iris_mcp._encode_cursor(snapshot_id, -2))
+    assert "offset 3 is past the end of the listing (3 rows)" in _list_assets(1, cursor=iris_mcp._encode_cursor(snapshot_id, 3))
+
+
+def test_mirror_serves_collection_until_object_state_changes(tmp_path, mock_env, mock_client_classes):
+    MockSession, MockCase, _, _ = mock_client_classes
+    mock_case = MockCase.return_value
+    mock_case.list_iocs.return_value.is_error.return_value = False
+    mock_case.list_iocs.return_value.get_data.return_value = IOCS_PAYLOAD
+    state = MockSession.return_value.pi_get.return_value
+    state.is_error.return_value = False
+    state.get_data.return_value = IOCS_PAYLOAD["state"]
+
+    mirror = _CaseMirror(str(tmp_path))
+    with patch.object(iris_mcp, "_MIRROR", mirror):
+        assert "darkvault-support[.]com" in _list_iocs(1)
+        filtered = _list_iocs(1, filter_text="REGISTER")
+        assert "api/v1/register" in filtered
+        assert "darkvault-support[.]com," not in filtered
+        assert mock_case.list_iocs.call_count == 1
+
+        state.get_data.return_value = {"object_state": 8}
+        _list_iocs(1)
+        assert mock_case.list_iocs.call_count == 2  # initial sync, state changed
+
+        state.is_error.return_value = True
+        _list_iocs(1)
+        assert mirror.stats() == {"enabled": True, "cases": 1, "hits": 1, "misses": 2, "bypassed": 1}
+        mirror.close()
+    assert (tmp_path / "localhost" / "case-1.sqlite3").exists()
+
+
+def test_mirror_closes_least_recently_used_connections(tmp_path, mock_env, mock_client_classes):
+    MockSession, MockCase, _, _ = mock_client_classes
+    MockCase.return_value.list_iocs.return_value = _api_response(IOCS_PAYLOAD)
+    MockSession.return_value.pi_get.return_value = _api_response(IOCS_PAYLOAD["state"])
+
+    mirror = _CaseMirror(str(tmp_path), max_open=1)
+    with patch.object(iris_mcp, "_MIRROR", mirror):
+        _list_iocs(1)
+        first = next(iter(mirror._dbs.values()))[0]
+        _list_iocs(2)
+        assert mirror.stats()["cases"] == 1
+        with pytest.raises(sqlite3.ProgrammingError):
+            first.execute("SELECT 1")
+
+        assert "darkvault-support[.]com" in _list_iocs(1)  # reopened from disk, not refetched
+        assert mirror.stats()["hits"] == 1
+        mirror.close()
+
+
+def test_changes_since_reports_net_changes_from_hashed_snapshots(mock_env, mock_client_classes):
+    MockSession, MockCase, _, _ = mock_client_classes
+    state = {"object_state": 1, "object_last_update": "2025-12-03T16:45:15"}
+    rows = [{"ioc_id": i, "ioc_value": f"host{i}.example", "ioc_type": "domain"} for i in range(1, 6)]
+    MockSession.return_value.pi_get.side_effect = lambda uri, **_kw: _api_response(dict(state))
+    MockCase.return_value.list_iocs.side_effect = lambda **_kw: _api_response([dict(r) for r in rows])
+
+    start = _changes_since(1, kinds=["iocs"], output="json")
+    assert start["changes"] == {} and start["untracked"] == []
+    assert _changes_since(1, start["token"], kinds=["iocs"], output="json")["changes"] == {}
+    assert MockCase.return_value.list_iocs.call_count == 1  # object_state unchanged: no refetch
+
+    rows[0]["ioc_value"] = "renamed.example"
+    del rows[1]
+    rows.append({"ioc_id": 9, "ioc_value": "new.example", "ioc_type": "domain"})
+    state["object_state"] = 2
+    changed = _changes_since(1, start["token"], kinds=["iocs"], output="json")
+    iocs = changed["changes"]["iocs"]
+    assert [r["value"] for r in iocs["added"]] == ["new.example"]
+    assert [r["value"] for r in iocs["modified"]] == ["renamed.example"]
+    assert iocs["deleted"] == [2]
+
+    rows.pop()
+    state["object_state"] = 3
+    text = _changes_since(1, start["token"], kinds=["iocs"])
+    assert "IOCs: 0 added, 1 modified, 1 deleted" in text
+    assert "~ ID: 1, Value: renamed.example" in text
+    assert _changes_since(1, changed["token"], kinds=["iocs"], output="json")["changes"]["iocs"]["deleted"] == [9]
+
+    assert _changes_since(1, "2000-01-01T00:00:00", kinds=["iocs"], output="json")["untracked"] == ["iocs"]
+    assert _changes_since(1, "2030-01-01T00:00:00", kinds=["iocs"], output="json")["changes"] == {}
+    assert _changes_since(1, "yesterday-ish").startswith("Error getting changes:")
+    assert _changes_since(1, kinds=["notes"]).startswith("Error getting changes: unknown kind")
+
+
+def test_add_note_creates_default_directory_once(mock_env, mock_client_classes):
+    _, MockCase, _, _ = mock_client_classes
+    mock_case = MockCase.return_value
+    mock_case.list_notes_directories.return_value.is_error.return_value = False
+    mock_case.list_notes_directories.return_value.get_data.return_value = []
+
+    def slow_create(**_kwargs):
+        time.sleep(0.05)
+        resp = MagicMock()
+        resp.is_error.return_value = False
+        resp.get_data.return_value = {"id": 7}
+        return resp
+
+    mock_case.add_notes_directory.side_effect = slow_create
+    mock_case.add_note.return_value.is_error.return_value = False
+    mock_case.add_note.return_value.get_data.return_value = {"note_id": 5}
+
+    results: list[str] = []
+    threads = [threading.Thread(target=lambda: results.append(_add_note(1, "body"))) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert all("Directory: 7" in r for r in results)
+    mock_case.add_notes_directory.assert_called_once()
+    mock_case.list_notes_directories.assert_called_once()
+    assert len(iris_mcp._NOTE_DIRECTORIES._case_locks) == 0
+
+
+def test_add_note_rediscovers_deleted_directory(mock_env, mock_client_classes):
+    _, MockCase, _, _ = mock_client_classes
+    mock_case = MockCase.return_value
+    mock_case.list_notes_directories.return_value.is_error.return_value = False
+    mock_case.list_notes_directories.return_value.get_data.return_value = [{"id": 1}]
+    mock_case.add_note.return_value.is_error.return_value = False
+    mock_case.add_note.return_value.get_data.return_value = {"note_id": 5}
+    assert "Directory: 1" in _add_note(1, "body")
+
+    def add_note(**kwargs):
+        resp = MagicMock()
+        resp.is_error.return_value = kwargs["directory_id"] == 1
+        resp.get_msg.return_value = "Invalid directory ID"
+        resp.get_data.return_value = {"note_id": 6}
+        return resp
+
+    mock_case.add_note.side_effect = add_note
+    mock_case.list_notes_directories.return_value.get_data.return_value = [{"id": 2}]
+    assert "ID: 6, Directory: 2" in _add_note(1, "body")
+
+
+def test_add_note_retries_only_stale_cached_directory(mock_env, mock_client_classes):
+    _, MockCase, _, _ = mock_client_classes
+    mock_case = MockCase.return_value
+    mock_case.list_notes_directories.return_value = _api_response([{"id": 1}])
+    failed = MagicMock()
+    failed.is_error.return_value = True
+    failed.get_msg.return_value = "Invalid directory ID"
+    failed.as_json.return_value = None
+    mock_case.add_note.return_value = failed
+
+    # Freshly discovered directory: nothing to rediscover.
+    assert _add_note(1, "body").startswith("Error adding note: Adding note to case 1 failed: Invalid directory ID")
+    assert mock_case.add_note.call_count == 1
+
+    # Cached directory, but the failure is unrelated to it.
+    failed.get_msg.return_value = "Note content too long"
+    assert "Note content too long" in _add_note(1, "body")
+    assert mock_case.add_note.call_count == 2
+    assert mock_case.list_notes_directories.call_count == 1
+
+
+def test_create_note_directory_reports_api_error_without_retrying(mock_env, mock_client_classes):
+    _, MockCase, _, _ = mock_client_classes
+    mock_case = MockCase.return_value
+    failed = MagicMock()
+    failed.is_error.return_value = True
+    failed.get_msg.return_value = "Parent directory not found"
+    failed.as_json.return_value = None
+    mock_case.add_notes_directory.return_value = failed
+
+    result = _create_note_directory(5, "Forensics", 99)
+    assert result == "Error creating note directory: Creating note directory 'Forensics' for case 5 failed: Parent directory not found"
+    mock_case.add_notes_directory.assert_called_once_with(directory_name="Forensics", parent_directory_id=99, cid=5)
+
+
+def test_try_case_methods_memoizes_working_plan(caplog):
+    ok = MagicMock()
+    ok.is_error.return_value = False
+    ok.get_data.return_value = ["dir"]
+    calls: list[str] = []
+
+    class OldClient:
+        def list_note_directories(self, case_id):
+            calls.append("old")
+            return ok
+
+    candidates = ["list_notes_directories", "list_note_directories"]
+    payloads = [{"cid": 1}, {"case_id": 1}]
+    for _ in range(3):
+        assert _try_case_methods(OldClient(), candidates, "Listing", payloads) == (["dir"], "list_note_directories")
+    # First call probes {"cid": 1} (TypeError) then retries positionally; later calls go straight to the plan.
+    assert calls == ["old"] * 3
+    assert iris_mcp._METHOD_PLANS.stats()["hits"] == len(calls) - 1
+
+    class NewClient:
+        def list_notes_directories(self, cid):
+            calls.append("new")
+            return ok
+
+    assert _try_case_methods(NewClient(), candidates, "Listing", payloads)[1] == "list_notes_directories"
+    assert iris_mcp._METHOD_PLANS.stats()["plans"] == {"list_notes_directories|list_note_directories": "list_notes_directories(cid)"}
+
+    class RenamedKwarg:
+        def list_notes_directories(self, case):
+            return ok
+
+    with caplog.at_level("WARNING", logger="iris_mcp"):
+        _try_case_methods(RenamedKwarg(), candidates, "Listing", payloads)
+    assert "stopped working" in caplog.text
+    assert iris_mcp._METHOD_PLANS.stats()["broken"][0]["method"] == "list_notes_directories"
+
+
+def test_metrics_record_tools_and_iris_calls():
+    metrics = _Metrics()
+    metrics.tool_started("list_iocs")
+    metrics.tool_finished("list_iocs", 0.02, failed=False)
+    metrics.tool_started("add_ioc")
+    metrics.tool_finished("add_ioc", 0.2, failed=True)
+    metrics.iris_call("GET", "https://iris.local/case/ioc/42?cid=1", 0.01)
+    metrics.iris_call("POST", "https://iris.local/case/ioc/add?cid=1", 0.5, "500")
+
+    snap = metrics.snapshot()
+    assert snap["tools"]["add_ioc"]["errors"] == 1
+    assert snap["tools"]["list_iocs"]["in_flight"] == 0
+    assert set(snap["iris_calls"]) == {"GET /case/ioc/{id}", "POST /case/ioc/add"}
+    assert snap["iris_calls"]["POST /case/ioc/add"]["errors"] == {"500": 1}
+
+    text = metrics.render({"customers": {"hits": 3, "misses": 1}, "sessions": {"sessions": 1}})
+    assert 'iris_mcp_tool_duration_seconds_bucket{tool="list_iocs",le="0.025"} 1' in text
+    assert 'iris_mcp_tool_duration_seconds_count{tool="add_ioc"} 1' in text
+    assert 'iris_mcp_iris_request_errors_total{method="POST",endpoint="/case/ioc/add",reason="500"} 1' in text
+    assert 'iris_mcp_cache_hit_ratio{cache="customers"} 0.75' in text
+    assert "sessions" not in text
+
+
+def test_iris_tool_wrapper_updates_metrics(mock_env, mock_client_classes):
+    _, MockCase, _, _ = mock_client_classes
+    MockCase.return_value.list_iocs.return_value.is_error.return_value = True
+    MockCase.return_value.list_iocs.return_value.get_msg.return_value = "boom"
+    iris_mcp._METRICS.reset()
+
+    assert asyncio.run(iris_mcp.list_iocs(1)).startswith("Error")
+    stats = iris_mcp.server_stats()
+    assert stats["tools"]["list_iocs"]["errors"] == 1
+    assert "customers" in stats["caches"]
+
+
+def test_cold_start_lists_tools_without_loading_the_client():
+    result = iris_mcp._measure_startup()
+    assert result["tools"] > 0
+    assert result["loaded"] == []
+    assert "fastmcp" in result["imports_ms"]
+    # Generous by default, since wall-clock time depends on the machine; IRIS_STARTUP_BUDGET tightens or relaxes it.
+    budget = float(os.environ.get("IRIS_STARTUP_BUDGET") or 10)
+    assert result["first_listing_s"] < budget, iris_mcp._startup_report(result)
+
+
+def test_prewarm_fills_caches_and_reports_readiness(mock_env, mock_client_classes):
+    MockSession, _, MockCustomer, _ = mock_client_classes
+    MockSession.return_value.pi_get.side_effect = lambda uri, **_kw: _api_response([{"name": uri, "id": 1}])
+    MockCustomer.return_value.list_customers.return_value = _api_response([{"customer_id": 1, "customer_name": "ACME"}])
+    prewarm = iris_mcp._Prewarmer()
+    assert prewarm.status()["state"] == "disabled"
+
+    prewarm.start()
+    assert prewarm.wait(5)
+    status = prewarm.status()
+    assert status["state"] == "ready", status
+    assert set(status["steps"]) == {"catalogs", "connection", "customers", *iris_mcp._CATALOG_REFERENCES, "event_categories"}
+    assert "analysis_statuses" in status["steps"]
+
+    fetched = MockSession.return_value.pi_get.call_count
+    assert iris_mcp._reference_ids(iris_mcp.get_iris_client(), "manage/tlp/list", "name", "id") == {"manage/tlp/list": 1}
+    assert MockSession.return_value.pi_get.call_count == fetched
+    assert iris_mcp._CUSTOMER_DIRECTORY.cached_names() == {1: "ACME"}
+    assert iris_mcp.server_status()["ready"] is True
+
+    failing = iris_mcp._Prewarmer()
+    with patch.dict(os.environ, {"IRIS_API_KEY": ""}):
+        failing.start()
+        assert failing.wait(5)
+    assert failing.status()["state"] == "degraded"
+    assert failing.status()["steps"]["connection"]["status"] == "error"
+
+
+def test_change_tracker_serializes_syncs_of_a_collection():
+    tracker = iris_mcp._ChangeTracker()
+    tracker.sync(None, 1, "iocs", lambda: [{"ioc_id": 1, "ioc_value": "v1"}])
+    slow_started = threading.Event()
+
+    def slow_fetch():
+        slow_started.set()
+        time.sleep(0.2)
+        return [{"ioc_id": 1, "ioc_value": "v2"}]
+
+    older = threading.Thread(target=tracker.sync, args=(None, 1, "iocs", slow_fetch))
+    older.start()
+    assert slow_started.wait(5)
+    tracker.sync(None, 1, "iocs", lambda: [{"ioc_id": 1, "ioc_value": "v3"}])
+    older.join()
+    # The newer fetch is applied last, so the net change is v3 and a repeat sync finds nothing new.
+    assert tracker.changes(1, "iocs", 1) == {"added": [], "modified": [{"ioc_id": 1, "ioc_value": "v3"}], "deleted": []}
+    tracker.sync(None, 1, "iocs", lambda: [{"ioc_id": 1, "ioc_value": "v3"}])
+    assert tracker.stats()["log_entries"] == 2
+    assert len(tracker._syncing) == 0
+
+
+def test_iris_guard_counts_unexpected_errors_as_failures():
+    guard = iris_mcp._IrisGuard(iris_mcp._AimdLimiter(max_limit=8), iris_mcp._CircuitBreaker(threshold=2, cooldown=60), read_retries=2)
+    broken = MagicMock(side_effect=ValueError("bad chunk"))
+    for _ in range(2):
+        with pytest.raises(ValueError, match="bad chunk"):
+            guard.send("GET", broken)
+    assert broken.call_count == 2  # not retried
+    assert guard.breaker.state == "open"
+    assert guard.stats()["breaker"]["last_error"] == "ValueError"
+
+
+def test_iris_guard_closes_discarded_responses_and_guards_unpooled_requests():
+    guard = iris_mcp._IrisGuard(iris_mcp._AimdLimiter(max_limit=8), iris_mcp._CircuitBreaker(threshold=5, cooldown=60), read_retries=2, backoff=0.001)
+    busy, ok = MagicMock(status_code=503), MagicMock(status_code=200)
+    assert guard.send("GET", MagicMock(side_effect=[busy, ok])) is ok
+    busy.close.assert_called_once()
+    ok.close.assert_not_called()
+
+    with StubIris(rows=3) as stub:
+        transport = iris_mcp._PooledTransport(0, guard=guard)
+        stub.error_rate = 1.0
+        assert transport.get(f"{stub.url}/manage/cases/list").status_code == stub.error_status
+        assert guard.retries == 3
+        assert guard.stats()["breaker"]["consecutive_failures"] == 3
+        transport.reset()
+
+
+def test_iris_guard_retries_reads_and_opens_breaker():
+    with StubIris(rows=3) as stub:
+        guard = iris_mcp._IrisGuard(iris_mcp._AimdLimiter(max_limit=8), iris_mcp._CircuitBreaker(threshold=3, cooldown=0.2), read_retries=2, backoff=0.001)
+        transport = iris_mcp._PooledTransport(2, guard=guard)
+        url = f"{stub.url}/manage/cases/list"
+
+        # One transient 503, then the retried GET succeeds.
+        def recover_after_first(*args, **kwargs):
+            resp = request(*args, **kwargs)
+            stub.error_rate = 0.0
+            return resp
+
+        request, stub.error_rate = transport._request, 1.0
+        with patch.object(transport, "_request", side_effect=recover_after_first):
+            assert transport.get(url).ok
+        assert guard.retries == 1
+        assert guard.limiter.decreases == 1
+        assert guard.breaker.state == "closed"
+
+        # Writes are sent once; the third consecutive failure opens the breaker.
+        stub.error_rate = 1.0
+        sent = stub.requests
+        assert transport.post(f"{stub.url}/case/ioc/add", json={}).status_code == stub.error_status
+        assert stub.requests == sent + 1
+        with pytest.raises(iris_mcp.IrisUnavailableError, match="3 consecutive failures"):
+            transport.get(url)  # the breaker opens between the GET's retries
+        assert guard.breaker.state == "open"
+        with pytest.raises(iris_mcp.IrisUnavailableError):
+            transport.get(url)
+        assert stub.requests == sent + 3
+
+        # After the cooldown one trial request closes it again.
+        stub.error_rate = 0.0
+        time.sleep(0.25)
+        assert guard.breaker.state == "half-open"
+        assert transport.get(url).ok
+        assert guard.breaker.state == "closed"
+        assert guard.stats()["breaker"]["opened"] == 1
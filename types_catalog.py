@@ -6,6 +6,12 @@ optionally reused elsewhere without pulling network data from DFIR Iris.
 
 from __future__ import annotations
 
+import difflib
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
 # Validation hints mapped by IOC type id
 IOC_VALIDATIONS: dict[str, dict[str, str]] = {
     "authentihash": {"validation_regex": r"[a-f0-9]{64}", "validation_expectation": "64 hexadecimal characters"},
@@ -515,12 +521,61 @@ CATALOG: dict[str, list[dict[str, str]]] = {
     "tlp_levels": TLP_LEVELS,
 }
 
+_NAME_KEYS = {"iocs": "type", "assets": "asset_name"}
+_SEPARATORS = re.compile(r"[\s_\-]+")
+
+
+def normalize_name(name: str) -> str:
+    """Lookup key for a catalog name: case-folded, with spaces, ``-`` and ``_`` removed."""
+    return _SEPARATORS.sub("", name).casefold()
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogIndex:
+    """Read-only lookup table for one catalog, built once at import.
+
+    ``by_name`` maps the normalized name to its entry. IDs are server-assigned, so they are
+    checked against the server's reference tables rather than the catalog order.
+    """
+
+    kind: str
+    name_key: str
+    by_name: Mapping[str, Mapping[str, str]]
+
+    def lookup(self, name: str) -> Mapping[str, str] | None:
+        return self.by_name.get(normalize_name(name))
+
+    def suggest(self, name: str, limit: int = 3) -> list[str]:
+        """Closest catalog names to ``name`` (best first)."""
+        matches = difflib.get_close_matches(normalize_name(name), self.by_name.keys(), n=limit, cutoff=0.5)
+        return [self.by_name[key][self.name_key] for key in matches]
+
+    def resolve(self, name: str, label: str) -> str:
+        """Return the canonical spelling of ``name``; raise ValueError with suggestions when unknown."""
+        entry = self.lookup(name)
+        if entry is not None:
+            return entry[self.name_key]
+        hint = f" Did you mean: {', '.join(suggestions)}?" if (suggestions := self.suggest(name)) else ""
+        raise ValueError(f"Unknown {label} '{name}'.{hint} (See list_types('{self.kind}'); pass the numeric ID for server-specific entries.)")
+
+
+def _build_catalog_index(kind: str, entries: list[dict[str, str]]) -> CatalogIndex:
+    name_key = _NAME_KEYS.get(kind, "name")
+    by_name: dict[str, Mapping[str, str]] = {}
+    for entry in entries:
+        by_name.setdefault(normalize_name(entry[name_key]), MappingProxyType(dict(entry)))
+    return CatalogIndex(kind, name_key, MappingProxyType(by_name))
+
+
+CATALOG_INDEX: Mapping[str, CatalogIndex] = MappingProxyType({kind: _build_catalog_index(kind, entries) for kind, entries in CATALOG.items()})
+
 __all__ = [
     "ALERT_RESOLUTION_STATUSES",
     "ALERT_STATUSES",
     "ANALYSIS_STATUSES",
     "ASSET_TYPES",
     "CATALOG",
+    "CATALOG_INDEX",
     "EVENT_CATEGORIES",
     "EVIDENCE_TYPES",
     "IOC_TYPES",
@@ -528,4 +583,6 @@ __all__ = [
     "SEVERITIES",
     "TASK_STATUSES",
     "TLP_LEVELS",
+    "CatalogIndex",
+    "normalize_name",
 ]